@@ -0,0 +1,321 @@
+# =============================================================================
+# ASGI Giriş Modülü (asgi.py)
+# =============================================================================
+# Bu modül, uygulamayı bir ASGI sunucusunda (ör. `uvicorn app.asgi:application`)
+# çalıştırmak için saf asyncio tabanlı `BeatifyAsgiApp` sınıfını içerir.
+#
+# Widget verisi ve SSE akışı (`spotify_widget_async_routes`) event loop
+# üzerinde karşılanır. Diğer tüm istekler (sayfalar, giriş, Widget Manager,
+# widget render sayfası) mevcut Flask uygulamasına devredilir; Flask ayrı
+# bir thread havuzunda WSGI olarak çalışır. Ek bir bağımlılık gerekmez.
+#
+# WSGI sunucusuyla (`gunicorn app.main:app`) çalıştırma aynen desteklenir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _END
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. BeatifyAsgiApp
+#           3.1.1. __init__(wsgi_app, routes, wsgi_workers)
+#           3.1.2. __call__(scope, receive, send)
+#           3.1.3. _dispatch_async(scope)
+#           3.1.4. _send_response(response, receive, send)
+#           3.1.5. _send_stream(status, headers, chunks, receive, send)
+#           3.1.6. _call_wsgi(scope, receive, send)
+#           3.1.7. _lifespan(receive, send)
+#
+# 4.0  FONKSİYONLAR (FUNCTIONS)
+#      4.1. _read_body(receive)
+#      4.2. _build_environ(scope, body)
+#      4.3. _encode_headers(headers)
+#      4.4. create_asgi_app(flask_app=None)
+#
+# 5.0  ASGI GİRİŞİ (ASGI ENTRYPOINT)
+#      5.1. application
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import asyncio
+import io
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl
+
+# Üçüncü parti
+from flask import Flask
+
+# Uygulama içi
+from app.config.config import ASGI_CONFIG
+from app.routes.spotify_routes.spotify_widget_async_routes import (
+    ASYNC_WIDGET_ROUTES,
+    AsyncResponse,
+    shutdown_async_widget_routes,
+)
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# WSGI yanıt gövdesinin bittiğini gösteren işaret
+_END: object = object()
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class BeatifyAsgiApp:
+    """Async widget rotalarını karşılayan, geri kalanını Flask'a devreden ASGI uygulaması."""
+
+    def __init__(
+        self,
+        wsgi_app: Flask,
+        routes: List[Tuple[Pattern[str], Callable[..., Awaitable[Optional[AsyncResponse]]]]],
+        wsgi_workers: int = 32,
+    ) -> None:
+        """
+        Args:
+            wsgi_app: İsteklerin devredileceği Flask uygulaması.
+            routes: (yol deseni, async rota) listesi; yalnızca GET istekleri eşlenir.
+            wsgi_workers: Flask'ı çalıştıran thread sayısı.
+        """
+        self.wsgi_app: Flask = wsgi_app
+        self.routes = routes
+        self._wsgi_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max(1, int(wsgi_workers)),
+            thread_name_prefix="asgi-wsgi",
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI giriş noktası."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            # WebSocket desteklenmiyor
+            await send({"type": "websocket.close", "code": 1000})
+            return
+
+        response = await self._dispatch_async(scope)
+        if response is not None:
+            await self._send_response(response, receive, send)
+            return
+        await self._call_wsgi(scope, receive, send)
+
+    async def _dispatch_async(self, scope: Scope) -> Optional[AsyncResponse]:
+        """İstek bir async rotaya eşleşirse yanıtını döndürür; aksi halde None."""
+        if scope["method"] != "GET":
+            return None
+        path = scope["path"]
+        root_path = scope.get("root_path") or ""
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+
+        for pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            query = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+            headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+            return await handler(**match.groupdict(), query=query, headers=headers)
+        return None
+
+    async def _send_response(self, response: AsyncResponse, receive: Receive, send: Send) -> None:
+        """Async rotanın yanıtını gönderir."""
+        status, headers, body = response
+        if not isinstance(body, bytes):
+            await self._send_stream(status, headers, body, receive, send)
+            return
+        headers = dict(headers)
+        if status != 304:
+            headers["Content-Length"] = str(len(body))
+        await send({"type": "http.response.start", "status": status, "headers": _encode_headers(headers.items())})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_stream(
+        self,
+        status: int,
+        headers: Dict[str, str],
+        chunks: AsyncIterator[str],
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """SSE parçalarını istemci bağlantıyı kapatana veya akış bitene kadar gönderir."""
+
+        async def wait_disconnect() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+
+        disconnected = asyncio.ensure_future(wait_disconnect())
+        try:
+            await send({"type": "http.response.start", "status": status, "headers": _encode_headers(headers.items())})
+            async for chunk in chunks:
+                if disconnected.done():
+                    return
+                await send({"type": "http.response.body", "body": chunk.encode("utf-8"), "more_body": True})
+            if not disconnected.done():
+                await send({"type": "http.response.body", "body": b""})
+        except OSError:
+            # İstemci bağlantısı koptu
+            return
+        finally:
+            disconnected.cancel()
+            await chunks.aclose()
+
+    async def _call_wsgi(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """İsteği Flask'a (WSGI) devreder; Flask ve gövde üretimi thread havuzunda çalışır."""
+        body = await _read_body(receive)
+        if body is None:
+            return
+        environ = _build_environ(scope, body)
+        loop = asyncio.get_running_loop()
+
+        started: Dict[str, Any] = {}
+        written: List[bytes] = []
+
+        def start_response(status: str, headers: List[Tuple[str, str]], exc_info: Any = None) -> Callable[[bytes], None]:
+            if exc_info and started.get("sent"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = headers
+            return written.append
+
+        result: Iterable[bytes] = await loop.run_in_executor(self._wsgi_executor, self.wsgi_app, environ, start_response)
+        try:
+            iterator = iter(result)
+            while True:
+                chunk = await loop.run_in_executor(self._wsgi_executor, next, iterator, _END)
+                if not started.get("sent"):
+                    await send({
+                        "type": "http.response.start",
+                        "status": started["status"],
+                        "headers": _encode_headers(started["headers"]),
+                    })
+                    started["sent"] = True
+                pending = b"".join(written)
+                written.clear()
+                if chunk is _END:
+                    await send({"type": "http.response.body", "body": pending})
+                    return
+                if pending or chunk:
+                    await send({"type": "http.response.body", "body": pending + chunk, "more_body": True})
+        finally:
+            close = getattr(result, "close", None)
+            if close is not None:
+                await loop.run_in_executor(self._wsgi_executor, close)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Sunucu açılış / kapanış olaylarını karşılar; kapanışta thread havuzlarını kapatır."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._wsgi_executor.shutdown(wait=False)
+                shutdown_async_widget_routes()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+# =============================================================================
+# 4.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+async def _read_body(receive: Receive) -> Optional[bytes]:
+    """İstek gövdesini okur; istemci bağlantıyı kapatırsa None döner."""
+    parts: List[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        parts.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(parts)
+
+
+def _build_environ(scope: Scope, body: bytes) -> Dict[str, Any]:
+    """ASGI `scope` bilgisinden PEP 3333 WSGI environ sözlüğü üretir."""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    root_path = scope.get("root_path") or ""
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+
+    environ: Dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1] or 80),
+        "REMOTE_ADDR": str(client[0]),
+        "REMOTE_PORT": str(client[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope["headers"]:
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name == "CONTENT_LENGTH":
+            continue
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+            continue
+        key = f"HTTP_{name}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def _encode_headers(headers: Iterable[Tuple[str, str]]) -> List[Tuple[bytes, bytes]]:
+    """Başlıkları ASGI'nin beklediği bayt çiftlerine çevirir."""
+    return [(name.lower().encode("latin-1"), str(value).encode("latin-1")) for name, value in headers]
+
+
+def create_asgi_app(flask_app: Optional[Flask] = None) -> BeatifyAsgiApp:
+    """ASGI uygulamasını oluşturur; Flask uygulaması verilmezse `app.main.app` kullanılır."""
+    if flask_app is None:
+        from app.main import app as flask_app
+    return BeatifyAsgiApp(
+        flask_app,
+        routes=ASYNC_WIDGET_ROUTES,
+        wsgi_workers=int(ASGI_CONFIG["wsgi_workers"]),
+    )
+
+
+# =============================================================================
+# 5.0 ASGI GİRİŞİ (ASGI ENTRYPOINT)
+# =============================================================================
+
+# ASGI için hazır `application` nesnesi (Uvicorn: `uvicorn app.asgi:application`)
+application: BeatifyAsgiApp = create_asgi_app()
+
+
+# =============================================================================
+# ASGI Giriş Modülü Sonu
+# =============================================================================
@@ -24,9 +24,11 @@ from app.config.config import (
     COOKIE_SAMESITE,
     COOKIE_SECURE,
     DB_CONFIG,
+    DB_POOL_CONFIG,
     DEBUG,
     SECRET_KEY,
     SSL_CONFIG,
+    WIDGET_CACHE_CONFIG,
 )
 from app.config.spotify_config import SPOTIFY_CONFIG
 
@@ -44,5 +46,7 @@ __all__ = [
     "COOKIE_SAMESITE",
     "COOKIE_MAX_AGE",
     "DB_CONFIG",
+    "DB_POOL_CONFIG",
     "SSL_CONFIG",
+    "WIDGET_CACHE_CONFIG",
 ]
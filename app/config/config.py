@@ -13,6 +13,9 @@
 #      1.2.1. _get_env(name, allow_empty=False)
 #      1.2.2. _get_env_int(name)
 #      1.2.3. _get_env_bool(name)
+#      1.2.4. _get_env_optional_int(name, default)
+#      1.2.5. _get_env_optional_float(name, default)
+#      1.2.6. _get_env_optional_bool(name, default)
 #
 # 2.0  GENEL AYARLAR (GENERAL CONFIGURATION)
 #      2.1. DEBUG
@@ -29,6 +32,27 @@
 #
 # 5.0  SSL AYARLARI (SSL CONFIGURATION)
 #      5.1. SSL_CONFIG
+#
+# 6.0  VERİTABANI HAVUZ AYARLARI (DATABASE POOL CONFIGURATION)
+#      6.1. DB_POOL_CONFIG
+#
+# 7.0  ÖNBELLEK AYARLARI (CACHE CONFIGURATION)
+#      7.1. WIDGET_CACHE_CONFIG
+#
+# 8.0  BULKHEAD AYARLARI (BULKHEAD CONFIGURATION)
+#      8.1. BULKHEAD_CONFIG
+#
+# 9.0  ASGI AYARLARI (ASGI CONFIGURATION)
+#      9.1. ASGI_CONFIG
+#
+# 10.0 PAYLAŞILAN ÖNBELLEK AYARLARI (SHARED CACHE CONFIGURATION)
+#      10.1. CACHE_CONFIG
+#
+# 11.0 MIGRATION AYARLARI (MIGRATION CONFIGURATION)
+#      11.1. MIGRATIONS_CONFIG
+#
+# 12.0 PREPARED STATEMENT AYARLARI (PREPARED STATEMENT CONFIGURATION)
+#      12.1. PREPARED_STATEMENTS_CONFIG
 # =============================================================================
 
 # =============================================================================
@@ -97,6 +121,29 @@ def _get_env_bool(name: str) -> bool:
         return False
     raise RuntimeError(f"Geçersiz bool ortam değişkeni: {name}={raw!r} (true/false bekleniyor)")
 
+
+# Opsiyonel ayarlar: env'de yoksa veya boşsa varsayılan değer kullanılır.
+def _get_env_optional_int(name: str, default: int) -> int:
+    if not os.environ.get(name):
+        return default
+    return _get_env_int(name)
+
+
+def _get_env_optional_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError as e:
+        raise RuntimeError(f"Geçersiz float ortam değişkeni: {name}={raw!r}") from e
+
+
+def _get_env_optional_bool(name: str, default: bool) -> bool:
+    if not os.environ.get(name):
+        return default
+    return _get_env_bool(name)
+
 # =============================================================================
 # 2.0 GENEL AYARLAR (GENERAL CONFIGURATION)
 # =============================================================================
@@ -130,3 +177,113 @@ class SSL_CONFIG:
     CERTFILE: Optional[str] = os.environ.get("SSL_CERTFILE") or None
     KEYFILE: Optional[str] = os.environ.get("SSL_KEYFILE") or None
 
+# =============================================================================
+# 6.0 VERİTABANI HAVUZ AYARLARI (DATABASE POOL CONFIGURATION)
+# =============================================================================
+# Repository'ler her sorguda yeni bağlantı açmak yerine süreç genelindeki
+# havuzdan bağlantı ödünç alır. Tüm değerler opsiyoneldir.
+DB_POOL_CONFIG: dict[str, object] = {
+    "enabled": _get_env_optional_bool("DB_POOL_ENABLED", True),
+    # Havuzda boşta tutulacak kalıcı bağlantı sayısı
+    "size": _get_env_optional_int("DB_POOL_SIZE", 5),
+    # Havuz doluyken `size` üzerine açılabilecek geçici bağlantı sayısı
+    "max_overflow": _get_env_optional_int("DB_POOL_MAX_OVERFLOW", 10),
+    # Boş bağlantı beklenirken en fazla kaç saniye beklenecek
+    "timeout": _get_env_optional_float("DB_POOL_TIMEOUT", 5.0),
+    # Bir bağlantının en fazla kaç saniye yeniden kullanılacağı (MySQL wait_timeout'tan küçük olmalı)
+    "max_lifetime": _get_env_optional_int("DB_POOL_MAX_LIFETIME", 1800),
+}
+
+# =============================================================================
+# 7.0 ÖNBELLEK AYARLARI (CACHE CONFIGURATION)
+# =============================================================================
+# Widget token -> (kullanıcı, config, tip) önbelleği. Widget'lar birkaç saniyede
+# bir veri çektiği için, kararlı durumda token doğrulaması DB'ye gitmez.
+WIDGET_CACHE_CONFIG: dict[str, object] = {
+    "max_entries": _get_env_optional_int("WIDGET_CACHE_MAX_ENTRIES", 1024),
+    # Yazma işlemleri önbelleği zaten geçersiz kılar; TTL, başka süreçlerde
+    # yapılan değişikliklerin en geç ne kadar sürede görüleceğini belirler.
+    "ttl": _get_env_optional_float("WIDGET_CACHE_TTL", 60.0),
+}
+
+# =============================================================================
+# 8.0 BULKHEAD AYARLARI (BULKHEAD CONFIGURATION)
+# =============================================================================
+# Widget uç noktaları (sık poll / uzun süre açık SSE) için eşzamanlılık sınırları.
+# Böylece Spotify yavaşladığında worker thread'lerin tamamı widget isteklerine
+# gitmez; giriş, profil ve Widget Manager sayfaları yanıt vermeye devam eder.
+# Sınır doluysa widget istekleri kuyrukta beklemek yerine hızla 503 (veya
+# eldeki eski snapshot) ile yanıtlanır.
+BULKHEAD_CONFIG: dict[str, object] = {
+    "enabled": _get_env_optional_bool("BULKHEAD_ENABLED", True),
+    # widget-data / widget-data-batch / widget-config eşzamanlı istek sınırı
+    "widget_data_max_concurrent": _get_env_optional_int("BULKHEAD_WIDGET_DATA_MAX_CONCURRENT", 16),
+    # Açık SSE akışı sınırı (her akış bir worker thread'i tutar)
+    "widget_stream_max_concurrent": _get_env_optional_int("BULKHEAD_WIDGET_STREAM_MAX_CONCURRENT", 32),
+    # Sınır doluysa boş yer için en fazla kaç saniye beklenecek
+    "max_wait": _get_env_optional_float("BULKHEAD_MAX_WAIT", 0.05),
+}
+
+# =============================================================================
+# 9.0 ASGI AYARLARI (ASGI CONFIGURATION)
+# =============================================================================
+# `app.asgi:application` ile çalışırken kullanılır. Widget verisi ve SSE akışı
+# event loop üzerinde karşılanır; yalnızca engelleyen işler (önbellekte olmayan
+# token için DB, ilk Spotify sorgusu) ve diğer Flask rotaları thread havuzlarında
+# çalışır.
+ASGI_CONFIG: dict[str, object] = {
+    # Widget rotalarının engelleyen işleri (DB / ilk Spotify sorgusu) için thread sayısı
+    "widget_workers": _get_env_optional_int("ASGI_WIDGET_WORKERS", 16),
+    # Flask (WSGI) rotalarını çalıştıran thread sayısı
+    "wsgi_workers": _get_env_optional_int("ASGI_WSGI_WORKERS", 32),
+}
+
+# =============================================================================
+# 10.0 PAYLAŞILAN ÖNBELLEK AYARLARI (SHARED CACHE CONFIGURATION)
+# =============================================================================
+# Birden fazla worker (gunicorn) çalışırken playback snapshot'ları, Spotify
+# access token'ları ve widget config'leri worker'lar arasında paylaşılır.
+# - "memory": süreç içi (varsayılan; tek süreç ve testler için, paylaşım yok)
+# - "redis" : Redis protokolü konuşan bir sunucu (CACHE_REDIS_URL)
+CACHE_CONFIG: dict[str, object] = {
+    "backend": (os.environ.get("CACHE_BACKEND") or "memory").strip().lower(),
+    "redis_url": os.environ.get("CACHE_REDIS_URL") or "redis://127.0.0.1:6379/0",
+    # Aynı Redis'i kullanan diğer uygulamalarla çakışmasın diye anahtar ön eki
+    "key_prefix": os.environ.get("CACHE_KEY_PREFIX") or "beatify:",
+    # Redis okuma/yazma zaman aşımı (saniye); önbellek isteği yavaşlatmamalı
+    "socket_timeout": _get_env_optional_float("CACHE_SOCKET_TIMEOUT", 0.25),
+    # Redis'e ulaşılamazsa bu süre boyunca denenmez (saniye)
+    "retry_after": _get_env_optional_float("CACHE_RETRY_AFTER", 5.0),
+    # "memory" arka ucunun en fazla kayıt sayısı
+    "memory_max_entries": _get_env_optional_int("CACHE_MEMORY_MAX_ENTRIES", 4096),
+}
+
+# =============================================================================
+# 11.0 MIGRATION AYARLARI (MIGRATION CONFIGURATION)
+# =============================================================================
+# Şema, `app/database/migrations/versions` altındaki sürümlü migration'larla
+# yönetilir (`flask --app app.main db-upgrade`). Açılışta yalnızca
+# `schema_migrations` tablosundaki sürüm okunur; şema güncelse DDL çalışmaz.
+MIGRATIONS_CONFIG: dict[str, object] = {
+    # Açılışta şema sürümü kontrol edilsin mi
+    "check_on_boot": _get_env_optional_bool("DB_MIGRATIONS_CHECK_ON_BOOT", True),
+    # Şema gerideyse açılışta baştaki `BOOT_SAFE` migration'lar (tablo / kolon
+    # ekleyenler) uygulansın mı; diğerleri her zaman `db-upgrade` ile çalışır.
+    # Şema kodun gerektirdiği sürümün altında kalırsa uygulama açılmaz.
+    "auto_upgrade": _get_env_optional_bool("DB_MIGRATIONS_AUTO_UPGRADE", True),
+    # Aynı anda açılan worker'lar arasında migration kilidi için bekleme süresi (saniye)
+    "lock_timeout": _get_env_optional_int("DB_MIGRATIONS_LOCK_TIMEOUT", 60),
+}
+
+# =============================================================================
+# 12.0 PREPARED STATEMENT AYARLARI (PREPARED STATEMENT CONFIGURATION)
+# =============================================================================
+# Sık sorgular (widget token, auth token doğrulama, Spotify hesap verisi)
+# sunucu tarafı prepared statement olarak bağlantı başına bir kez hazırlanır.
+# Kapatılırsa aynı sorgular metin protokolüyle çalışır.
+PREPARED_STATEMENTS_CONFIG: dict[str, object] = {
+    "enabled": _get_env_optional_bool("DB_PREPARED_STATEMENTS", True),
+    # Bağlantı başına tutulacak en fazla statement sayısı (LRU). Toplam, MySQL
+    # `max_prepared_stmt_count` değerinin (varsayılan 16382) altında kalmalı.
+    "max_per_connection": _get_env_optional_int("DB_PREPARED_STATEMENTS_MAX_PER_CONNECTION", 32),
+}
@@ -10,6 +10,15 @@
 #      2.1. SpotifyConfig
 #           2.1.1. API endpoint sabitleri
 #           2.1.2. OAuth ayarları
+#           2.1.3. Erişim token deposu ayarları
+#           2.1.4. Playback snapshot ve widget süre bütçesi ayarları
+#           2.1.5. HTTP istemci (bağlantı havuzu) ayarları
+#           2.1.6. Arka plan playback poller ayarları
+#           2.1.7. Rate limit ayarları
+#           2.1.8. Widget SSE akışı ayarları
+#           2.1.9. Widget polling ipucu (next_poll_ms) ayarları
+#           2.1.10. Toplu widget-data ayarları
+#           2.1.11. Circuit breaker ve eski veri (stale) ayarları
 #
 # 3.0  YAPILANDIRMA NESNESİ (CONFIGURATION INSTANCE)
 #      3.1. SPOTIFY_CONFIG
@@ -35,14 +44,14 @@ except Exception:
 # 2.0 YAPILANDIRMA SINIFI (CONFIGURATION CLASS)
 # =============================================================================
 class SpotifyConfig:
-    # 2.1. API ENDPOINT'LERİ (API Endpoints)
+    # 2.1.1. API ENDPOINT'LERİ (API Endpoints)
     # -----------------------------------------------------------------------------
     AUTH_URL: str = "https://accounts.spotify.com/authorize"
     TOKEN_URL: str = "https://accounts.spotify.com/api/token"
     API_BASE_URL: str = "https://api.spotify.com/v1"
     PROFILE_URL: str = f"{API_BASE_URL}/me"
 
-    # 2.2. OAUTH AYARLARI (OAuth Settings)
+    # 2.1.2. OAUTH AYARLARI (OAuth Settings)
     # -----------------------------------------------------------------------------
     CLIENT_ID: str | None = os.environ.get("SPOTIFY_CLIENT_ID") or None
     CLIENT_SECRET: str | None = os.environ.get("SPOTIFY_CLIENT_SECRET") or None
@@ -71,6 +80,138 @@ class SpotifyConfig:
         "playlist-modify-public",
     ])
 
+    # 2.1.3. ERİŞİM TOKEN DEPOSU (Access Token Store)
+    # -----------------------------------------------------------------------------
+    # Access token'lar kullanıcı bazında sunucu tarafında tutulur; böylece oturumu
+    # olmayan çağıranlar (OBS widget'ı, arka plan thread'leri) da geçerli token alır.
+    # Token, süresinin dolmasına bu kadar saniye kala yenilenir.
+    TOKEN_REFRESH_MARGIN_SECONDS: int = int(os.environ.get("SPOTIFY_TOKEN_REFRESH_MARGIN_SECONDS") or 300)
+    # True ise token'lar `spotify_accounts` tablosuna da yazılır (süreç yeniden
+    # başladığında veya farklı worker'larda tekrar yenileme yapılmaz).
+    TOKEN_STORE_PERSIST: bool = (os.environ.get("SPOTIFY_TOKEN_STORE_PERSIST") or "false").strip().lower() in {
+        "1", "true", "yes", "y", "on",
+    }
+
+    # 2.1.4. PLAYBACK SNAPSHOT (Playback Snapshot)
+    # -----------------------------------------------------------------------------
+    # Aynı kullanıcının widget'ları `GET /me/player` sonucunu bu süre (saniye)
+    # boyunca paylaşır. Widget'lar ~2 sn'de bir sorgu yaptığından 2 sn'nin
+    # altında tutulmalıdır. 0 verilirse paylaşım kapanır (her istek Spotify'a gider)
+    # ve arka plan playback poller'ı da kullanılmaz.
+    PLAYBACK_SNAPSHOT_TTL_SECONDS: float = float(os.environ.get("SPOTIFY_PLAYBACK_SNAPSHOT_TTL_SECONDS") or 1.5)
+    # `widget_data` isteğinin toplam süre bütçesi (saniye). Token yenileme ve
+    # Spotify çağrısı bu süreyi aşarsa eski snapshot veya hata hemen döndürülür.
+    WIDGET_DATA_DEADLINE_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_DATA_DEADLINE_SECONDS") or 1.5)
+
+    # 2.1.5. HTTP İSTEMCİ (HTTP Client)
+    # -----------------------------------------------------------------------------
+    # Spotify istekleri keep-alive bağlantı havuzlu tek bir `requests.Session`
+    # üzerinden yapılır. HTTP_POOLED=false her istekte yeni bağlantı açar
+    # (yalnızca karşılaştırma / sorun giderme için).
+    HTTP_POOLED: bool = (os.environ.get("SPOTIFY_HTTP_POOLED") or "true").strip().lower() in {
+        "1", "true", "yes", "y", "on",
+    }
+    # Host başına açık tutulacak en fazla bağlantı (eşzamanlı worker thread sayısı kadar)
+    HTTP_POOL_MAXSIZE: int = int(os.environ.get("SPOTIFY_HTTP_POOL_MAXSIZE") or 20)
+    # Uygulama açılışında Spotify host'larına bağlantıyı önceden kur (DNS + TCP + TLS)
+    HTTP_PREWARM: bool = (os.environ.get("SPOTIFY_HTTP_PREWARM") or "true").strip().lower() in {
+        "1", "true", "yes", "y", "on",
+    }
+    # Spotify isteklerinin varsayılan timeout'u (saniye)
+    HTTP_TIMEOUT_SECONDS: float = float(os.environ.get("SPOTIFY_HTTP_TIMEOUT_SECONDS") or 10)
+
+    # 2.1.6. PLAYBACK POLLER (Background Playback Poller)
+    # -----------------------------------------------------------------------------
+    # Açıkken aktif widget'ı olan her kullanıcı için `/me/player` arka planda
+    # tek bir zamanlayıcı tarafından sorgulanır; widget istekleri snapshot'ı okur.
+    # Snapshot'ları saklamak için `PLAYBACK_SNAPSHOT_TTL_SECONDS` > 0 olmalıdır.
+    PLAYBACK_POLLER_ENABLED: bool = (os.environ.get("SPOTIFY_PLAYBACK_POLLER_ENABLED") or "true").strip().lower() in {
+        "1", "true", "yes", "y", "on",
+    }
+    # Çalarken sorgu aralığı (parça bitimine yakınsa bitişten hemen sonra sorgulanır)
+    PLAYBACK_POLLER_PLAYING_SECONDS: float = float(os.environ.get("SPOTIFY_PLAYBACK_POLLER_PLAYING_SECONDS") or 2.0)
+    # Poller'ın karşılaması beklenen eşzamanlı aktif widget kullanıcısı sayısı.
+    # Çalarken kullanıcı başına saniyede 1 / PLAYBACK_POLLER_PLAYING_SECONDS
+    # istek yapılır (2 sn -> 0.5 istek/sn); client_id rate limit varsayılanları
+    # (2.1.7) bu yükten hesaplanır. Daha fazla kullanıcıda poller client bucket'ını
+    # tüketir ve widget'lar son iyi yanıtı (`throttled`) görür; bu durumda bu
+    # değer artırılmalı veya sorgu aralığı uzatılmalıdır.
+    PLAYBACK_POLLER_EXPECTED_USERS: int = int(os.environ.get("SPOTIFY_PLAYBACK_POLLER_EXPECTED_USERS") or 50)
+    # Poller'ın en yoğun (herkes çalarken) saniyedeki Spotify isteği; kapalıysa 0
+    PLAYBACK_POLLER_REQUESTS_PER_SECOND: float = (
+        PLAYBACK_POLLER_EXPECTED_USERS / max(0.1, PLAYBACK_POLLER_PLAYING_SECONDS)
+        if PLAYBACK_POLLER_ENABLED
+        else 0.0
+    )
+    # Duraklatılmışken / aktif cihaz yokken sorgu aralığı
+    PLAYBACK_POLLER_PAUSED_SECONDS: float = float(os.environ.get("SPOTIFY_PLAYBACK_POLLER_PAUSED_SECONDS") or 5.0)
+    # Hata sonrası sorgu aralığı
+    PLAYBACK_POLLER_ERROR_SECONDS: float = float(os.environ.get("SPOTIFY_PLAYBACK_POLLER_ERROR_SECONDS") or 10.0)
+    # Bu süre boyunca widget isteği gelmeyen kullanıcının sorgusu durdurulur
+    PLAYBACK_POLLER_IDLE_SECONDS: float = float(os.environ.get("SPOTIFY_PLAYBACK_POLLER_IDLE_SECONDS") or 60)
+    # Eşzamanlı Spotify sorgusu yapan worker thread sayısı
+    PLAYBACK_POLLER_WORKERS: int = int(os.environ.get("SPOTIFY_PLAYBACK_POLLER_WORKERS") or 4)
+
+    # 2.1.7. RATE LIMIT (Rate Limiting)
+    # -----------------------------------------------------------------------------
+    # Spotify limitleri uygulama (client_id) bazındadır. İstekler client_id ve
+    # kullanıcı başına token bucket ile sınırlanır (saniyedeki istek / anlık tepe).
+    # client_id varsayılanı: poller yükü (2.1.6) + diğer istekler için saniyede 10;
+    # anlık tepe bunun iki katı (50 kullanıcı / 2 sn -> 35/sn, tepe 70).
+    RATE_LIMIT_CLIENT_PER_SECOND: float = float(
+        os.environ.get("SPOTIFY_RATE_LIMIT_CLIENT_PER_SECOND") or PLAYBACK_POLLER_REQUESTS_PER_SECOND + 10
+    )
+    RATE_LIMIT_CLIENT_BURST: float = float(
+        os.environ.get("SPOTIFY_RATE_LIMIT_CLIENT_BURST") or 2 * RATE_LIMIT_CLIENT_PER_SECOND
+    )
+    RATE_LIMIT_USER_PER_SECOND: float = float(os.environ.get("SPOTIFY_RATE_LIMIT_USER_PER_SECOND") or 3)
+    RATE_LIMIT_USER_BURST: float = float(os.environ.get("SPOTIFY_RATE_LIMIT_USER_BURST") or 6)
+    # 429 yanıtında Retry-After başlığı yoksa uygulanacak soğuma süresi (saniye)
+    RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS: float = float(
+        os.environ.get("SPOTIFY_RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS") or 5
+    )
+    # Bekleme bu süreden kısaysa istek sıraya alınır (beklenir); uzunsa son iyi
+    # yanıt veya 429 hatası hemen döndürülür.
+    RATE_LIMIT_MAX_WAIT_SECONDS: float = float(os.environ.get("SPOTIFY_RATE_LIMIT_MAX_WAIT_SECONDS") or 1.0)
+
+    # 2.1.8. WIDGET SSE AKIŞI (Widget Server-Sent Events Stream)
+    # -----------------------------------------------------------------------------
+    # Sunucu, açık akış başına çalma durumunu bu aralıkla (saniye) kontrol eder;
+    # Spotify çağrısı playback snapshot'ı üzerinden kullanıcı başına paylaşılır.
+    WIDGET_STREAM_CHECK_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_STREAM_CHECK_SECONDS") or 1.0)
+    # Değişiklik olmasa da bağlantının canlı kalması için gönderilen heartbeat aralığı
+    WIDGET_STREAM_HEARTBEAT_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_STREAM_HEARTBEAT_SECONDS") or 15)
+    # Akışın en uzun süresi; dolunca kapanır ve tarayıcı (EventSource) yeniden bağlanır
+    WIDGET_STREAM_MAX_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_STREAM_MAX_SECONDS") or 1800)
+    # İlerleme beklenenden bu kadar (ms) saparsa "seek" olayı gönderilir
+    WIDGET_STREAM_SEEK_TOLERANCE_MS: int = int(os.environ.get("SPOTIFY_WIDGET_STREAM_SEEK_TOLERANCE_MS") or 3000)
+
+    # 2.1.9. WIDGET POLLING İPUCU (Widget Poll Hints)
+    # -----------------------------------------------------------------------------
+    # widget-data yanıtındaki `next_poll_ms` bu aralıklardan hesaplanır. İlerleme
+    # widget'ta yerel olarak ilerletildiği için çalarken seyrek sorgu yeterlidir;
+    # parça bitimine yakınsa bitişten hemen sonra sorgulanır.
+    WIDGET_POLL_PLAYING_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_POLL_PLAYING_SECONDS") or 10)
+    WIDGET_POLL_PAUSED_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_POLL_PAUSED_SECONDS") or 15)
+    WIDGET_POLL_ERROR_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_POLL_ERROR_SECONDS") or 10)
+    WIDGET_POLL_MIN_SECONDS: float = float(os.environ.get("SPOTIFY_WIDGET_POLL_MIN_SECONDS") or 1)
+
+    # 2.1.10. TOPLU WIDGET-DATA (Batched Widget Data)
+    # -----------------------------------------------------------------------------
+    # Tek bir toplu istekte kabul edilen en fazla widget token sayısı
+    WIDGET_BATCH_MAX_TOKENS: int = int(os.environ.get("SPOTIFY_WIDGET_BATCH_MAX_TOKENS") or 20)
+
+    # 2.1.11. CIRCUIT BREAKER & STALE (Circuit Breaker & Stale-While-Revalidate)
+    # -----------------------------------------------------------------------------
+    # Spotify API'ye art arda bu kadar ağ hatası / 5xx yanıt gelirse devre açılır
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.environ.get("SPOTIFY_CIRCUIT_FAILURE_THRESHOLD") or 5)
+    # Açık devrenin tek bir deneme isteğine izin vermeden önce beklediği süre (saniye)
+    CIRCUIT_RESET_SECONDS: float = float(os.environ.get("SPOTIFY_CIRCUIT_RESET_SECONDS") or 15)
+    # Spotify hata verirken son başarılı snapshot'ın `stale` işaretiyle sunulabileceği en uzun süre
+    PLAYBACK_SNAPSHOT_MAX_STALE_SECONDS: float = float(
+        os.environ.get("SPOTIFY_PLAYBACK_SNAPSHOT_MAX_STALE_SECONDS") or 30
+    )
+
 # =============================================================================
 # 3.0 YAPILANDIRMA NESNESİ (CONFIGURATION INSTANCE)
 # =============================================================================
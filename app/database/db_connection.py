@@ -2,18 +2,39 @@
 # Veritabanı Bağlantı Modülü (db_connection.py)
 # =============================================================================
 # Bu modül, MySQL veritabanı bağlantılarını yönetmek için kullanılan
-# `DatabaseConnection` sınıfını içerir.
+# `DatabaseConnection` sınıfını ve süreç genelinde paylaşılan bağlantı
+# havuzunu (`DatabaseConnectionPool`) içerir.
 #
 # İÇİNDEKİLER:
 # -----------------------------------------------------------------------------
 # 1.0  İÇE AKTARMALAR (IMPORTS)
 #      : Standart kütüphane, üçüncü parti paketler ve uygulama içi modüller.
 #
-# 2.0  SINIFLAR (CLASSES)
-#      2.1. DatabaseConnection
-#           2.1.1. __init__(config=None)
-#           2.1.2. ensure_connection()
-#           2.1.3. close()
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _PING_AFTER_IDLE_SECONDS
+#
+# 3.0  BAĞLANTI HAVUZU (CONNECTION POOL)
+#      3.1. _PooledConnection
+#           3.1.1. statement_cache(max_size)
+#      3.2. DatabaseConnectionPool
+#           3.2.1. __init__(config, size, max_overflow, timeout, max_lifetime)
+#           3.2.2. acquire()
+#           3.2.3. release(pooled)
+#           3.2.4. dispose()
+#           3.2.5. stats()
+#      3.3. get_connection_pool()
+#
+# 4.0  SINIFLAR (CLASSES)
+#      4.1. DatabaseConnection
+#           4.1.1. __init__(config=None, use_pool=None)
+#           4.1.2. build_config(source)
+#           4.1.3. ensure_connection()
+#           4.1.4. tuple_cursor
+#           4.1.5. fetch_prepared(sql, params, dictionary=False)
+#           4.1.6. _statement_cache()
+#           4.1.7. _create_cursor()
+#           4.1.8. close()
 # =============================================================================
 
 from __future__ import annotations
@@ -23,46 +44,289 @@ from __future__ import annotations
 # =============================================================================
 
 # Standart kütüphane
-from typing import Any, Dict, Optional
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence
 
 # Üçüncü parti
 import mysql.connector
 from mysql.connector import Error as MySQLError
 from mysql.connector import MySQLConnection
+from mysql.connector.errors import PoolError
 
 # Uygulama içi
-from app.config.config import DB_CONFIG
+from app.config.config import DB_CONFIG, DB_POOL_CONFIG, PREPARED_STATEMENTS_CONFIG
+from app.database.prepared_statements import PreparedStatementCache
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Bu süreden uzun boşta kalan bağlantılar, tekrar verilmeden önce ping ile
+# kontrol edilir. Daha kısa süreli bekleyişlerde ek round-trip yapılmaz.
+_PING_AFTER_IDLE_SECONDS: float = 30.0
+
+
+# =============================================================================
+# 3.0 BAĞLANTI HAVUZU (CONNECTION POOL)
+# =============================================================================
+
+class _PooledConnection:
+    """Havuzdaki tek bir MySQL bağlantısını, zaman bilgilerini ve prepared
+    statement önbelleğini tutar."""
+
+    __slots__ = ("connection", "created_at", "last_used_at", "statements")
+
+    def __init__(self, connection: MySQLConnection) -> None:
+        now = time.monotonic()
+        self.connection: MySQLConnection = connection
+        self.created_at: float = now
+        self.last_used_at: float = now
+        self.statements: Optional[PreparedStatementCache] = None
+
+    def statement_cache(self, max_size: int) -> PreparedStatementCache:
+        """Bağlantının prepared statement önbelleği (havuza iadeler arasında korunur)."""
+        if self.statements is None:
+            self.statements = PreparedStatementCache(self.connection, max_size)
+        return self.statements
+
+
+class DatabaseConnectionPool:
+    """Thread-safe, boyutu sınırlı MySQL bağlantı havuzu.
+
+    - `size`: Boşta tutulacak kalıcı bağlantı sayısı.
+    - `max_overflow`: Havuz doluyken ek olarak açılabilecek geçici bağlantı sayısı.
+      Geçici bağlantılar iade edildiğinde havuzda yer yoksa kapatılır.
+    - `timeout`: Tüm bağlantılar kullanımdayken boş bağlantı için bekleme süresi (sn).
+    - `max_lifetime`: Bir bağlantının yeniden kullanılabileceği en uzun süre (sn).
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 5.0,
+        max_lifetime: int = 1800,
+    ) -> None:
+        self.config: Dict[str, Any] = config
+        self.size: int = max(1, int(size))
+        self.max_overflow: int = max(0, int(max_overflow))
+        self.timeout: float = max(0.0, float(timeout))
+        self.max_lifetime: int = max(0, int(max_lifetime))
+
+        self._idle: Deque[_PooledConnection] = deque()
+        self._open_count: int = 0
+        self._condition = threading.Condition(threading.Lock())
+        self._pid: int = os.getpid()
+
+    def _connect(self) -> _PooledConnection:
+        """Yeni bir MySQL bağlantısı açar."""
+        connection = mysql.connector.connect(
+            host=self.config["host"],
+            user=self.config["user"],
+            password=self.config["password"],
+            database=self.config["database"],
+            port=self.config.get("port") or 3306,
+            charset=self.config.get("charset", "utf8mb4"),
+        )
+        return _PooledConnection(connection)
+
+    def _is_expired(self, pooled: _PooledConnection, now: float) -> bool:
+        return bool(self.max_lifetime) and (now - pooled.created_at) >= self.max_lifetime
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        """Bağlantıyı kapatır ve açık bağlantı sayacını düşürür."""
+        try:
+            pooled.connection.close()
+        except MySQLError:
+            pass
+        finally:
+            with self._condition:
+                self._open_count -= 1
+                self._condition.notify()
+
+    def acquire(self) -> _PooledConnection:
+        """Havuzdan bir bağlantı ödünç alır; gerekirse yenisini açar.
+
+        Raises:
+            PoolError: `timeout` süresi içinde boş bağlantı bulunamazsa.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            pooled: Optional[_PooledConnection] = None
+            with self._condition:
+                while True:
+                    if self._idle:
+                        # LIFO: en son kullanılan (sıcak) bağlantı önce verilir
+                        pooled = self._idle.pop()
+                        break
+                    if self._open_count < self.size + self.max_overflow:
+                        self._open_count += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolError(
+                            f"Veritabanı havuzunda {self.timeout:.1f} sn içinde boş bağlantı bulunamadı "
+                            f"(size={self.size}, max_overflow={self.max_overflow})."
+                        )
+                    self._condition.wait(remaining)
+
+            if pooled is None:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._condition:
+                        self._open_count -= 1
+                        self._condition.notify()
+                    raise
+
+            now = time.monotonic()
+            if self._is_expired(pooled, now):
+                self._discard(pooled)
+                continue
+            if now - pooled.last_used_at >= _PING_AFTER_IDLE_SECONDS:
+                try:
+                    if not pooled.connection.is_connected():
+                        self._discard(pooled)
+                        continue
+                except MySQLError:
+                    self._discard(pooled)
+                    continue
+            return pooled
+
+    def release(self, pooled: _PooledConnection) -> None:
+        """Ödünç alınan bağlantıyı havuza iade eder.
+
+        Açık kalan transaction geri alınır; süresi dolan veya havuzda yer
+        olmayan (overflow) bağlantılar kapatılır.
+        """
+        try:
+            if pooled.connection.in_transaction:
+                pooled.connection.rollback()
+        except MySQLError:
+            self._discard(pooled)
+            return
+
+        now = time.monotonic()
+        if self._is_expired(pooled, now):
+            self._discard(pooled)
+            return
+
+        pooled.last_used_at = now
+        with self._condition:
+            if len(self._idle) < self.size:
+                self._idle.append(pooled)
+                self._condition.notify()
+                return
+        self._discard(pooled)
+
+    def dispose(self) -> None:
+        """Boştaki tüm bağlantıları kapatır (kullanımdakiler iade edilince kapanır)."""
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def stats(self) -> Dict[str, int]:
+        """Havuzun anlık durumunu döndürür."""
+        with self._condition:
+            return {
+                "size": self.size,
+                "max_overflow": self.max_overflow,
+                "open": self._open_count,
+                "idle": len(self._idle),
+                "in_use": self._open_count - len(self._idle),
+            }
+
+
+_pool: Optional[DatabaseConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> DatabaseConnectionPool:
+    """Süreç genelinde paylaşılan bağlantı havuzunu döndürür (lazy oluşturulur).
+
+    Not: Gunicorn `--preload` gibi fork senaryolarında ebeveyn süreçten gelen
+    soketler paylaşılmasın diye, PID değiştiğinde yeni bir havuz oluşturulur.
+    """
+    global _pool
+    pool = _pool
+    if pool is not None and pool._pid == os.getpid():
+        return pool
+
+    with _pool_lock:
+        if _pool is None or _pool._pid != os.getpid():
+            _pool = DatabaseConnectionPool(
+                config=DatabaseConnection.build_config(DB_CONFIG),
+                size=int(DB_POOL_CONFIG["size"]),
+                max_overflow=int(DB_POOL_CONFIG["max_overflow"]),
+                timeout=float(DB_POOL_CONFIG["timeout"]),
+                max_lifetime=int(DB_POOL_CONFIG["max_lifetime"]),
+            )
+            logger.info("Veritabanı bağlantı havuzu oluşturuldu: %s", _pool.stats())
+        return _pool
 
 
 # =============================================================================
-# 2.0 SINIFLAR (CLASSES)
+# 4.0 SINIFLAR (CLASSES)
 # =============================================================================
 
 class DatabaseConnection:
     """MySQL veritabanı bağlantısını yöneten yardımcı sınıf."""
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(self, config: Optional[Dict[str, Any]] = None, use_pool: Optional[bool] = None) -> None:
         """DatabaseConnection sınıfını başlatır.
 
         Args:
             config: Veritabanı yapılandırma sözlüğü. Verilmezse `DB_CONFIG` kullanılır.
+            use_pool: Bağlantının süreç genelindeki havuzdan alınıp alınmayacağı.
+                Verilmezse, özel `config` yoksa `DB_POOL_CONFIG["enabled"]` kullanılır.
         """
-        effective_config = config or DB_CONFIG
-        self.config: Dict[str, Any] = {
-            "host": effective_config.get("host"),
-            "user": effective_config.get("user"),
-            "password": effective_config.get("password"),
-            "database": effective_config.get("database"),
-            "port": effective_config.get("port"),
-            "charset": "utf8mb4",
-            "collation": "utf8mb4_unicode_ci",
-        }
+        self.config: Dict[str, Any] = self.build_config(config or DB_CONFIG)
+        if use_pool is None:
+            use_pool = config is None and bool(DB_POOL_CONFIG["enabled"])
+        self.use_pool: bool = use_pool
 
         self.connection: Optional[MySQLConnection] = None
         self.cursor: Optional[mysql.connector.cursor_cext.CMySQLCursorDict] = None
+        self._tuple_cursor: Optional[Any] = None
+        # Havuzsuz bağlantının prepared statement önbelleği (havuzda `_PooledConnection` tutar)
+        self._statements: Optional[PreparedStatementCache] = None
+        self._pooled: Optional[_PooledConnection] = None
+        self._pool: Optional[DatabaseConnectionPool] = None
+
+    @staticmethod
+    def build_config(source: Dict[str, Any]) -> Dict[str, Any]:
+        """Ham yapılandırmadan bağlantı parametrelerini üretir."""
+        return {
+            "host": source.get("host"),
+            "user": source.get("user"),
+            "password": source.get("password"),
+            "database": source.get("database"),
+            "port": source.get("port"),
+            "charset": "utf8mb4",
+            "collation": "utf8mb4_unicode_ci",
+        }
 
     def ensure_connection(self) -> None:
         """Bağlantı yoksa veya kopmuşsa yeniden bağlanır ve cursor oluşturur."""
+        if self.use_pool:
+            if self._pooled is None:
+                self._pool = get_connection_pool()
+                self._pooled = self._pool.acquire()
+                self.connection = self._pooled.connection
+                self.cursor = self._create_cursor()
+                self._tuple_cursor = None
+            return
+
         if self.connection is None or not self.connection.is_connected():
             self.connection = mysql.connector.connect(
                 host=self.config["host"],
@@ -72,11 +336,59 @@ class DatabaseConnection:
                 port=self.config.get("port") or 3306,
                 charset=self.config.get("charset", "utf8mb4"),
             )
-            # Dict cursor: sonuçlara `row["kolon_adi"]` ile erişebilmek için
-            self.cursor = self.connection.cursor(dictionary=True)
+            self.cursor = self._create_cursor()
+            self._tuple_cursor = None
+            self._statements = None
+
+    @property
+    def tuple_cursor(self) -> Any:
+        """Satırları tuple olarak döndüren (buffered) cursor; ilk kullanımda oluşturulur.
+
+        Projeksiyonlu sorgular satır başına dict üretmeden sonucu doğrudan
+        kompakt satır tiplerine (`app.database.widget_rows`) çevirmek için
+        kullanır. `ensure_connection()` sonrasında çağrılmalıdır.
+        """
+        if self._tuple_cursor is None:
+            self._tuple_cursor = self.connection.cursor(buffered=True)
+        return self._tuple_cursor
+
+    def fetch_prepared(self, sql: str, params: Sequence[Any] = (), dictionary: bool = False) -> List[Any]:
+        """Sık çalışan bir sorguyu çalıştırır ve tüm satırları döndürür.
+
+        `PREPARED_STATEMENTS_CONFIG["enabled"]` açıksa sorgu bağlantıya ait
+        prepared statement ile (binary protokol) çalışır; değilse metin
+        protokolüyle. Satırlar `dictionary` True ise dict, değilse tuple'dır.
+        Yalnızca sabit metinli (modül sabiti) sorgular için kullanılmalıdır;
+        her farklı metin ayrı bir statement hazırlar.
+        """
+        if PREPARED_STATEMENTS_CONFIG["enabled"]:
+            return self._statement_cache().fetch_all(sql, params, dictionary)
+
+        cursor = self.cursor if dictionary else self.tuple_cursor
+        cursor.execute(sql, tuple(params))
+        return cursor.fetchall()
+
+    def _statement_cache(self) -> PreparedStatementCache:
+        """Geçerli bağlantının prepared statement önbelleğini döndürür."""
+        max_size = int(PREPARED_STATEMENTS_CONFIG["max_per_connection"])
+        if self._pooled is not None:
+            return self._pooled.statement_cache(max_size)
+        if self._statements is None:
+            self._statements = PreparedStatementCache(self.connection, max_size)
+        return self._statements
+
+    def _create_cursor(self) -> Any:
+        """Bağlantı için dict cursor oluşturur.
+
+        Dict cursor: sonuçlara `row["kolon_adi"]` ile erişebilmek için.
+        Buffered: `fetchone()` sonrası okunmamış satır kalmasın; aynı bağlantı
+        bir istek boyunca birden fazla sorguda ve havuz üzerinden yeniden
+        kullanıldığında "Unread result found" hatası oluşmaz.
+        """
+        return self.connection.cursor(dictionary=True, buffered=True)
 
     def close(self) -> None:
-        """Cursor ve bağlantıyı güvenli bir şekilde kapatır."""
+        """Cursor'ı kapatır; bağlantıyı havuza iade eder veya kapatır."""
         if self.cursor is not None:
             try:
                 self.cursor.close()
@@ -85,6 +397,23 @@ class DatabaseConnection:
             finally:
                 self.cursor = None
 
+        if self._tuple_cursor is not None:
+            try:
+                self._tuple_cursor.close()
+            except MySQLError:
+                pass
+            finally:
+                self._tuple_cursor = None
+
+        if self._pooled is not None:
+            pooled, pool = self._pooled, self._pool
+            self._pooled = None
+            self._pool = None
+            self.connection = None
+            if pool is not None:
+                pool.release(pooled)
+            return
+
         if self.connection is not None:
             try:
                 if self.connection.is_connected():
@@ -92,6 +421,8 @@ class DatabaseConnection:
             except MySQLError:
                 pass
             finally:
+                # Statement'lar bağlantıyla birlikte sunucuda serbest kalır
+                self._statements = None
                 self.connection = None
 
 
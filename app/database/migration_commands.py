@@ -0,0 +1,117 @@
+# =============================================================================
+# Migration Komutları Modülü (migration_commands.py)
+# =============================================================================
+# Bu modül, şema migration'larını Flask CLI üzerinden çalıştıran komutları
+# uygulamaya kaydeder.
+#
+# Kullanım:
+#   flask --app app.main db-status            -> mevcut / beklenen sürüm ve bekleyenler
+#                                                (bekleyen varsa çıkış kodu 1)
+#   flask --app app.main db-upgrade           -> eksik migration'ları uygular
+#   flask --app app.main db-upgrade --to 3    -> belirtilen sürüme kadar uygular
+#   flask --app app.main db-explain           -> sık sorguların indeks kullanımını
+#                                                EXPLAIN ile doğrular (çıkış kodu 1: hata)
+#
+# Worker'lar açılışta yalnızca `BOOT_SAFE` migration'ları uygular; diğerleri
+# için deploy adımında bir kez `db-upgrade` çalıştırılır. Şema kodun
+# gerektirdiği sürümün altındayken worker açılmaz, ama bu komutlar çalışır
+# (Flask CLI altında açılış kontrolü yalnızca uyarır).
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  FONKSİYONLAR (FUNCTIONS)
+#      2.1. init_migration_commands(app)
+#           2.1.1. db-status
+#           2.1.2. db-upgrade [--to SÜRÜM]
+#           2.1.3. db-explain
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Optional
+
+# Üçüncü parti
+import click
+from flask import Flask
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.registry import latest_version
+from app.database.migrations_repository import MigrationsRepository
+from app.database.query_plans import check_hot_queries
+
+
+# =============================================================================
+# 2.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def init_migration_commands(app: Flask) -> None:
+    """`db-status`, `db-upgrade` ve `db-explain` CLI komutlarını uygulamaya kaydeder."""
+
+    # -------------------------------------------------------------------------
+    # 2.1.1. db-status
+    # -------------------------------------------------------------------------
+    @app.cli.command("db-status")
+    def _db_status() -> None:
+        """Şema sürümünü ve bekleyen migration'ları gösterir."""
+        repo = MigrationsRepository()
+        for row in repo.applied_migrations():
+            click.echo(
+                f"  v{int(row['version']):04d}  {row['applied_at']}  "
+                f"{row['execution_ms']} ms  {row['description']}"
+            )
+        pending = repo.pending_migrations()
+        for migration in pending:
+            marker = "" if migration.boot_safe else "  [yalnızca db-upgrade]"
+            click.echo(f"  v{migration.version:04d}  (bekliyor)  {migration.description}{marker}")
+        click.echo(f"Şema sürümü: {repo.current_version()} / {latest_version()}")
+        if pending:
+            # Deploy betiklerinde kontrol için: bekleyen varsa çıkış kodu 1
+            raise click.exceptions.Exit(1)
+
+    # -------------------------------------------------------------------------
+    # 2.1.2. db-upgrade
+    # -------------------------------------------------------------------------
+    @app.cli.command("db-upgrade")
+    @click.option("--to", "target", type=int, default=None, help="Bu sürüme kadar uygula (varsayılan: en yeni).")
+    def _db_upgrade(target: Optional[int]) -> None:
+        """Eksik migration'ları sırayla uygular."""
+        repo = MigrationsRepository()
+        applied = repo.upgrade(target=target)
+        for migration in applied:
+            click.echo(f"  v{migration.version:04d}  uygulandı  {migration.description}")
+        if not applied:
+            click.echo("Şema güncel; uygulanacak migration yok.")
+        click.echo(f"Şema sürümü: {repo.current_version()} / {latest_version()}")
+
+    # -------------------------------------------------------------------------
+    # 2.1.3. db-explain
+    # -------------------------------------------------------------------------
+    @app.cli.command("db-explain")
+    def _db_explain() -> None:
+        """Sık repository sorgularının indeks kullandığını EXPLAIN ile doğrular."""
+        db = DatabaseConnection()
+        try:
+            report = check_hot_queries(db)
+        finally:
+            db.close()
+        for item in report:
+            status = "OK  " if item["ok"] else "HATA"
+            click.echo(
+                f"  {status} {item['name']}: type={item['type']} key={item['key']} "
+                f"rows={item['rows']} {item['extra']}".rstrip()
+            )
+            if not item["ok"]:
+                click.echo(f"       -> {item['reason']}")
+        if not all(item["ok"] for item in report):
+            raise click.exceptions.Exit(1)
+
+
+# =============================================================================
+# Migration Komutları Modülü Sonu
+# =============================================================================
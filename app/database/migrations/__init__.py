@@ -1,10 +1,13 @@
 # =============================================================================
 # Migrations Paket Tanımı (app.database.migrations)
 # =============================================================================
-# Bu paket, her tablo için ayrı migration (CREATE TABLE) fonksiyonlarını içerir.
+# Bu paket, her tablo için ayrı migration (CREATE TABLE) fonksiyonlarını ve
+# bunları sırayla uygulayan sürümlü migration'ları içerir.
 #
 # İÇİNDEKİLER:
 # -----------------------------------------------------------------------------
 # 1.0  AÇIKLAMA
 #      : Tablo oluşturma fonksiyonları bu paketin altındadır.
+#      : versions/  -> sürümlü migration modülleri (vNNNN_*.py)
+#      : registry   -> sürümlerin bulunması ve sıralanması
 # =============================================================================
@@ -0,0 +1,127 @@
+# =============================================================================
+# Migration Kayıt Modülü (registry.py)
+# =============================================================================
+# Bu modül, `app.database.migrations.versions` paketindeki sürümlü migration
+# modüllerini bulur ve sürüm sırasına göre `Migration` nesneleri olarak
+# döndürür.
+#
+# Sürüm numarası modül adından (`v0003_...` -> 3) okunur. Aynı numaralı iki
+# modül veya `upgrade` fonksiyonu olmayan bir modül hata sayılır. Modülde
+# `BOOT_SAFE = True` yoksa migration açılışta otomatik uygulanmaz.
+#
+# `REQUIRED_SCHEMA_VERSION`, koddaki repository sorgularının çalışması için
+# gereken en düşük sürümdür; şema bunun altındaysa uygulama açılmaz.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. _VERSION_PATTERN
+#      2.2. REQUIRED_SCHEMA_VERSION
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. MigrationError
+#      3.2. Migration
+#
+# 4.0  FONKSİYONLAR (FUNCTIONS)
+#      4.1. load_migrations()
+#      4.2. latest_version()
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import importlib
+import pkgutil
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Pattern, Tuple
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations import versions
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+_VERSION_PATTERN: Pattern[str] = re.compile(r"^v(\d{4})_\w+$")
+
+# Repository'lerin beklediği en düşük şema sürümü (v0006: yalnızca `user_id`
+# yazan eklemeler için NULL kabul eden kullanıcı adı kolonları).
+# Bir sorgu yeni bir sürümün kolonunu/indeksini kullanmaya başladığında artırılır.
+REQUIRED_SCHEMA_VERSION: int = 6
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class MigrationError(Exception):
+    """Migration tanımı veya uygulanması ile ilgili hata."""
+
+
+class Migration:
+    """Tek bir şema sürümü."""
+
+    def __init__(
+        self,
+        version: int,
+        name: str,
+        description: str,
+        upgrade: Callable[[DatabaseConnection], None],
+        boot_safe: bool = False,
+    ) -> None:
+        self.version: int = version
+        self.name: str = name
+        self.description: str = description
+        self.upgrade: Callable[[DatabaseConnection], None] = upgrade
+        # False: yalnızca `db-upgrade` ile uygulanır (açılışta uygulanmaz)
+        self.boot_safe: bool = boot_safe
+
+    def __repr__(self) -> str:
+        return f"Migration(version={self.version}, name={self.name!r})"
+
+
+# =============================================================================
+# 4.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def load_migrations() -> Tuple[Migration, ...]:
+    """Tüm migration'ları sürüm sırasına göre döndürür (süreç başına bir kez yüklenir)."""
+    found: Dict[int, Migration] = {}
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        match = _VERSION_PATTERN.match(module_info.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in found:
+            raise MigrationError(f"Aynı sürüm numarası iki kez kullanılmış: {version} ({module_info.name})")
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        upgrade = getattr(module, "upgrade", None)
+        if not callable(upgrade):
+            raise MigrationError(f"Migration modülünde upgrade() yok: {module_info.name}")
+        found[version] = Migration(
+            version=version,
+            name=module_info.name,
+            description=str(getattr(module, "DESCRIPTION", "") or module_info.name),
+            upgrade=upgrade,
+            boot_safe=bool(getattr(module, "BOOT_SAFE", False)),
+        )
+    return tuple(found[version] for version in sorted(found))
+
+
+def latest_version() -> int:
+    """Koddaki en yeni şema sürümünü döndürür (migration yoksa 0)."""
+    migrations = load_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+# =============================================================================
+# Migration Kayıt Modülü Sonu
+# =============================================================================
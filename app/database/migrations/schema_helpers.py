@@ -0,0 +1,162 @@
+# =============================================================================
+# Şema Yardımcıları Modülü (schema_helpers.py)
+# =============================================================================
+# Bu modül, sürümlü migration'ların tekrar çalıştırılabilir (idempotent)
+# yazılmasını sağlayan küçük şema yardımcılarını içerir.
+#
+# İndeks, kolon ve trigger'lar `information_schema` üzerinden kontrol
+# edilir; yalnızca eksikse eklenir, yalnızca varsa silinir. İndeks değişiklikleri
+# `ALGORITHM=INPLACE, LOCK=NONE` ile çalışır; tablo yazmaya kapanmaz.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  FONKSİYONLAR (FUNCTIONS)
+#      2.1. index_columns(db, table, index_name)
+#      2.2. create_index_if_missing(db, table, index_name, columns, unique=False)
+#      2.3. drop_index_if_exists(db, table, index_name)
+#      2.4. column_names(db, table)
+#      2.5. trigger_exists(db, name)
+#      2.6. drop_trigger_if_exists(db, name)
+#      2.7. column_is_nullable(db, table, column)
+#      2.8. foreign_key_names(db, table, column)
+#      2.9. foreign_key_checks_disabled(db)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+
+
+# =============================================================================
+# 2.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def index_columns(db: DatabaseConnection, table: str, index_name: str) -> List[str]:
+    """İndeksin kolonlarını sırasıyla döndürür; indeks yoksa boş liste."""
+    db.cursor.execute(
+        """
+        SELECT COLUMN_NAME FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        ORDER BY SEQ_IN_INDEX
+        """,
+        (table, index_name),
+    )
+    return [row["COLUMN_NAME"] for row in db.cursor.fetchall() or []]
+
+
+def create_index_if_missing(
+    db: DatabaseConnection,
+    table: str,
+    index_name: str,
+    columns: Sequence[str],
+    unique: bool = False,
+) -> bool:
+    """İndeks yoksa ekler; eklendiyse True döner."""
+    if index_columns(db, table, index_name):
+        return False
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    column_list = ", ".join(columns)
+    db.cursor.execute(
+        f"ALTER TABLE {table} ADD {kind} {index_name} ({column_list}), ALGORITHM=INPLACE, LOCK=NONE"
+    )
+    return True
+
+
+def drop_index_if_exists(db: DatabaseConnection, table: str, index_name: str) -> bool:
+    """İndeks varsa siler; silindiyse True döner."""
+    if not index_columns(db, table, index_name):
+        return False
+    db.cursor.execute(f"ALTER TABLE {table} DROP INDEX {index_name}, ALGORITHM=INPLACE, LOCK=NONE")
+    return True
+
+
+def column_names(db: DatabaseConnection, table: str) -> List[str]:
+    """Tablonun kolon adlarını tablo sırasıyla döndürür."""
+    db.cursor.execute(
+        """
+        SELECT COLUMN_NAME FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        ORDER BY ORDINAL_POSITION
+        """,
+        (table,),
+    )
+    return [row["COLUMN_NAME"] for row in db.cursor.fetchall() or []]
+
+
+def trigger_exists(db: DatabaseConnection, name: str) -> bool:
+    """Veritabanında bu adla bir trigger olup olmadığını döndürür."""
+    db.cursor.execute(
+        """
+        SELECT TRIGGER_NAME FROM information_schema.TRIGGERS
+        WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = %s
+        """,
+        (name,),
+    )
+    return db.cursor.fetchone() is not None
+
+
+def drop_trigger_if_exists(db: DatabaseConnection, name: str) -> bool:
+    """Trigger varsa siler; silindiyse True döner."""
+    if not trigger_exists(db, name):
+        return False
+    db.cursor.execute(f"DROP TRIGGER {name}")
+    return True
+
+
+def column_is_nullable(db: DatabaseConnection, table: str, column: str) -> bool:
+    """Kolonun NULL kabul edip etmediğini döndürür; kolon yoksa False."""
+    db.cursor.execute(
+        """
+        SELECT IS_NULLABLE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """,
+        (table, column),
+    )
+    row = db.cursor.fetchone()
+    return bool(row) and row.get("IS_NULLABLE") == "YES"
+
+
+def foreign_key_names(db: DatabaseConnection, table: str, column: str) -> List[str]:
+    """Kolon üzerindeki yabancı anahtar kısıtlarının adlarını döndürür.
+
+    Adı verilmeden oluşturulan kısıtlar `<tablo>_ibfk_N` biçiminde adlanır;
+    bu nedenle ad yerine kolon üzerinden bulunur.
+    """
+    db.cursor.execute(
+        """
+        SELECT CONSTRAINT_NAME FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+          AND REFERENCED_TABLE_NAME IS NOT NULL
+        """,
+        (table, column),
+    )
+    return [row["CONSTRAINT_NAME"] for row in db.cursor.fetchall() or []]
+
+
+@contextmanager
+def foreign_key_checks_disabled(db: DatabaseConnection) -> Iterator[None]:
+    """Oturum için `foreign_key_checks` kapalıyken çalıştırır.
+
+    InnoDB yabancı anahtarı yalnızca kontroller kapalıyken `ALGORITHM=INPLACE`
+    ile ekler; aksi halde tablo kopyalanır. Veri tutarlılığı çağıran
+    tarafından önceden doğrulanmalıdır.
+    """
+    db.cursor.execute("SET SESSION foreign_key_checks = 0")
+    try:
+        yield
+    finally:
+        db.cursor.execute("SET SESSION foreign_key_checks = 1")
+
+
+# =============================================================================
+# Şema Yardımcıları Modülü Sonu
+# =============================================================================
@@ -9,6 +9,7 @@
 #
 # 2.0  FONKSİYONLAR (FUNCTIONS)
 #      2.1. create_spotify_accounts_table(db_connection=None)
+#      2.2. ensure_spotify_access_token_columns(db_connection=None)
 #
 # 3.0  KOMUT SATIRI (CLI)
 #      3.1. __main__ (doğrudan çalıştırma)
@@ -54,6 +55,8 @@ def create_spotify_accounts_table(db_connection: Optional[DatabaseConnection] =
                 client_id VARCHAR(255) DEFAULT NULL,
                 client_secret VARCHAR(255) DEFAULT NULL,
                 refresh_token TEXT DEFAULT NULL,
+                access_token TEXT DEFAULT NULL,
+                access_token_expires_at DATETIME DEFAULT NULL,
                 widget_token VARCHAR(255) DEFAULT NULL,
                 short_token VARCHAR(50) DEFAULT NULL,
                 design VARCHAR(50) DEFAULT 'standard',
@@ -73,12 +76,56 @@ def create_spotify_accounts_table(db_connection: Optional[DatabaseConnection] =
             db.close()
 
 
+def ensure_spotify_access_token_columns(db_connection: Optional[DatabaseConnection] = None) -> None:
+    """Eski kurulumlarda `access_token` ve `access_token_expires_at` kolonlarını ekler.
+
+    `CREATE TABLE IF NOT EXISTS` mevcut tabloya kolon eklemediği için, kolonlar
+    `information_schema` üzerinden kontrol edilip yalnızca eksikse eklenir.
+
+    Args:
+        db_connection: Mevcut veritabanı bağlantısı.
+    """
+    own_connection = False
+    db = db_connection
+
+    if db is None:
+        db = DatabaseConnection()
+        own_connection = True
+
+    columns = {
+        "access_token": "ADD COLUMN access_token TEXT DEFAULT NULL AFTER refresh_token",
+        "access_token_expires_at": "ADD COLUMN access_token_expires_at DATETIME DEFAULT NULL AFTER access_token",
+    }
+
+    try:
+        db.ensure_connection()
+        db.cursor.execute(
+            """
+            SELECT COLUMN_NAME FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'spotify_accounts'
+            """
+        )
+        existing = {row["COLUMN_NAME"] for row in db.cursor.fetchall() or []}
+        for column, clause in columns.items():
+            if column not in existing:
+                db.cursor.execute(f"ALTER TABLE spotify_accounts {clause}")
+        db.connection.commit()
+    except MySQLError:
+        if db.connection and db.connection.is_connected():
+            db.connection.rollback()
+        raise
+    finally:
+        if own_connection:
+            db.close()
+
+
 # =============================================================================
 # 3.0 KOMUT SATIRI (CLI)
 # =============================================================================
 
 if __name__ == "__main__":
     create_spotify_accounts_table()
+    ensure_spotify_access_token_columns()
 
 
 # =============================================================================
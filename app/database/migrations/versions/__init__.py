@@ -0,0 +1,24 @@
+# =============================================================================
+# Migration Sürümleri Paket Tanımı (app.database.migrations.versions)
+# =============================================================================
+# Bu paket, şemayı adım adım ileri taşıyan sürümlü migration modüllerini
+# içerir. Modül adı `vNNNN_kisa_aciklama.py` biçimindedir; sürüm numarası
+# addan okunur ve migration'lar bu sıraya göre bir kez uygulanır.
+#
+# Her modül şunları tanımlar:
+#   DESCRIPTION: str                       -> `schema_migrations` kaydına yazılır
+#   upgrade(db: DatabaseConnection) -> None -> şema değişikliği
+#   BOOT_SAFE: bool (opsiyonel, False)    -> açılışta otomatik uygulanabilir mi
+#
+# Açılışta (`DB_MIGRATIONS_AUTO_UPGRADE=True`) yalnızca `BOOT_SAFE = True`
+# olan, küçük ve yalnızca ekleyen migration'lar uygulanır. Tablo yeniden
+# oluşturan, veri dolduran veya bir şey kaldıran migration'lar her zaman
+# `flask --app app.main db-upgrade` ile çalıştırılır.
+#
+# Uygulanmış bir modül değiştirilmez; yeni değişiklik için yeni sürüm eklenir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  AÇIKLAMA
+#      : Sürümler `app.database.migrations.registry.load_migrations()` ile yüklenir.
+# =============================================================================
@@ -0,0 +1,51 @@
+# =============================================================================
+# Migration v0001: Başlangıç Şeması (v0001_initial_schema.py)
+# =============================================================================
+# `users`, `auth_tokens`, `spotify_accounts` ve `widgets` tablolarını oluşturur.
+#
+# Tablolar `CREATE TABLE IF NOT EXISTS` ile oluşturulduğu için, sürüm tablosu
+# olmadan kurulmuş mevcut veritabanlarında da güvenle çalışır.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  MIGRATION
+#      2.1. DESCRIPTION
+#      2.2. BOOT_SAFE
+#      2.3. upgrade(db)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.auth_tokens_table import create_auth_tokens_table
+from app.database.migrations.spotify_accounts_table import create_spotify_accounts_table
+from app.database.migrations.users_table import create_users_table
+from app.database.migrations.widgets_table import create_widgets_table
+
+
+# =============================================================================
+# 2.0 MIGRATION
+# =============================================================================
+
+DESCRIPTION = "Başlangıç şeması (users, auth_tokens, spotify_accounts, widgets)"
+
+# Yalnızca eksik tablo/kolon ekler; açılışta uygulanabilir
+BOOT_SAFE = True
+
+
+def upgrade(db: DatabaseConnection) -> None:
+    """Temel tabloları yabancı anahtar sırasına göre oluşturur."""
+    create_users_table(db)
+    create_auth_tokens_table(db)
+    create_spotify_accounts_table(db)
+    create_widgets_table(db)
+
+
+# =============================================================================
+# Migration v0001 Sonu
+# =============================================================================
@@ -0,0 +1,44 @@
+# =============================================================================
+# Migration v0002: Spotify Access Token Kolonları (v0002_spotify_access_token_columns.py)
+# =============================================================================
+# `spotify_accounts` tablosuna `access_token` ve `access_token_expires_at`
+# kolonlarını (eksikse) ekler. Kolonlar v0001 ile oluşturulan yeni
+# kurulumlarda zaten vardır; bu adım eski kurulumları aynı şemaya getirir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  MIGRATION
+#      2.1. DESCRIPTION
+#      2.2. BOOT_SAFE
+#      2.3. upgrade(db)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.spotify_accounts_table import ensure_spotify_access_token_columns
+
+
+# =============================================================================
+# 2.0 MIGRATION
+# =============================================================================
+
+DESCRIPTION = "spotify_accounts access token kolonları"
+
+# Yalnızca eksik tablo/kolon ekler; açılışta uygulanabilir
+BOOT_SAFE = True
+
+
+def upgrade(db: DatabaseConnection) -> None:
+    """Eksik access token kolonlarını ekler."""
+    ensure_spotify_access_token_columns(db)
+
+
+# =============================================================================
+# Migration v0002 Sonu
+# =============================================================================
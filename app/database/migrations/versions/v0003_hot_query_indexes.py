@@ -0,0 +1,82 @@
+# =============================================================================
+# Migration v0003: Sık Sorgular İçin Bileşik İndeksler (v0003_hot_query_indexes.py)
+# =============================================================================
+# Repository'lerdeki sık çalışan sorguların WHERE / ORDER BY biçimine göre
+# bileşik indeksler ekler:
+#
+#   widgets
+#     idx_widgets_user_type_platform     (beatify_username, widget_type, platform)
+#       -> get_widget_by_username_and_type()
+#     idx_widgets_user_platform_created  (beatify_username, platform, created_at)
+#       -> get_widgets_by_username() (ORDER BY created_at için filesort yok),
+#          get_widget_token_by_username()
+#
+#   auth_tokens
+#     idx_auth_tokens_validate           (token, expired_at, expires_at, username)
+#       -> validate_auth_token(): tüm kolonlar indekste (covering), satıra gidilmez
+#     idx_auth_tokens_user_active        (username, expired_at)
+#       -> deactivate_all_user_tokens()
+#
+# Yabancı anahtar için InnoDB'nin otomatik oluşturduğu tek kolonlu indeksler
+# (`widgets.beatify_username`, `auth_tokens.username`) yeni indekslerin sol
+# önekiyle karşılandığı için kaldırılır; her yazmada bir indeks daha az
+# güncellenir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  MIGRATION
+#      2.1. DESCRIPTION
+#      2.2. _INDEXES
+#      2.3. _REDUNDANT_FK_INDEXES
+#      2.4. upgrade(db)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Tuple
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.schema_helpers import create_index_if_missing, drop_index_if_exists, index_columns
+
+
+# =============================================================================
+# 2.0 MIGRATION
+# =============================================================================
+
+DESCRIPTION = "widgets / auth_tokens sık sorguları için bileşik indeksler"
+
+# (tablo, indeks adı, kolonlar)
+_INDEXES: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("widgets", "idx_widgets_user_type_platform", ("beatify_username", "widget_type", "platform")),
+    ("widgets", "idx_widgets_user_platform_created", ("beatify_username", "platform", "created_at")),
+    ("auth_tokens", "idx_auth_tokens_validate", ("token", "expired_at", "expires_at", "username")),
+    ("auth_tokens", "idx_auth_tokens_user_active", ("username", "expired_at")),
+)
+
+# (tablo, otomatik FK indeksinin adı = kolon adı)
+_REDUNDANT_FK_INDEXES: Tuple[Tuple[str, str], ...] = (
+    ("widgets", "beatify_username"),
+    ("auth_tokens", "username"),
+)
+
+
+def upgrade(db: DatabaseConnection) -> None:
+    """Bileşik indeksleri ekler, gereksiz kalan FK indekslerini kaldırır."""
+    for table, index_name, columns in _INDEXES:
+        create_index_if_missing(db, table, index_name, columns)
+
+    for table, column in _REDUNDANT_FK_INDEXES:
+        # Yalnızca tam olarak o kolondan oluşan otomatik indeks silinir
+        if index_columns(db, table, column) == [column]:
+            drop_index_if_exists(db, table, column)
+
+
+# =============================================================================
+# Migration v0003 Sonu
+# =============================================================================
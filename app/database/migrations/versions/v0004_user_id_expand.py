@@ -0,0 +1,166 @@
+# =============================================================================
+# Migration v0004: user_id Kolonları - Genişletme (v0004_user_id_expand.py)
+# =============================================================================
+# `auth_tokens`, `spotify_accounts` ve `widgets` tablolarına `users.id`'yi
+# gösteren boş bırakılabilir `user_id INT` kolonunu ekler, mevcut satırları
+# kullanıcı adı üzerinden doldurur ve `user_id` indekslerini oluşturur.
+#
+# Genişlet / daralt (expand / contract) düzeninin genişletme adımıdır; bu
+# şemada hem eski hem yeni kod çalışır:
+#
+#   - Eski kod yalnızca kullanıcı adı yazar; `BEFORE INSERT` trigger'ları
+#     `user_id`'yi kullanıcı adından doldurur. Böylece dağıtım sırasında eski
+#     worker'ların eklediği satırlar da yeni kodun `user_id` okumalarında görünür.
+#   - Yeni kod kullanıcı adını ve `user_id`'yi birlikte yazar, `user_id`
+#     üzerinden okur.
+#
+# Kolonlar ve indeksler `ALGORITHM=INPLACE, LOCK=NONE` ile eklenir; doldurma,
+# uzun süreli satır kilidi tutmamak için birincil anahtar aralıklarıyla küçük
+# partiler halinde yapılır. `user_id` anahtarlarına geçiş ve trigger'ların
+# kaldırılması v0006, kullanıcı adı kolonlarının silinmesi v0007'dedir.
+#
+# Not: Trigger oluşturmak migration kullanıcısında TRIGGER yetkisi ister
+# (binary log açıksa ayrıca `log_bin_trust_function_creators=1` veya SUPER).
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. DESCRIPTION
+#      2.2. USERNAME_COLUMNS
+#      2.3. _USER_ID_INDEXES
+#      2.4. _BACKFILL_BATCH_SIZE
+#
+# 3.0  MIGRATION
+#      3.1. upgrade(db)
+#      3.2. backfill_user_ids(db)
+#      3.3. _create_user_id_trigger(db, table, username_column)
+#      3.4. _backfill_by_id_range(db, table, column)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Dict, Tuple
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.schema_helpers import column_names, create_index_if_missing, trigger_exists
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+DESCRIPTION = "auth_tokens / spotify_accounts / widgets için user_id kolonları (expand)"
+
+# tablo -> kullanıcı adını tutan (daraltmada kaldırılacak) kolon
+USERNAME_COLUMNS: Dict[str, str] = {
+    "auth_tokens": "username",
+    "spotify_accounts": "username",
+    "widgets": "beatify_username",
+}
+
+# tablo -> (indeks adı, kolonlar, unique); repository'lerin `user_id` join'li
+# sorguları için v0003 indekslerinin `user_id`'li karşılıkları
+_USER_ID_INDEXES: Dict[str, Tuple[Tuple[str, Tuple[str, ...], bool], ...]] = {
+    "auth_tokens": (
+        ("idx_auth_tokens_uid_active", ("user_id", "expired_at"), False),
+    ),
+    "spotify_accounts": (
+        ("idx_spotify_accounts_user_id", ("user_id",), True),
+    ),
+    "widgets": (
+        ("idx_widgets_uid_type_platform", ("user_id", "widget_type", "platform"), False),
+        ("idx_widgets_uid_platform_created", ("user_id", "platform", "created_at"), False),
+    ),
+}
+
+# Tek bir doldurma UPDATE'inin kapsadığı birincil anahtar aralığı
+_BACKFILL_BATCH_SIZE: int = 5000
+
+
+# =============================================================================
+# 3.0 MIGRATION
+# =============================================================================
+
+def upgrade(db: DatabaseConnection) -> None:
+    """`user_id` kolonlarını ve trigger'ları ekler, satırları doldurur, indeksleri oluşturur."""
+    for table, username_column in USERNAME_COLUMNS.items():
+        if "user_id" not in column_names(db, table):
+            db.cursor.execute(
+                f"ALTER TABLE {table} ADD COLUMN user_id INT NULL AFTER {username_column}, "
+                "ALGORITHM=INPLACE, LOCK=NONE"
+            )
+        # Doldurmadan önce: arada eklenen satırlar da boş kalmasın
+        _create_user_id_trigger(db, table, username_column)
+
+    backfill_user_ids(db)
+
+    for table, indexes in _USER_ID_INDEXES.items():
+        for index_name, columns, unique in indexes:
+            create_index_if_missing(db, table, index_name, columns, unique=unique)
+
+
+def backfill_user_ids(db: DatabaseConnection) -> None:
+    """`user_id` değeri boş satırları kullanıcı adından doldurur.
+
+    Tekrar çalıştırılabilir; daraltma adımı da NOT NULL öncesinde çağırır.
+    """
+    for table, username_column in USERNAME_COLUMNS.items():
+        if table == "spotify_accounts":
+            # Kullanıcı başına tek satır; birincil anahtar kullanıcı adı
+            db.cursor.execute(
+                """
+                UPDATE spotify_accounts sa JOIN users u ON u.username = sa.username
+                SET sa.user_id = u.id
+                WHERE sa.user_id IS NULL
+                """
+            )
+            db.connection.commit()
+        else:
+            _backfill_by_id_range(db, table, username_column)
+
+
+def _create_user_id_trigger(db: DatabaseConnection, table: str, username_column: str) -> None:
+    """Yalnızca kullanıcı adı yazan eklemelerde `user_id`'yi dolduran trigger'ı oluşturur."""
+    name = f"trg_{table}_user_id"
+    if trigger_exists(db, name):
+        return
+    db.cursor.execute(
+        f"""
+        CREATE TRIGGER {name} BEFORE INSERT ON {table} FOR EACH ROW
+        SET NEW.user_id = COALESCE(NEW.user_id, (SELECT id FROM users WHERE username = NEW.{username_column}))
+        """
+    )
+
+
+def _backfill_by_id_range(db: DatabaseConnection, table: str, username_column: str) -> None:
+    """`id` aralıkları üzerinden partiler halinde doldurur; her parti ayrı commit edilir."""
+    db.cursor.execute(f"SELECT MIN(id) AS low, MAX(id) AS high FROM {table} WHERE user_id IS NULL")
+    bounds = db.cursor.fetchone() or {}
+    low, high = bounds.get("low"), bounds.get("high")
+    if low is None or high is None:
+        return
+
+    start = int(low)
+    while start <= int(high):
+        end = start + _BACKFILL_BATCH_SIZE - 1
+        db.cursor.execute(
+            f"""
+            UPDATE {table} t JOIN users u ON u.username = t.{username_column}
+            SET t.user_id = u.id
+            WHERE t.id BETWEEN %s AND %s AND t.user_id IS NULL
+            """,
+            (start, end),
+        )
+        db.connection.commit()
+        start = end + 1
+
+
+# =============================================================================
+# Migration v0004 Sonu
+# =============================================================================
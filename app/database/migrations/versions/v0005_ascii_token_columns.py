@@ -0,0 +1,225 @@
+# =============================================================================
+# Migration v0005: ASCII Token Kolonları (v0005_ascii_token_columns.py)
+# =============================================================================
+# Token kolonlarını `VARCHAR(255) utf8mb4` yerine yalnızca gereken genişlikte
+# ASCII kolonlara çevirir:
+#
+#   auth_tokens.token    -> CHAR(64)    ascii_bin  (secrets.token_hex(32))
+#   widgets.widget_token -> VARCHAR(32) ascii_bin  (12 karakter base62)
+#
+# utf8mb4'te anahtar karakter başına 4 bayt yer ayırır; ASCII ile unique
+# indeks anahtarları ~16 kat küçülür. `ascii_bin` karşılaştırması büyük/küçük
+# harf duyarlıdır; base62 token'lar için doğru olan da budur.
+#
+# Karakter seti değişikliği yerinde yapılamaz (`ALGORITHM=COPY` yazmaları
+# kopyalama boyunca durdurur). Bu yüzden çeviri gölge kolonla yapılır:
+#
+#   1) `<kolon>_ascii` gölge kolonu eklenir; eski kolon NULL kabul eder olur.
+#   2) INSERT/UPDATE trigger'ları yeni değerleri gölge kolona da yazar.
+#   3) Mevcut satırlar `id` aralıklarıyla partiler halinde kopyalanır; gölge
+#      kolona unique indeks eklenir.
+#   4) Geçiş: kısa bir `LOCK TABLES ... WRITE` altında trigger'lar silinir,
+#      kalan satırlar kopyalanır ve kolonlar yeniden adlandırılır
+#      (`<kolon>` -> `<kolon>_utf8mb4`, `<kolon>_ascii` -> `<kolon>`). Yeniden
+#      adlandırma yalnızca metadata değişikliğidir; yazmalar milisaniyeler
+#      düzeyinde bekler.
+#   5) Eski kolon silinir, yeni kolon NOT NULL olur, eski kolonu içeren
+#      indeksler yeni kolonla yeniden oluşturulur.
+#
+# 1-3 ve 5 `ALGORITHM=INPLACE, LOCK=NONE` ile çalışır. Migration yarıda
+# kalırsa kaldığı adımdan devam eder. Sığmayan (daha uzun veya ASCII olmayan)
+# bir değer varsa veri kaybı yerine hata verir. Eski kod bu sürümle de çalışır.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. DESCRIPTION
+#      2.2. _TOKEN_COLUMNS
+#      2.3. _COVERING_INDEXES
+#      2.4. _COPY_BATCH_SIZE
+#      2.5. _CUT_OVER_LOCK_WAIT
+#
+# 3.0  MIGRATION
+#      3.1. upgrade(db)
+#      3.2. _check_values(db, table, column, max_length)
+#      3.3. _prepare_shadow(db, table, column, column_type)
+#      3.4. _copy_by_id_range(db, table, column)
+#      3.5. _cut_over(db, table, column)
+#      3.6. _drop_old_column(db, table, column, column_type)
+#      3.7. _column_charset(db, table, column)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Dict, Optional, Tuple
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.registry import MigrationError
+from app.database.migrations.schema_helpers import (
+    column_is_nullable,
+    column_names,
+    create_index_if_missing,
+    drop_trigger_if_exists,
+    index_columns,
+    trigger_exists,
+)
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+DESCRIPTION = "auth_tokens.token ve widgets.widget_token kolonları ASCII"
+
+# (tablo, kolon, en fazla uzunluk, yeni kolon tipi)
+_TOKEN_COLUMNS: Tuple[Tuple[str, str, int, str], ...] = (
+    ("auth_tokens", "token", 64, "CHAR(64) CHARACTER SET ascii COLLATE ascii_bin"),
+    ("widgets", "widget_token", 32, "VARCHAR(32) CHARACTER SET ascii COLLATE ascii_bin"),
+)
+
+# tablo -> token kolonunu içeren ve yeni kolonla yeniden oluşturulacak indeksler
+_COVERING_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "auth_tokens": ("idx_auth_tokens_validate",),
+    "widgets": (),
+}
+
+# Tek bir kopyalama UPDATE'inin kapsadığı birincil anahtar aralığı
+_COPY_BATCH_SIZE: int = 5000
+
+# Geçişteki `LOCK TABLES` için en fazla bekleme (saniye); uzun bir işlem
+# tabloyu tutuyorsa tablo önünde yazma kuyruğu biriktirmek yerine hata verir
+_CUT_OVER_LOCK_WAIT: int = 5
+
+
+# =============================================================================
+# 3.0 MIGRATION
+# =============================================================================
+
+def upgrade(db: DatabaseConnection) -> None:
+    """Token kolonlarını (henüz çevrilmediyse) gölge kolon üzerinden ASCII'ye çevirir."""
+    for table, column, max_length, column_type in _TOKEN_COLUMNS:
+        if _column_charset(db, table, column) != "ascii":
+            _check_values(db, table, column, max_length)
+            _prepare_shadow(db, table, column, column_type)
+            _copy_by_id_range(db, table, column)
+            create_index_if_missing(db, table, f"uq_{table}_{column}", (f"{column}_ascii",), unique=True)
+            _cut_over(db, table, column)
+
+        if f"{column}_utf8mb4" in column_names(db, table):
+            _drop_old_column(db, table, column, column_type)
+
+
+def _check_values(db: DatabaseConnection, table: str, column: str, max_length: int) -> None:
+    """Yeni kolona sığmayan değer varsa hata verir."""
+    db.cursor.execute(
+        f"""
+        SELECT COUNT(*) AS invalid FROM {table}
+        WHERE CHAR_LENGTH({column}) > %s OR {column} <> CONVERT({column} USING ascii)
+        """,
+        (max_length,),
+    )
+    row = db.cursor.fetchone() or {}
+    if int(row.get("invalid") or 0):
+        raise MigrationError(
+            f"{table}.{column}: {row['invalid']} değer {max_length} karakterden uzun veya ASCII değil; "
+            "kolon çevrilmedi."
+        )
+
+
+def _prepare_shadow(db: DatabaseConnection, table: str, column: str, column_type: str) -> None:
+    """Gölge kolonu ve onu güncel tutan trigger'ları oluşturur."""
+    shadow = f"{column}_ascii"
+    if shadow not in column_names(db, table):
+        db.cursor.execute(
+            f"ALTER TABLE {table} ADD COLUMN {shadow} {column_type} NULL AFTER {column}, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+    if not column_is_nullable(db, table, column):
+        # Geçişten sonra kod yalnızca yeni kolonu yazar; eski kolon boş kalabilmeli
+        db.cursor.execute(
+            f"ALTER TABLE {table} MODIFY COLUMN {column} VARCHAR(255) NULL, ALGORITHM=INPLACE, LOCK=NONE"
+        )
+
+    for event in ("INSERT", "UPDATE"):
+        name = f"trg_{table}_{shadow}_{event.lower()}"
+        if not trigger_exists(db, name):
+            db.cursor.execute(
+                f"CREATE TRIGGER {name} BEFORE {event} ON {table} FOR EACH ROW "
+                f"SET NEW.{shadow} = NEW.{column}"
+            )
+
+
+def _copy_by_id_range(db: DatabaseConnection, table: str, column: str) -> None:
+    """Mevcut değerleri `id` aralıkları üzerinden partiler halinde gölge kolona kopyalar."""
+    shadow = f"{column}_ascii"
+    db.cursor.execute(f"SELECT MIN(id) AS low, MAX(id) AS high FROM {table} WHERE {shadow} IS NULL")
+    bounds = db.cursor.fetchone() or {}
+    low, high = bounds.get("low"), bounds.get("high")
+    if low is None or high is None:
+        return
+
+    start = int(low)
+    while start <= int(high):
+        end = start + _COPY_BATCH_SIZE - 1
+        db.cursor.execute(
+            f"UPDATE {table} SET {shadow} = {column} WHERE id BETWEEN %s AND %s AND {shadow} IS NULL",
+            (start, end),
+        )
+        db.connection.commit()
+        start = end + 1
+
+
+def _cut_over(db: DatabaseConnection, table: str, column: str) -> None:
+    """Kısa bir yazma kilidi altında gölge kolonu asıl kolonun yerine geçirir."""
+    shadow = f"{column}_ascii"
+    db.cursor.execute("SET SESSION lock_wait_timeout = %s", (_CUT_OVER_LOCK_WAIT,))
+    db.cursor.execute(f"LOCK TABLES {table} WRITE")
+    try:
+        for event in ("insert", "update"):
+            drop_trigger_if_exists(db, f"trg_{table}_{shadow}_{event}")
+        # Kopyalama ile kilit arasında eklenen satırlar (gölge kolon unique indeksli)
+        db.cursor.execute(f"UPDATE {table} SET {shadow} = {column} WHERE {shadow} IS NULL")
+        db.cursor.execute(
+            f"ALTER TABLE {table} RENAME COLUMN {column} TO {column}_utf8mb4, "
+            f"RENAME COLUMN {shadow} TO {column}"
+        )
+    finally:
+        db.cursor.execute("UNLOCK TABLES")
+        db.cursor.execute("SET SESSION lock_wait_timeout = DEFAULT")
+
+
+def _drop_old_column(db: DatabaseConnection, table: str, column: str, column_type: str) -> None:
+    """Eski kolonu siler, yeni kolonu NOT NULL yapar, kapsayan indeksleri yeni kolona taşır."""
+    old = f"{column}_utf8mb4"
+    clauses = []
+    for index_name in _COVERING_INDEXES[table]:
+        columns = index_columns(db, table, index_name)
+        if old in columns:
+            new_columns = ", ".join(column if name == old else name for name in columns)
+            clauses += [f"DROP INDEX {index_name}", f"ADD INDEX {index_name} ({new_columns})"]
+    clauses += [f"DROP COLUMN {old}", f"MODIFY COLUMN {column} {column_type} NOT NULL"]
+    db.cursor.execute(f"ALTER TABLE {table} {', '.join(clauses)}, ALGORITHM=INPLACE, LOCK=NONE")
+
+
+def _column_charset(db: DatabaseConnection, table: str, column: str) -> Optional[str]:
+    """Kolonun karakter setini döndürür."""
+    db.cursor.execute(
+        """
+        SELECT CHARACTER_SET_NAME FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """,
+        (table, column),
+    )
+    row = db.cursor.fetchone()
+    return row.get("CHARACTER_SET_NAME") if row else None
+
+
+# =============================================================================
+# Migration v0005 Sonu
+# =============================================================================
@@ -0,0 +1,161 @@
+# =============================================================================
+# Migration v0006: user_id Anahtarları (v0006_user_id_keys.py)
+# =============================================================================
+# Genişlet / daralt düzeninin geçiş adımı. İlişkileri kullanıcı adından
+# `user_id`'ye taşır ama kullanıcı adı kolonlarını henüz silmez; bu şemada
+# hem kullanıcı adını da yazan önceki sürüm hem de yalnızca `user_id` yazan
+# yeni kod çalışır:
+#
+#   - v0004'ten sonra eklenen satırlar doldurulur; boş kalan `user_id` varsa
+#     migration durur.
+#   - `user_id -> users(id) ON DELETE CASCADE` yabancı anahtarları eklenir,
+#     ardından kullanıcı adı üzerindeki yabancı anahtarlar kaldırılır.
+#   - v0004 trigger'ları kaldırılır (yalnızca kullanıcı adı yazan sürüm artık
+#     desteklenmez).
+#   - Kullanıcı adı ile başlayan v0003 indeksleri kaldırılır (aynı sorguları
+#     v0004'ün `user_id` indeksleri karşılar); `idx_auth_tokens_validate`
+#     `user_id` ile yeniden oluşturulur.
+#   - `user_id` NOT NULL, kullanıcı adı kolonları NULL kabul eder olur;
+#     `spotify_accounts` birincil anahtarı `user_id` olur.
+#
+# Kolonların silinmesi v0007'dedir. Tüm değişiklikler `ALGORITHM=INPLACE,
+# LOCK=NONE` ile yapılır (tablo yeniden oluşturulur ama yazmalar devam eder).
+# Önerilen sıra: önceki sürüm çalışırken `db-upgrade --to 6`, ardından dağıtım.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. DESCRIPTION
+#      2.2. _USERNAME_INDEXES
+#      2.3. _VALIDATE_INDEX
+#
+# 3.0  MIGRATION
+#      3.1. upgrade(db)
+#      3.2. _check_backfilled(db)
+#      3.3. _switch_foreign_key(db, table, username_column)
+#      3.4. _switch_columns(db, table, username_column)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Dict, Tuple
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.registry import MigrationError
+from app.database.migrations.schema_helpers import (
+    column_is_nullable,
+    drop_index_if_exists,
+    drop_trigger_if_exists,
+    foreign_key_checks_disabled,
+    foreign_key_names,
+    index_columns,
+)
+from app.database.migrations.versions.v0004_user_id_expand import USERNAME_COLUMNS, backfill_user_ids
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+DESCRIPTION = "user_id yabancı/birincil anahtarları, kullanıcı adı indeksleri kaldırıldı"
+
+# tablo -> kaldırılacak kullanıcı adı indeksleri (v0003)
+_USERNAME_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "auth_tokens": ("idx_auth_tokens_user_active",),
+    "spotify_accounts": (),
+    "widgets": ("idx_widgets_user_type_platform", "idx_widgets_user_platform_created"),
+}
+
+# Token doğrulama sorgusunun kapsayan indeksi; son kolon kullanıcı adı yerine `user_id`
+_VALIDATE_INDEX: Tuple[str, ...] = ("token", "expired_at", "expires_at", "user_id")
+
+
+# =============================================================================
+# 3.0 MIGRATION
+# =============================================================================
+
+def upgrade(db: DatabaseConnection) -> None:
+    """Kullanıcı adı ilişkilerini `user_id` anahtarlarına çevirir."""
+    backfill_user_ids(db)
+    _check_backfilled(db)
+
+    for table, username_column in USERNAME_COLUMNS.items():
+        drop_trigger_if_exists(db, f"trg_{table}_user_id")
+        _switch_foreign_key(db, table, username_column)
+        for index_name in _USERNAME_INDEXES[table]:
+            drop_index_if_exists(db, table, index_name)
+        _switch_columns(db, table, username_column)
+
+    validate_columns = index_columns(db, "auth_tokens", "idx_auth_tokens_validate")
+    if validate_columns != list(_VALIDATE_INDEX):
+        drop_index = "DROP INDEX idx_auth_tokens_validate, " if validate_columns else ""
+        db.cursor.execute(
+            f"ALTER TABLE auth_tokens {drop_index}"
+            f"ADD INDEX idx_auth_tokens_validate ({', '.join(_VALIDATE_INDEX)}), "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+
+
+def _check_backfilled(db: DatabaseConnection) -> None:
+    """`user_id` değeri boş satır kalmadığını doğrular."""
+    for table in USERNAME_COLUMNS:
+        db.cursor.execute(f"SELECT COUNT(*) AS missing FROM {table} WHERE user_id IS NULL")
+        row = db.cursor.fetchone() or {}
+        if int(row.get("missing") or 0):
+            raise MigrationError(
+                f"{table}: {row['missing']} satırın user_id değeri doldurulamadı (kullanıcısı yok)."
+            )
+
+
+def _switch_foreign_key(db: DatabaseConnection, table: str, username_column: str) -> None:
+    """Önce `user_id` yabancı anahtarını ekler, sonra kullanıcı adınınkini kaldırır.
+
+    Sıra, arada silinen bir kullanıcının satırlarının hiçbir kısıta
+    takılmadan kalmasını önler.
+    """
+    if not foreign_key_names(db, table, "user_id"):
+        # user_id değerleri users.id'den join ile dolduruldu; kullanıcı adı
+        # yabancı anahtarı da silinen kullanıcının satırlarını siliyor
+        with foreign_key_checks_disabled(db):
+            db.cursor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT fk_{table}_user "
+                "FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE, "
+                "ALGORITHM=INPLACE, LOCK=NONE"
+            )
+
+    for constraint in foreign_key_names(db, table, username_column):
+        db.cursor.execute(f"ALTER TABLE {table} DROP FOREIGN KEY {constraint}")
+
+
+def _switch_columns(db: DatabaseConnection, table: str, username_column: str) -> None:
+    """`user_id`'yi NOT NULL, kullanıcı adını NULL kabul eder yapar."""
+    if table == "spotify_accounts":
+        if column_is_nullable(db, table, "user_id"):
+            # Kullanıcı adı tekilliği birincil anahtardan unique indekse geçer
+            db.cursor.execute(
+                "ALTER TABLE spotify_accounts DROP PRIMARY KEY, "
+                "MODIFY COLUMN user_id INT NOT NULL, ADD PRIMARY KEY (user_id), "
+                "MODIFY COLUMN username VARCHAR(255) NULL, "
+                "ADD UNIQUE INDEX idx_spotify_accounts_username (username), "
+                "ALGORITHM=INPLACE, LOCK=NONE"
+            )
+        # `user_id` unique indeksini artık birincil anahtar karşılar
+        drop_index_if_exists(db, table, "idx_spotify_accounts_user_id")
+        return
+
+    if column_is_nullable(db, table, "user_id"):
+        db.cursor.execute(
+            f"ALTER TABLE {table} MODIFY COLUMN user_id INT NOT NULL, "
+            f"MODIFY COLUMN {username_column} VARCHAR(255) NULL, ALGORITHM=INPLACE, LOCK=NONE"
+        )
+
+
+# =============================================================================
+# Migration v0006 Sonu
+# =============================================================================
@@ -0,0 +1,59 @@
+# =============================================================================
+# Migration v0007: user_id Kolonları - Daraltma (v0007_user_id_contract.py)
+# =============================================================================
+# Genişlet / daralt düzeninin son adımı: kullanıcı adı kolonları
+# (`auth_tokens.username`, `spotify_accounts.username`,
+# `widgets.beatify_username`) ve `spotify_accounts` kullanıcı adı unique
+# indeksi kaldırılır. Bu sürümden sonra tablolar kullanıcıya yalnızca
+# `INT` `user_id` ile bağlıdır; repository'ler kullanıcı adını `users` ile
+# join ederek okur.
+#
+# Kullanıcı adını da yazan önceki sürüm bu şemada çalışmaz; migration, o
+# sürümün tüm worker'ları yeni kodla değiştirildikten sonra çalıştırılır
+# (`db-upgrade --to 6` -> dağıtım -> `db-upgrade`). Kolonlar
+# `ALGORITHM=INPLACE, LOCK=NONE` ile silinir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. DESCRIPTION
+#
+# 3.0  MIGRATION
+#      3.1. upgrade(db)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.migrations.schema_helpers import column_names
+from app.database.migrations.versions.v0004_user_id_expand import USERNAME_COLUMNS
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+DESCRIPTION = "auth_tokens / spotify_accounts / widgets kullanıcı adı kolonları kaldırıldı (contract)"
+
+
+# =============================================================================
+# 3.0 MIGRATION
+# =============================================================================
+
+def upgrade(db: DatabaseConnection) -> None:
+    """Kullanıcı adı kolonlarını (ve yalnızca onları içeren indeksleri) siler."""
+    for table, username_column in USERNAME_COLUMNS.items():
+        if username_column in column_names(db, table):
+            db.cursor.execute(
+                f"ALTER TABLE {table} DROP COLUMN {username_column}, ALGORITHM=INPLACE, LOCK=NONE"
+            )
+
+
+# =============================================================================
+# Migration v0007 Sonu
+# =============================================================================
@@ -1,23 +1,46 @@
 # =============================================================================
 # Migration Yönetim Modülü (migrations_repository.py)
 # =============================================================================
-# Bu modül, uygulama açılışında veritabanı tablolarının oluşturulmasını yöneten
-# `MigrationsRepository` sınıfını içerir.
+# Bu modül, sürümlü şema migration'larını uygulayan `MigrationsRepository`
+# sınıfını içerir.
+#
+# Uygulanan sürümler `schema_migrations` tablosunda tutulur. Açılışta
+# (`ensure_schema`) yalnızca tek bir `SELECT MAX(version)` çalışır; şema
+# güncelse DDL çalıştırılmaz ve sonuç süreç boyunca hatırlanır (aynı süreçte
+# `create_app()` ikinci kez çağrıldığında sorgu da yapılmaz). Şema gerideyse
+# açılışta en fazla baştaki `BOOT_SAFE` migration'lar uygulanır; tablo
+# yeniden oluşturan / veri dolduran adımlar yalnızca `db-upgrade` ile çalışır.
+# Şema bundan sonra da kodun gerektirdiği sürümün (`REQUIRED_SCHEMA_VERSION`)
+# altındaysa `MigrationError` yükseltilir; uygulama yarım şemayla açılmaz.
+#
+# Eksik sürümler uygulanırken MySQL `GET_LOCK` ile kilit alınır; aynı anda
+# açılan worker'lardan yalnızca biri migration çalıştırır, diğerleri kilidi
+# bekleyip güncel sürümü görür.
 #
 # İÇİNDEKİLER:
 # -----------------------------------------------------------------------------
 # 1.0  İÇE AKTARMALAR (IMPORTS)
 #
-# 2.0  SINIFLAR (CLASSES)
-#      2.1. MigrationsRepository
-#           2.1.1. __init__(db_connection=None)
-#           2.1.2. create_all_tables()
-#           2.1.3. create_users_table()
-#           2.1.4. create_auth_tokens_table()
-#           2.1.5. create_spotify_accounts_table()
-#           2.1.6. create_widgets_table()
-#           2.1.7. _ensure_connection()
-#           2.1.8. _close_if_owned()
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _LOCK_NAME
+#      2.3. _ER_NO_SUCH_TABLE
+#      2.4. _schema_ready / _schema_ready_lock
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. MigrationsRepository
+#           3.1.1. __init__(db_connection=None)
+#           3.1.2. ensure_schema(auto_upgrade=True)
+#           3.1.3. current_version()
+#           3.1.4. pending_migrations()
+#           3.1.5. applied_migrations()
+#           3.1.6. upgrade(target=None, lock_timeout=None)
+#           3.1.7. create_all_tables()
+#           3.1.8. _apply(migration)
+#           3.1.9. _create_version_table()
+#           3.1.10. _read_version()
+#           3.1.11. _acquire_lock(timeout) / _release_lock()
+#           3.1.12. _ensure_connection() / _close_if_owned()
 # =============================================================================
 
 # =============================================================================
@@ -25,25 +48,49 @@
 # =============================================================================
 
 # Standart kütüphane
-from typing import Optional
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
 # Üçüncü parti
 from mysql.connector import Error as MySQLError
 
 # Uygulama içi
+from app.config.config import MIGRATIONS_CONFIG
 from app.database.db_connection import DatabaseConnection
-from app.database.migrations.auth_tokens_table import create_auth_tokens_table
-from app.database.migrations.spotify_accounts_table import create_spotify_accounts_table
-from app.database.migrations.users_table import create_users_table
-from app.database.migrations.widgets_table import create_widgets_table
+from app.database.migrations.registry import (
+    REQUIRED_SCHEMA_VERSION,
+    Migration,
+    MigrationError,
+    latest_version,
+    load_migrations,
+)
 
 
 # =============================================================================
-# 2.0 SINIFLAR (CLASSES)
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Migration'ları worker'lar arasında sıraya sokan MySQL advisory kilidi
+_LOCK_NAME: str = "beatify:schema_migrations"
+
+# MySQL: tablo yok (schema_migrations henüz oluşturulmamış)
+_ER_NO_SUCH_TABLE: int = 1146
+
+# Bu süreçte şemanın güncel olduğu doğrulandı mı
+_schema_ready: bool = False
+_schema_ready_lock = threading.Lock()
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
 # =============================================================================
 
 class MigrationsRepository:
-    """Uygulama açılışında tüm tabloların oluşturulmasını yöneten sınıf."""
+    """Sürümlü şema migration'larını uygulayan ve şema sürümünü okuyan sınıf."""
 
     def __init__(self, db_connection: Optional[DatabaseConnection] = None) -> None:
         """MigrationsRepository sınıfını başlatır.
@@ -58,14 +105,123 @@ class MigrationsRepository:
             self.db = DatabaseConnection()
             self.own_connection = True
 
-    def create_all_tables(self) -> None:
-        """Tüm veritabanı tablolarının oluşturulmasını sağlar."""
+    def ensure_schema(self, auto_upgrade: bool = True) -> bool:
+        """Açılış kontrolü: şema güncel mi, değilse (izin varsa) günceller.
+
+        Açılışta yalnızca baştaki `boot_safe` migration'lar uygulanır; ilk
+        `boot_safe` olmayan migration'da durulur, kalanlar `db-upgrade` bekler.
+
+        Args:
+            auto_upgrade: False ise hiçbir migration uygulanmaz.
+
+        Returns:
+            Şema güncelse True; kodun çalışabildiği ama daha yeni sürümlerin
+            beklediği durumda False (uyarı loglanır).
+
+        Raises:
+            MigrationError: Şema `REQUIRED_SCHEMA_VERSION`'ın altında kaldıysa.
+        """
+        global _schema_ready
+        if _schema_ready:
+            return True
+
+        with _schema_ready_lock:
+            if _schema_ready:
+                return True
+            target = latest_version()
+            current = self.current_version()
+            if current >= target:
+                _schema_ready = True
+                return True
+
+            boot_target = current
+            if auto_upgrade:
+                for migration in load_migrations():
+                    if migration.version <= current:
+                        continue
+                    if not migration.boot_safe:
+                        break
+                    boot_target = migration.version
+            if boot_target > current:
+                self.upgrade(target=boot_target)
+                current = self.current_version()
+
+            if current < REQUIRED_SCHEMA_VERSION:
+                raise MigrationError(
+                    f"Veritabanı şema sürümü {current}, uygulama en az {REQUIRED_SCHEMA_VERSION} gerektiriyor. "
+                    "`flask --app app.main db-upgrade` ile güncelleyin."
+                )
+            if current < target:
+                logger.warning(
+                    "Veritabanı şeması güncel değil (sürüm %s, beklenen %s). "
+                    "`flask --app app.main db-upgrade` ile güncelleyin.",
+                    current, target,
+                )
+                return False
+
+            _schema_ready = True
+            return True
+
+    def current_version(self) -> int:
+        """Uygulanmış en yüksek şema sürümünü döndürür (hiç yoksa 0)."""
+        self._ensure_connection()
+        try:
+            return self._read_version()
+        finally:
+            self._close_if_owned()
+
+    def pending_migrations(self) -> List[Migration]:
+        """Henüz uygulanmamış migration'ları sırayla döndürür."""
+        current = self.current_version()
+        return [migration for migration in load_migrations() if migration.version > current]
+
+    def applied_migrations(self) -> List[Dict[str, Any]]:
+        """`schema_migrations` kayıtlarını sürüm sırasına göre döndürür."""
+        self._ensure_connection()
+        try:
+            self.db.cursor.execute(
+                "SELECT version, description, applied_at, execution_ms FROM schema_migrations ORDER BY version"
+            )
+            return list(self.db.cursor.fetchall() or [])
+        except MySQLError as exc:
+            if exc.errno == _ER_NO_SUCH_TABLE:
+                return []
+            raise
+        finally:
+            self._close_if_owned()
+
+    def upgrade(self, target: Optional[int] = None, lock_timeout: Optional[int] = None) -> List[Migration]:
+        """Eksik migration'ları sırayla uygular.
+
+        Args:
+            target: Bu sürüme kadar uygular; verilmezse en yeni sürüme kadar.
+            lock_timeout: Migration kilidi için bekleme süresi (saniye).
+
+        Returns:
+            Bu çağrıda uygulanan migration'lar.
+        """
+        if lock_timeout is None:
+            lock_timeout = int(MIGRATIONS_CONFIG["lock_timeout"])
+
         self._ensure_connection()
         try:
-            self.create_users_table()
-            self.create_auth_tokens_table()
-            self.create_spotify_accounts_table()
-            self.create_widgets_table()
+            self._create_version_table()
+            if not self._acquire_lock(lock_timeout):
+                raise MigrationError(f"Migration kilidi {lock_timeout} saniyede alınamadı.")
+            try:
+                # Kilidi beklerken başka bir worker uygulamış olabilir
+                current = self._read_version()
+                applied: List[Migration] = []
+                for migration in load_migrations():
+                    if migration.version <= current:
+                        continue
+                    if target is not None and migration.version > target:
+                        break
+                    self._apply(migration)
+                    applied.append(migration)
+                return applied
+            finally:
+                self._release_lock()
         except MySQLError:
             if self.db.connection and self.db.connection.is_connected():
                 self.db.connection.rollback()
@@ -73,25 +229,71 @@ class MigrationsRepository:
         finally:
             self._close_if_owned()
 
-    def create_users_table(self) -> None:
-        """`users` tablosunu oluşturur."""
-        create_users_table(self.db)
+    def create_all_tables(self) -> None:
+        """Şemayı en yeni sürüme getirir (`upgrade()` ile aynı)."""
+        self.upgrade()
 
-    def create_auth_tokens_table(self) -> None:
-        """`auth_tokens` tablosunu oluşturur."""
-        create_auth_tokens_table(self.db)
+    # -------------------------------------------------------------------------
+    # 3.2. Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
 
-    def create_spotify_accounts_table(self) -> None:
-        """`spotify_accounts` tablosunu oluşturur."""
-        create_spotify_accounts_table(self.db)
+    def _apply(self, migration: Migration) -> None:
+        """Tek bir migration'ı uygular ve sürümünü kaydeder.
 
-    def create_widgets_table(self) -> None:
-        """`widgets` tablosunu oluşturur."""
-        create_widgets_table(self.db)
+        MySQL'de DDL örtük commit yaptığı için sürüm kaydı, migration
+        tamamlandıktan sonra ayrı olarak yazılır; yarıda kalan bir migration
+        kaydedilmez ve bir sonraki çalıştırmada yeniden denenir (migration'lar
+        bu nedenle tekrar çalıştırılabilir yazılır).
+        """
+        logger.info("Migration uygulanıyor: v%04d %s", migration.version, migration.description)
+        started = time.monotonic()
+        migration.upgrade(self.db)
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        self.db.cursor.execute(
+            "INSERT INTO schema_migrations (version, description, execution_ms) VALUES (%s, %s, %s)",
+            (migration.version, migration.description[:255], elapsed_ms),
+        )
+        self.db.connection.commit()
+        logger.info("Migration uygulandı: v%04d (%d ms)", migration.version, elapsed_ms)
 
-    # -------------------------------------------------------------------------
-    # 2.2. Dahili yardımcılar (Internal helpers)
-    # -------------------------------------------------------------------------
+    def _create_version_table(self) -> None:
+        """`schema_migrations` tablosunu (yoksa) oluşturur."""
+        self.db.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                description VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                execution_ms INT NOT NULL DEFAULT 0
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+            """
+        )
+        self.db.connection.commit()
+
+    def _read_version(self) -> int:
+        """Sürüm tablosundan en yüksek sürümü okur (tablo yoksa 0)."""
+        try:
+            self.db.cursor.execute("SELECT MAX(version) AS version FROM schema_migrations")
+            row = self.db.cursor.fetchone()
+        except MySQLError as exc:
+            if exc.errno == _ER_NO_SUCH_TABLE:
+                return 0
+            raise
+        return int(row["version"]) if row and row.get("version") is not None else 0
+
+    def _acquire_lock(self, timeout: int) -> bool:
+        """Migration kilidini alır; alınamazsa False döner."""
+        self.db.cursor.execute("SELECT GET_LOCK(%s, %s) AS acquired", (_LOCK_NAME, max(0, int(timeout))))
+        row = self.db.cursor.fetchone()
+        return bool(row and row.get("acquired") == 1)
+
+    def _release_lock(self) -> None:
+        """Migration kilidini bırakır (bağlantı havuza dönmeden önce)."""
+        try:
+            self.db.cursor.execute("SELECT RELEASE_LOCK(%s) AS released", (_LOCK_NAME,))
+            self.db.cursor.fetchone()
+        except MySQLError as exc:
+            logger.warning("Migration kilidi bırakılamadı: %s", exc)
 
     def _ensure_connection(self) -> None:
         """Veritabanı bağlantısının açık olduğundan emin olur."""
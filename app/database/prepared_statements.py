@@ -0,0 +1,162 @@
+# =============================================================================
+# Prepared Statement Önbelleği Modülü (prepared_statements.py)
+# =============================================================================
+# Bu modül, tek bir MySQL bağlantısına ait sunucu tarafı prepared statement'ları
+# tutan `PreparedStatementCache` sınıfını içerir.
+#
+# Sık çalışan sorgular (`DatabaseConnection.fetch_prepared()`) metin protokolü
+# yerine binary protokolle çalıştırılır: sorgu bağlantı başına bir kez
+# PREPARE edilir, sonraki çalıştırmalarda yalnızca statement id ve
+# parametreler gönderilir (sunucu sorguyu yeniden parse etmez).
+#
+# Prepared statement'lar sunucuda bağlantıya aittir; bu yüzden önbellek
+# havuzdaki fiziksel bağlantıyla (`_PooledConnection`) birlikte yaşar ve
+# bağlantı kapanınca statement'lar da sunucuda serbest kalır. Önbellek
+# boyutu sınırlıdır (LRU); taşan statement kapatılır (DEALLOCATE).
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _ER_MAX_PREPARED_STMT_COUNT_REACHED
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. PreparedStatementCache
+#           3.1.1. __init__(connection, max_size)
+#           3.1.2. fetch_all(sql, params, dictionary=False)
+#           3.1.3. close()
+#           3.1.4. stats()
+#           3.1.5. _cursor_for(key)
+#           3.1.6. _evict(key)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Üçüncü parti
+from mysql.connector import Error as MySQLError
+from mysql.connector import MySQLConnection
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Sunucudaki `max_prepared_stmt_count` sınırına ulaşıldı
+_ER_MAX_PREPARED_STMT_COUNT_REACHED: int = 1461
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class PreparedStatementCache:
+    """Bir bağlantının prepared statement cursor'larını sorgu metnine göre tutar.
+
+    mysql-connector'da her prepared cursor tek bir statement'ı hazır tutar;
+    bu yüzden sorgu başına bir cursor saklanır. Thread-safe değildir: bağlantı
+    gibi aynı anda tek bir `DatabaseConnection` tarafından kullanılır.
+    """
+
+    __slots__ = ("connection", "max_size", "_cursors", "_hits", "_prepares", "_fallbacks")
+
+    def __init__(self, connection: MySQLConnection, max_size: int = 32) -> None:
+        """
+        Args:
+            connection: Statement'ların hazırlanacağı MySQL bağlantısı.
+            max_size: Bağlantı başına tutulacak en fazla statement sayısı.
+        """
+        self.connection: MySQLConnection = connection
+        self.max_size: int = max(1, int(max_size))
+        # (sorgu, dictionary) -> (sorgu metni nesnesi, prepared cursor)
+        self._cursors: "OrderedDict[Tuple[str, bool], Tuple[str, Any]]" = OrderedDict()
+        self._hits: int = 0
+        self._prepares: int = 0
+        self._fallbacks: int = 0
+
+    def fetch_all(self, sql: str, params: Sequence[Any] = (), dictionary: bool = False) -> List[Any]:
+        """Sorguyu prepared statement ile çalıştırır ve tüm satırları döndürür.
+
+        Prepared cursor'lar buffered değildir; sonuç burada tamamen okunur ki
+        aynı bağlantıdaki sonraki sorgularda "Unread result found" oluşmasın.
+        Sunucu statement sınırına ulaşılmışsa sorgu metin protokolüyle çalışır.
+
+        Raises:
+            MySQLError: Sorgu hatası (ilgili statement önbellekten çıkarılır).
+        """
+        key = (sql, dictionary)
+        prepared_sql, cursor = self._cursor_for(key)
+        try:
+            # İlk çalıştırmada PREPARE edilir; cursor, statement'ı yeniden
+            # hazırlamamak için aynı metin nesnesini bekler
+            cursor.execute(prepared_sql, tuple(params))
+            return cursor.fetchall()
+        except MySQLError as e:
+            self._evict(key)
+            if getattr(e, "errno", None) != _ER_MAX_PREPARED_STMT_COUNT_REACHED:
+                raise
+
+        self._fallbacks += 1
+        logger.warning("max_prepared_stmt_count sınırına ulaşıldı; sorgu metin protokolüyle çalıştırılıyor.")
+        cursor = self.connection.cursor(dictionary=dictionary, buffered=True)
+        try:
+            cursor.execute(sql, tuple(params))
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def close(self) -> None:
+        """Tüm statement'ları kapatır (bağlantı açık kalır)."""
+        for key in list(self._cursors):
+            self._evict(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Önbelleğin anlık durumunu döndürür."""
+        return {
+            "statements": len(self._cursors),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "prepares": self._prepares,
+            "fallbacks": self._fallbacks,
+        }
+
+    def _cursor_for(self, key: Tuple[str, bool]) -> Tuple[str, Any]:
+        """Sorgunun prepared cursor'ını döndürür; yoksa oluşturur."""
+        cached: Optional[Tuple[str, Any]] = self._cursors.get(key)
+        if cached is not None:
+            self._cursors.move_to_end(key)
+            self._hits += 1
+            return cached
+
+        sql, dictionary = key
+        cached = (sql, self.connection.cursor(prepared=True, dictionary=dictionary))
+        self._prepares += 1
+        self._cursors[key] = cached
+        while len(self._cursors) > self.max_size:
+            self._evict(next(iter(self._cursors)))
+        return cached
+
+    def _evict(self, key: Tuple[str, bool]) -> None:
+        """Statement'ı önbellekten çıkarır ve sunucuda kapatır."""
+        cached = self._cursors.pop(key, None)
+        if cached is None:
+            return
+        try:
+            cached[1].close()
+        except (MySQLError, ReferenceError):
+            pass
+
+
+# =============================================================================
+# Prepared Statement Önbelleği Modülü Sonu
+# =============================================================================
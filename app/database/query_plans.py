@@ -0,0 +1,203 @@
+# =============================================================================
+# Sorgu Planı Kontrol Modülü (query_plans.py)
+# =============================================================================
+# Bu modül, repository'lerdeki sık çalışan sorguları `EXPLAIN` ile çalıştırıp
+# her birinin bir indeks kullandığını (tam tablo taraması ve gereksiz
+# filesort yapmadığını) doğrular.
+#
+# Sorgu metinleri doğrudan repository modüllerinden alınır; repository'deki
+# sorgu değişirse kontrol de aynı metni kullanır. Örnek parametreler tablodaki
+# gerçek bir satırdan okunur (tablo boşsa yer tutucu değerler kullanılır).
+#
+# Not: Çok küçük tablolarda optimizer tam taramayı daha ucuz bulabilir;
+# kontrol üretim benzeri veriyle çalıştırıldığında anlamlıdır.
+#
+# Kullanım: `flask --app app.main db-explain` (başarısız sorgu varsa çıkış kodu 1)
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. _CONST_TABLE_MARKERS
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. HotQuery
+#
+# 4.0  SORGU LİSTESİ (QUERY LIST)
+#      4.1. HOT_QUERIES
+#
+# 5.0  FONKSİYONLAR (FUNCTIONS)
+#      5.1. check_hot_queries(db)
+#      5.2. explain_query(db, query, params)
+#      5.3. _sample_values(db)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.repositories.auth_token_repository import SQL_DEACTIVATE_USER_TOKENS, SQL_VALIDATE_AUTH_TOKEN
+from app.database.repositories.widget_repository import (
+    SQL_WIDGET_BY_USERNAME_AND_TYPE,
+    SQL_WIDGET_ENTRY_BY_TOKEN,
+    SQL_WIDGET_TOKEN_BY_USERNAME,
+    SQL_WIDGETS_BY_USERNAME,
+)
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+# Eşleşme olmadığında optimizer unique indeksle sonucu plan aşamasında bulur;
+# EXPLAIN'de `key` boş görünür ama tablo taranmaz.
+_CONST_TABLE_MARKERS: Tuple[str, ...] = (
+    "no matching row in const table",
+    "Impossible WHERE noticed after reading const tables",
+)
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class HotQuery:
+    """EXPLAIN ile kontrol edilen tek bir sık sorgu."""
+
+    def __init__(
+        self,
+        name: str,
+        table: str,
+        sql: str,
+        params: Callable[[Dict[str, Any]], Sequence[Any]],
+        forbid_filesort: bool = False,
+    ) -> None:
+        """
+        Args:
+            name: Repository metodu (raporda görünür).
+            table: Planında indeks aranacak tablo (EXPLAIN'deki ad; join'lerde takma ad).
+            sql: Repository'deki sorgu metni.
+            params: Örnek değerlerden sorgu parametrelerini üretir.
+            forbid_filesort: ORDER BY indeksle karşılanmalıysa True.
+        """
+        self.name: str = name
+        self.table: str = table
+        self.sql: str = sql
+        self.params: Callable[[Dict[str, Any]], Sequence[Any]] = params
+        self.forbid_filesort: bool = forbid_filesort
+
+
+# =============================================================================
+# 4.0 SORGU LİSTESİ (QUERY LIST)
+# =============================================================================
+
+HOT_QUERIES: Tuple[HotQuery, ...] = (
+    HotQuery(
+        "SpotifyWidgetRepository.get_widget_by_username_and_type", "w",
+        SQL_WIDGET_BY_USERNAME_AND_TYPE, lambda s: (s["username"], s["widget_type"]),
+    ),
+    HotQuery(
+        "SpotifyWidgetRepository.get_widgets_by_username", "w",
+        SQL_WIDGETS_BY_USERNAME, lambda s: (s["username"],), forbid_filesort=True,
+    ),
+    HotQuery(
+        "SpotifyWidgetRepository.get_widget_token_by_username", "w",
+        SQL_WIDGET_TOKEN_BY_USERNAME, lambda s: (s["username"],),
+    ),
+    HotQuery(
+        "SpotifyWidgetRepository.get_widget_entry_by_token", "w",
+        SQL_WIDGET_ENTRY_BY_TOKEN, lambda s: (s["widget_token"],),
+    ),
+    HotQuery(
+        "BeatifyTokenRepository.validate_auth_token", "t",
+        SQL_VALIDATE_AUTH_TOKEN, lambda s: (s["auth_token"],),
+    ),
+    HotQuery(
+        "BeatifyTokenRepository.deactivate_all_user_tokens", "auth_tokens",
+        SQL_DEACTIVATE_USER_TOKENS, lambda s: (s["auth_username"],),
+    ),
+)
+
+
+# =============================================================================
+# 5.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def check_hot_queries(db: DatabaseConnection) -> List[Dict[str, Any]]:
+    """Her sık sorguyu EXPLAIN eder ve indeks kullanımını raporlar.
+
+    Returns:
+        Sorgu başına `{"name", "table", "type", "key", "rows", "extra", "ok", "reason"}`.
+    """
+    db.ensure_connection()
+    samples = _sample_values(db)
+    report: List[Dict[str, Any]] = []
+    for query in HOT_QUERIES:
+        plan = explain_query(db, query.sql, query.params(samples))
+        row = next((r for r in plan if r.get("table") == query.table), plan[0] if plan else {})
+        extra = str(row.get("Extra") or "")
+        access = row.get("type")
+        key = row.get("key")
+
+        reason = ""
+        if any(marker in extra for marker in _CONST_TABLE_MARKERS):
+            pass
+        elif not key or access == "ALL":
+            reason = "indeks kullanılmıyor (tam tablo taraması)"
+        elif query.forbid_filesort and "Using filesort" in extra:
+            reason = "ORDER BY indeksle karşılanmıyor (filesort)"
+
+        report.append({
+            "name": query.name,
+            "table": query.table,
+            "type": access,
+            "key": key,
+            "rows": row.get("rows"),
+            "extra": extra,
+            "ok": not reason,
+            "reason": reason,
+        })
+    return report
+
+
+def explain_query(db: DatabaseConnection, query: str, params: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Sorgunun EXPLAIN çıktısını satır listesi olarak döndürür (sorgu çalıştırılmaz)."""
+    db.cursor.execute("EXPLAIN " + query.strip(), tuple(params))
+    return list(db.cursor.fetchall() or [])
+
+
+def _sample_values(db: DatabaseConnection) -> Dict[str, Any]:
+    """EXPLAIN parametreleri için tablolardan gerçek birer değer okur."""
+    samples: Dict[str, Any] = {
+        "username": "__explain__",
+        "widget_type": "__explain__",
+        "widget_token": "__explain__",
+        "auth_token": "__explain__",
+        "auth_username": "__explain__",
+    }
+    db.cursor.execute(
+        "SELECT u.username, w.widget_type, w.widget_token FROM widgets w JOIN users u ON u.id = w.user_id LIMIT 1"
+    )
+    widget = db.cursor.fetchone()
+    if widget:
+        samples.update(
+            username=widget["username"],
+            widget_type=widget["widget_type"],
+            widget_token=widget["widget_token"],
+        )
+    db.cursor.execute("SELECT t.token, u.username FROM auth_tokens t JOIN users u ON u.id = t.user_id LIMIT 1")
+    token = db.cursor.fetchone()
+    if token:
+        samples.update(auth_token=token["token"], auth_username=token["username"])
+    return samples
+
+
+# =============================================================================
+# Sorgu Planı Kontrol Modülü Sonu
+# =============================================================================
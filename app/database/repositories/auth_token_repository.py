@@ -8,15 +8,16 @@
 # -----------------------------------------------------------------------------
 # 1.0  İÇE AKTARMALAR (IMPORTS)
 #
-# 2.0  SINIFLAR (CLASSES)
-#      2.1. BeatifyTokenRepository
-#           2.1.1. __init__(db_connection=None)
-#           2.1.2. store_auth_token(username, token, expires_at)
-#           2.1.3. validate_auth_token(token)
-#           2.1.4. deactivate_auth_token(username, token)
-#           2.1.5. deactivate_all_user_tokens(username)
-#           2.1.6. _ensure_connection()
-#           2.1.7. _close_if_owned()
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. Sık sorgular (SQL_*)
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. BeatifyTokenRepository
+#           3.1.1. __init__(db_connection=None)
+#           3.1.2. store_auth_token(username, token, expires_at)
+#           3.1.3. validate_auth_token(token)
+#           3.1.4. deactivate_auth_token(username, token)
+#           3.1.5. deactivate_all_user_tokens(username)
 # =============================================================================
 
 # =============================================================================
@@ -32,13 +33,33 @@ from mysql.connector import Error as MySQLError
 
 # Uygulama içi
 from app.database.db_connection import DatabaseConnection
+from app.database.repositories.base_repository import USER_ID_BY_USERNAME, BaseRepository
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+# Sık çalışan sorgular; `app.database.query_plans` aynı metinleri EXPLAIN ile
+# kontrol eder (idx_auth_tokens_validate / idx_auth_tokens_user_active).
+# Token'lar kullanıcıya `user_id` ile bağlıdır; kullanıcı adı `users`'tan okunur.
+# Her korumalı istekte çalışan SQL_VALIDATE_AUTH_TOKEN prepared statement'tır.
+SQL_VALIDATE_AUTH_TOKEN: str = """
+    SELECT u.username
+    FROM auth_tokens t JOIN users u ON u.id = t.user_id
+    WHERE t.token = %s AND t.expires_at > NOW() AND t.expired_at IS NULL
+"""
+
+SQL_DEACTIVATE_USER_TOKENS: str = (
+    f"UPDATE auth_tokens SET expired_at = NOW() WHERE user_id = {USER_ID_BY_USERNAME} AND expired_at IS NULL"
+)
 
 
 # =============================================================================
-# 2.0 SINIFLAR (CLASSES)
+# 3.0 SINIFLAR (CLASSES)
 # =============================================================================
 
-class BeatifyTokenRepository:
+class BeatifyTokenRepository(BaseRepository):
     """Kullanıcı kimlik doğrulama token'larını yöneten repository sınıfı."""
 
     def __init__(self, db_connection: Optional[DatabaseConnection] = None) -> None:
@@ -47,18 +68,16 @@ class BeatifyTokenRepository:
         Args:
             db_connection: Mevcut veritabanı bağlantısı.
         """
-        if db_connection:
-            self.db: DatabaseConnection = db_connection
-            self.own_connection: bool = False
-        else:
-            self.db = DatabaseConnection()
-            self.own_connection = True
+        super().__init__(db_connection)
 
     def store_auth_token(self, username: str, token: str, expires_at: datetime) -> bool:
         """Yeni bir kimlik doğrulama token'ını veritabanına kaydeder."""
         self._ensure_connection()
         try:
-            query = "INSERT INTO auth_tokens (username, token, expires_at) VALUES (%s, %s, %s)"
+            query = f"""
+                INSERT INTO auth_tokens (user_id, token, expires_at)
+                VALUES ({USER_ID_BY_USERNAME}, %s, %s)
+            """
             expires_at_str = expires_at.strftime("%Y-%m-%d %H:%M:%S")
             self.db.cursor.execute(query, (username, token, expires_at_str))
             self.db.connection.commit()
@@ -77,17 +96,8 @@ class BeatifyTokenRepository:
         """
         self._ensure_connection()
         try:
-            query = """
-                SELECT username FROM auth_tokens
-                WHERE token = %s AND expires_at > NOW() AND expired_at IS NULL
-            """
-            self.db.cursor.execute(query, (token,))
-            result = self.db.cursor.fetchone()
-
-            if result:
-                return result.get("username")
-
-            return None
+            rows = self.db.fetch_prepared(SQL_VALIDATE_AUTH_TOKEN, (token,))
+            return rows[0][0] if rows else None
         except MySQLError:
             return None
         finally:
@@ -97,7 +107,10 @@ class BeatifyTokenRepository:
         """Belirli bir kullanıcının belirli bir token'ını geçersiz kılar (logout)."""
         self._ensure_connection()
         try:
-            query = "UPDATE auth_tokens SET expired_at = NOW() WHERE token = %s AND username = %s AND expired_at IS NULL"
+            query = f"""
+                UPDATE auth_tokens SET expired_at = NOW()
+                WHERE token = %s AND user_id = {USER_ID_BY_USERNAME} AND expired_at IS NULL
+            """
             self.db.cursor.execute(query, (token, username))
             self.db.connection.commit()
 
@@ -116,8 +129,7 @@ class BeatifyTokenRepository:
         """Bir kullanıcının tüm aktif token'larını geçersiz kılar (tüm cihazlardan çıkış)."""
         self._ensure_connection()
         try:
-            query = "UPDATE auth_tokens SET expired_at = NOW() WHERE username = %s AND expired_at IS NULL"
-            self.db.cursor.execute(query, (username,))
+            self.db.cursor.execute(SQL_DEACTIVATE_USER_TOKENS, (username,))
             self.db.connection.commit()
             return self.db.cursor.rowcount > 0
         except MySQLError:
@@ -127,19 +139,6 @@ class BeatifyTokenRepository:
         finally:
             self._close_if_owned()
 
-    # -------------------------------------------------------------------------
-    # 2.2. Dahili yardımcılar (Internal helpers)
-    # -------------------------------------------------------------------------
-
-    def _ensure_connection(self) -> None:
-        """Veritabanı bağlantısını kontrol eder."""
-        self.db.ensure_connection()
-
-    def _close_if_owned(self) -> None:
-        """Bağlantıyı bu sınıf oluşturduysa kapatır."""
-        if self.own_connection:
-            self.db.close()
-
 
 # =============================================================================
 # Auth Token Repository Modülü Sonu
@@ -0,0 +1,109 @@
+# =============================================================================
+# Temel Repository Modülü (base_repository.py)
+# =============================================================================
+# Bu modül, repository sınıflarının ortak bağlantı çözümleme mantığını içeren
+# `BaseRepository` sınıfını içerir.
+#
+# Bağlantı önceliği:
+#   1) Constructor'a verilen `db_connection` (çağıran yönetir)
+#   2) Aktif Flask isteğine bağlı bağlantı (teardown hook'u iade eder)
+#   3) İstek dışı kullanım için thread'e özel bağlantı (her çağrıdan sonra iade edilir)
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. USER_ID_BY_USERNAME
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. BaseRepository
+#           3.1.1. __init__(db_connection=None)
+#           3.1.2. db
+#           3.1.3. own_connection
+#           3.1.4. _ensure_connection()
+#           3.1.5. _close_if_owned()
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import threading
+from typing import Optional
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+from app.database.request_scope import get_request_connection, has_request_connection_scope
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+# `auth_tokens`, `spotify_accounts` ve `widgets` kullanıcıya `users.id` ile
+# bağlıdır; kullanıcı adı alan yazma/güncelleme sorguları id'yi bu alt sorguyla
+# (users.username unique indeksi) çözer. Kullanıcı adı kolonları v0006'dan
+# itibaren yazılmaz, v0007'de silinir; okumalar `users` ile join eder.
+USER_ID_BY_USERNAME: str = "(SELECT id FROM users WHERE username = %s)"
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class BaseRepository:
+    """Repository sınıfları için thread-safe bağlantı çözümlemesi sağlar."""
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None) -> None:
+        """BaseRepository sınıfını başlatır.
+
+        Args:
+            db_connection: Mevcut veritabanı bağlantısı. Verilirse kapatılması
+                çağıranın sorumluluğundadır.
+        """
+        self._explicit_db: Optional[DatabaseConnection] = db_connection
+        self._thread_local = threading.local()
+
+    @property
+    def db(self) -> DatabaseConnection:
+        """Bu çağrı için kullanılacak veritabanı bağlantısını döndürür."""
+        if self._explicit_db is not None:
+            return self._explicit_db
+
+        request_db = get_request_connection()
+        if request_db is not None:
+            return request_db
+
+        thread_db: Optional[DatabaseConnection] = getattr(self._thread_local, "db", None)
+        if thread_db is None:
+            thread_db = DatabaseConnection()
+            self._thread_local.db = thread_db
+        return thread_db
+
+    @property
+    def own_connection(self) -> bool:
+        """Bağlantının her çağrıdan sonra bu sınıf tarafından kapatılıp kapatılmayacağı."""
+        return self._explicit_db is None and not has_request_connection_scope()
+
+    # Geriye dönük uyumluluk: bazı repository'ler alt çizgili adı kullanıyordu.
+    _own_connection = own_connection
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    def _ensure_connection(self) -> None:
+        """Veritabanı bağlantısını kontrol eder."""
+        self.db.ensure_connection()
+
+    def _close_if_owned(self) -> None:
+        """Bağlantıyı bu sınıf oluşturduysa kapatır."""
+        if self.own_connection:
+            self.db.close()
+
+
+# =============================================================================
+# Temel Repository Modülü Sonu
+# =============================================================================
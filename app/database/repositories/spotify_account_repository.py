@@ -8,16 +8,19 @@
 # -----------------------------------------------------------------------------
 # 1.0  İÇE AKTARMALAR (IMPORTS)
 #
-# 2.0  SINIFLAR (CLASSES)
-#      2.1. SpotifyUserRepository
-#           2.1.1. __init__(db_connection=None)
-#           2.1.2. store_client_info(username, client_id, client_secret)
-#           2.1.3. update_user_connection(username, spotify_user_id, refresh_token)
-#           2.1.4. update_refresh_token(username, new_refresh_token)
-#           2.1.5. get_spotify_user_data(username)
-#           2.1.6. delete_linked_account(username)
-#           2.1.7. _ensure_connection()
-#           2.1.8. _close_if_owned()
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. SQL_SPOTIFY_USER_DATA
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. SpotifyUserRepository
+#           3.1.1. __init__(db_connection=None)
+#           3.1.2. store_client_info(username, client_id, client_secret)
+#           3.1.3. update_user_connection(username, spotify_user_id, refresh_token)
+#           3.1.4. update_refresh_token(username, new_refresh_token)
+#           3.1.5. get_spotify_user_data(username)
+#           3.1.6. delete_linked_account(username)
+#           3.1.7. store_access_token(username, access_token, expires_at)
+#           3.1.8. get_access_token(username)
 # =============================================================================
 
 # =============================================================================
@@ -33,14 +36,29 @@ from mysql.connector import Error as MySQLError
 
 # Uygulama içi
 from app.database.db_connection import DatabaseConnection
+from app.database.repositories.base_repository import USER_ID_BY_USERNAME, BaseRepository
 from app.database.repositories.user_repository import BeatifyUserRepository
 
 
 # =============================================================================
-# 2.0 SINIFLAR (CLASSES)
+# 2.0 SABİTLER (CONSTANTS)
 # =============================================================================
 
-class SpotifyUserRepository:
+# Spotify token yenileme ve widget akışlarında sık çalışır; prepared statement
+# olarak bağlantı başına bir kez hazırlanır (`DatabaseConnection.fetch_prepared`).
+SQL_SPOTIFY_USER_DATA: str = """
+    SELECT u.username, sa.spotify_user_id, sa.client_id, sa.client_secret,
+           sa.refresh_token, sa.created_at, sa.updated_at
+    FROM spotify_accounts sa JOIN users u ON u.id = sa.user_id
+    WHERE u.username = %s
+"""
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class SpotifyUserRepository(BaseRepository):
     """Spotify entegrasyon bilgilerini yöneten repository sınıfı."""
 
     def __init__(self, db_connection: Optional[DatabaseConnection] = None) -> None:
@@ -49,20 +67,15 @@ class SpotifyUserRepository:
         Args:
             db_connection: Mevcut veritabanı bağlantısı.
         """
-        if db_connection:
-            self.db: DatabaseConnection = db_connection
-            self.own_connection: bool = False
-        else:
-            self.db = DatabaseConnection()
-            self.own_connection = True
+        super().__init__(db_connection)
 
     def store_client_info(self, username: str, client_id: str, client_secret: str) -> bool:
         """Kullanıcının Spotify Client ID ve Secret bilgilerini kaydeder."""
         self._ensure_connection()
         try:
-            query = """
-                INSERT INTO spotify_accounts (username, client_id, client_secret)
-                VALUES (%s, %s, %s)
+            query = f"""
+                INSERT INTO spotify_accounts (user_id, client_id, client_secret)
+                VALUES ({USER_ID_BY_USERNAME}, %s, %s)
                 ON DUPLICATE KEY UPDATE client_id = VALUES(client_id), client_secret = VALUES(client_secret)
             """
             self.db.cursor.execute(query, (username, client_id, client_secret))
@@ -82,9 +95,9 @@ class SpotifyUserRepository:
         """
         self._ensure_connection()
         try:
-            spotify_query = """
-                INSERT INTO spotify_accounts (username, spotify_user_id, refresh_token)
-                VALUES (%s, %s, %s)
+            spotify_query = f"""
+                INSERT INTO spotify_accounts (user_id, spotify_user_id, refresh_token)
+                VALUES ({USER_ID_BY_USERNAME}, %s, %s)
                 ON DUPLICATE KEY UPDATE spotify_user_id = VALUES(spotify_user_id),
                                         refresh_token = VALUES(refresh_token)
             """
@@ -111,7 +124,7 @@ class SpotifyUserRepository:
         """Süresi dolan veya yenilenen refresh token'ı günceller."""
         self._ensure_connection()
         try:
-            query = "UPDATE spotify_accounts SET refresh_token = %s WHERE username = %s"
+            query = f"UPDATE spotify_accounts SET refresh_token = %s WHERE user_id = {USER_ID_BY_USERNAME}"
             self.db.cursor.execute(query, (new_refresh_token, username))
             self.db.connection.commit()
             if self.db.cursor.rowcount > 0:
@@ -128,18 +141,12 @@ class SpotifyUserRepository:
         """Kullanıcının Spotify hesap verilerini döndürür."""
         self._ensure_connection()
         try:
-            query = """
-                SELECT username, spotify_user_id, client_id, client_secret,
-                       refresh_token, created_at, updated_at
-                FROM spotify_accounts
-                WHERE username = %s
-            """
-            self.db.cursor.execute(query, (username,))
-            spotify_data = self.db.cursor.fetchone()
-
-            if not spotify_data:
+            rows = self.db.fetch_prepared(SQL_SPOTIFY_USER_DATA, (username,), dictionary=True)
+            if not rows:
                 return None
 
+            spotify_data = rows[0]
+
             if isinstance(spotify_data.get("created_at"), datetime):
                 spotify_data["created_at"] = spotify_data["created_at"].strftime("%Y-%m-%d %H:%M:%S")
             if isinstance(spotify_data.get("updated_at"), datetime):
@@ -155,10 +162,11 @@ class SpotifyUserRepository:
         """Spotify bağlantısını kaldırır (verileri siler) ve user tablosunu günceller."""
         self._ensure_connection()
         try:
-            spotify_query = """
+            spotify_query = f"""
                 UPDATE spotify_accounts
-                SET spotify_user_id = NULL, refresh_token = NULL
-                WHERE username = %s
+                SET spotify_user_id = NULL, refresh_token = NULL,
+                    access_token = NULL, access_token_expires_at = NULL
+                WHERE user_id = {USER_ID_BY_USERNAME}
             """
             self.db.cursor.execute(spotify_query, (username,))
 
@@ -174,18 +182,44 @@ class SpotifyUserRepository:
         finally:
             self._close_if_owned()
 
-    # -------------------------------------------------------------------------
-    # 2.2. Dahili yardımcılar (Internal helpers)
-    # -------------------------------------------------------------------------
-
-    def _ensure_connection(self) -> None:
-        """Veritabanı bağlantısını kontrol eder."""
-        self.db.ensure_connection()
+    def store_access_token(self, username: str, access_token: Optional[str], expires_at: Optional[datetime]) -> bool:
+        """Kullanıcının güncel Spotify access token'ını ve bitiş zamanını kaydeder."""
+        self._ensure_connection()
+        try:
+            query = f"""
+                UPDATE spotify_accounts
+                SET access_token = %s, access_token_expires_at = %s
+                WHERE user_id = {USER_ID_BY_USERNAME}
+            """
+            expires_at_str = expires_at.strftime("%Y-%m-%d %H:%M:%S") if expires_at else None
+            self.db.cursor.execute(query, (access_token, expires_at_str, username))
+            self.db.connection.commit()
+            return self.db.cursor.rowcount > 0
+        except MySQLError:
+            if self.db.connection and self.db.connection.is_connected():
+                self.db.connection.rollback()
+            return False
+        finally:
+            self._close_if_owned()
 
-    def _close_if_owned(self) -> None:
-        """Bağlantıyı bu sınıf oluşturduysa kapatır."""
-        if self.own_connection:
-            self.db.close()
+    def get_access_token(self, username: str) -> Optional[Dict[str, Any]]:
+        """Kullanıcının kayıtlı Spotify access token'ını ve bitiş zamanını döndürür."""
+        self._ensure_connection()
+        try:
+            query = """
+                SELECT sa.access_token, sa.access_token_expires_at, sa.client_id
+                FROM spotify_accounts sa JOIN users u ON u.id = sa.user_id
+                WHERE u.username = %s
+            """
+            self.db.cursor.execute(query, (username,))
+            result = self.db.cursor.fetchone()
+            if not result or not result.get("access_token"):
+                return None
+            return result
+        except MySQLError:
+            return None
+        finally:
+            self._close_if_owned()
 
 
 # =============================================================================
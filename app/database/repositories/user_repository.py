@@ -18,8 +18,6 @@
 #           2.1.6. update_spotify_connection_status(username, status)
 #           2.1.7. update_user_email(username, new_email)
 #           2.1.8. update_profile_image(username, image_filename)
-#           2.1.9. _ensure_connection()
-#           2.1.10. _close_if_owned()
 # =============================================================================
 
 # =============================================================================
@@ -35,13 +33,14 @@ from mysql.connector import Error as MySQLError
 
 # Uygulama içi
 from app.database.db_connection import DatabaseConnection
+from app.database.repositories.base_repository import BaseRepository
 
 
 # =============================================================================
 # 2.0 SINIFLAR (CLASSES)
 # =============================================================================
 
-class BeatifyUserRepository:
+class BeatifyUserRepository(BaseRepository):
     """Kullanıcı veritabanı işlemlerini yöneten repository sınıfı."""
 
     def __init__(self, db_connection: Optional[DatabaseConnection] = None) -> None:
@@ -50,12 +49,7 @@ class BeatifyUserRepository:
         Args:
             db_connection: Mevcut veritabanı bağlantısı.
         """
-        if db_connection:
-            self.db: DatabaseConnection = db_connection
-            self.own_connection: bool = False
-        else:
-            self.db = DatabaseConnection()
-            self.own_connection = True
+        super().__init__(db_connection)
 
     # -------------------------------------------------------------------------
     # 2.1. Kullanıcı CRUD / Query metotları
@@ -170,19 +164,6 @@ class BeatifyUserRepository:
         finally:
             self._close_if_owned()
 
-    # -------------------------------------------------------------------------
-    # 2.2. Dahili yardımcılar (Internal helpers)
-    # -------------------------------------------------------------------------
-
-    def _ensure_connection(self) -> None:
-        """Veritabanı bağlantısını kontrol eder."""
-        self.db.ensure_connection()
-
-    def _close_if_owned(self) -> None:
-        """Bağlantıyı bu sınıf oluşturduysa kapatır."""
-        if self.own_connection:
-            self.db.close()
-
 
 # =============================================================================
 # Kullanıcı Repository Modülü Sonu
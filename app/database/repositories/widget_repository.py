@@ -4,12 +4,18 @@
 # Bu modül, `widgets` tablosu üzerindeki işlemleri yürüten
 # `SpotifyWidgetRepository` sınıfını içerir.
 #
+# Okuma sorguları yalnızca çağıranın ihtiyaç duyduğu kolonları seçer ve tuple
+# cursor ile okur; satırlar dict yerine `__slots__`'lu tiplere
+# (`WidgetSummary`, `WidgetMeta`, `WidgetCacheEntry`) çevrilir. Büyük
+# `config_data` JSON'u yalnızca onu kullanan sorgularda taşınır.
+#
 # İÇİNDEKİLER:
 # -----------------------------------------------------------------------------
 # 1.0  İÇE AKTARMALAR (IMPORTS)
 #
 # 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
 #      2.1. logger
+#      2.2. Sık sorgular (SQL_WIDGET_*)
 #
 # 3.0  SINIFLAR (CLASSES)
 #      3.1. SpotifyWidgetRepository
@@ -22,11 +28,13 @@
 #           3.1.7. get_widget_token_by_username(username)
 #           3.1.8. get_username_by_widget_token(token)
 #           3.1.9. get_data_by_widget_token(token)
-#           3.1.10. update_widget_design_for_user(username, design)
-#           3.1.11. clear_widget_data_for_user(username)
-#           3.1.12. debug_get_all_widgets()
-#           3.1.13. _ensure_connection()
-#           3.1.14. _close_if_owned()
+#           3.1.10. get_widget_entry_by_token(token, strict=False)
+#           3.1.11. get_widget_entries_by_tokens(tokens)
+#           3.1.12. update_widget_design_for_user(username, design)
+#           3.1.13. clear_widget_data_for_user(username)
+#           3.1.14. debug_get_all_widgets()
+#           3.1.15. _parse_config_data(raw)
+#           3.1.16. _config_version(widget_type, config)
 # =============================================================================
 
 # =============================================================================
@@ -34,15 +42,20 @@
 # =============================================================================
 
 # Standart kütüphane
+import copy
+import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 # Üçüncü parti
 from mysql.connector import Error as MySQLError
 
 # Uygulama içi
 from app.database.db_connection import DatabaseConnection
+from app.database.repositories.base_repository import USER_ID_BY_USERNAME, BaseRepository
+from app.database.widget_cache import WidgetCacheEntry, widget_token_cache
+from app.database.widget_rows import WidgetMeta, WidgetSummary
 
 
 # =============================================================================
@@ -51,12 +64,49 @@ from app.database.db_connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+# Sık çalışan sorgular; `app.database.query_plans` aynı metinleri EXPLAIN ile
+# kontrol eder (v0003 indeksleri bu sorguların biçimine göre seçildi).
+# Widget'lar kullanıcıya `user_id` ile bağlıdır; kullanıcı adı `users` ile
+# join edilerek okunur. Token ile yapılan tekil okumalar
+# (SQL_WIDGET_ENTRY_BY_TOKEN, SQL_WIDGET_META_BY_TOKEN) prepared statement
+# olarak çalışır (`DatabaseConnection.fetch_prepared`).
+SQL_WIDGET_BY_USERNAME_AND_TYPE: str = f"""
+    SELECT {WidgetMeta.COLUMNS}
+    FROM widgets w JOIN users u ON u.id = w.user_id
+    WHERE u.username = %s AND w.widget_type = %s AND w.platform = 'spotify'
+"""
+
+SQL_WIDGETS_BY_USERNAME: str = f"""
+    SELECT {WidgetSummary.COLUMNS}
+    FROM widgets w JOIN users u ON u.id = w.user_id
+    WHERE u.username = %s AND w.platform = 'spotify'
+    ORDER BY w.created_at DESC
+"""
+
+SQL_WIDGET_META_BY_TOKEN: str = f"""
+    SELECT {WidgetMeta.COLUMNS}
+    FROM widgets w JOIN users u ON u.id = w.user_id
+    WHERE w.widget_token = %s AND w.platform = 'spotify'
+"""
+
+SQL_WIDGET_TOKEN_BY_USERNAME: str = """
+    SELECT w.widget_token
+    FROM widgets w JOIN users u ON u.id = w.user_id
+    WHERE u.username = %s AND w.platform = 'spotify'
+"""
+
+SQL_WIDGET_ENTRY_BY_TOKEN: str = """
+    SELECT u.username, w.widget_type, w.config_data
+    FROM widgets w JOIN users u ON u.id = w.user_id
+    WHERE w.widget_token = %s AND w.platform = 'spotify'
+"""
+
 
 # =============================================================================
 # 3.0 SINIFLAR (CLASSES)
 # =============================================================================
 
-class SpotifyWidgetRepository:
+class SpotifyWidgetRepository(BaseRepository):
     """Spotify widget konfigürasyonlarını yöneten repository sınıfı."""
 
     def __init__(self, db_connection: Optional[DatabaseConnection] = None) -> None:
@@ -65,12 +115,7 @@ class SpotifyWidgetRepository:
         Args:
             db_connection: Mevcut veritabanı bağlantısı.
         """
-        if db_connection:
-            self.db: DatabaseConnection = db_connection
-            self._own_connection: bool = False
-        else:
-            self.db = DatabaseConnection()
-            self._own_connection = True
+        super().__init__(db_connection)
 
     def store_widget_config(self, config_data: Dict[str, Any]) -> bool:
         """Widget konfigürasyonunu veritabanına kaydeder."""
@@ -85,8 +130,8 @@ class SpotifyWidgetRepository:
             )
             query = """
             INSERT INTO widgets 
-            (beatify_username, widget_token, widget_name, widget_type, config_data, spotify_user_id)
-            VALUES (%(beatify_username)s, %(widget_token)s, %(widget_name)s, %(widget_type)s, %(config_data)s, %(spotify_user_id)s)
+            (user_id, widget_token, widget_name, widget_type, config_data, spotify_user_id)
+            VALUES ((SELECT id FROM users WHERE username = %(beatify_username)s), %(widget_token)s, %(widget_name)s, %(widget_type)s, %(config_data)s, %(spotify_user_id)s)
             ON DUPLICATE KEY UPDATE
                 widget_token = VALUES(widget_token),
                 widget_name = VALUES(widget_name),
@@ -95,6 +140,7 @@ class SpotifyWidgetRepository:
             """
             self.db.cursor.execute(query, config_data)
             self.db.connection.commit()
+            widget_token_cache.invalidate(config_data.get("widget_token"))
             success = self.db.cursor.rowcount > 0
             logger.info(
                 "store_widget_config(): işlem tamamlandı. success=%s, rowcount=%s",
@@ -124,6 +170,7 @@ class SpotifyWidgetRepository:
             query = "DELETE FROM widgets WHERE widget_token = %s AND platform = 'spotify'"
             self.db.cursor.execute(query, (widget_token,))
             self.db.connection.commit()
+            widget_token_cache.invalidate(widget_token)
             success = self.db.cursor.rowcount > 0
             logger.info(
                 "delete_widget_by_token(): işlem tamamlandı. success=%s, rowcount=%s",
@@ -139,44 +186,35 @@ class SpotifyWidgetRepository:
         finally:
             self._close_if_owned()
 
-    def get_widget_by_username_and_type(self, username: str, widget_type: str) -> Optional[Dict[str, Any]]:
-        """Belirtilen kullanıcı ve widget tipi için widget verisini döndürür."""
+    def get_widget_by_username_and_type(self, username: str, widget_type: str) -> Optional[WidgetMeta]:
+        """Belirtilen kullanıcı ve widget tipi için widget kaydını (config hariç) döndürür."""
         self._ensure_connection()
         try:
             logger.debug("get_widget_by_username_and_type(): username='%s', type='%s'", username, widget_type)
-            query = """
-                SELECT *
-                FROM widgets
-                WHERE beatify_username = %s AND widget_type = %s AND platform = 'spotify'
-            """
-            self.db.cursor.execute(query, (username, widget_type))
-            result = self.db.cursor.fetchone()
-            return result
+            cursor = self.db.tuple_cursor
+            cursor.execute(SQL_WIDGET_BY_USERNAME_AND_TYPE, (username, widget_type))
+            row = cursor.fetchone()
+            return WidgetMeta.from_row(row) if row else None
         except MySQLError as e:
             logger.error("get_widget_by_username_and_type(): MySQLError: %s", e, exc_info=True)
             return None
         finally:
             self._close_if_owned()
 
-    def get_widgets_by_username(self, username: str) -> Optional[list[Dict[str, Any]]]:
-        """Belirtilen kullanıcı için tüm Spotify widget'larını döndürür."""
+    def get_widgets_by_username(self, username: str) -> Optional[List[WidgetSummary]]:
+        """Belirtilen kullanıcı için tüm Spotify widget'larını (yeniden eskiye) döndürür."""
         self._ensure_connection()
         try:
             logger.debug("get_widgets_by_username(): username='%s'", username)
-            query = """
-                SELECT *
-                FROM widgets
-                WHERE beatify_username = %s AND platform = 'spotify'
-                ORDER BY created_at DESC
-            """
-            self.db.cursor.execute(query, (username,))
-            results = self.db.cursor.fetchall()
+            cursor = self.db.tuple_cursor
+            cursor.execute(SQL_WIDGETS_BY_USERNAME, (username,))
+            results = [WidgetSummary.from_row(row) for row in cursor.fetchall() or []]
             logger.debug(
                 "get_widgets_by_username(): username='%s', bulunan_widget_sayisi=%s",
                 username,
-                len(results or []),
+                len(results),
             )
-            return results or []
+            return results
         except MySQLError as e:
             logger.error("get_widgets_by_username(): MySQLError: %s", e, exc_info=True)
             return None
@@ -184,51 +222,25 @@ class SpotifyWidgetRepository:
             self._close_if_owned()
 
     def get_widget_config_by_token(self, widget_token: str) -> Optional[Dict[str, Any]]:
-        """Widget token'ına göre widget konfigürasyon verisini döndürür."""
-        self._ensure_connection()
-        try:
-            logger.debug("get_widget_config_by_token(): token='%s'", widget_token)
-            query = "SELECT config_data FROM widgets WHERE widget_token = %s AND platform = 'spotify'"
-            self.db.cursor.execute(query, (widget_token,))
-            result = self.db.cursor.fetchone()
-
-            if result:
-                logger.debug("get_widget_config_by_token(): ham config_data alındı, tip=%s", type(result.get("config_data")))
-                if isinstance(result.get("config_data"), str):
-                    parsed = json.loads(result["config_data"])
-                    logger.debug("get_widget_config_by_token(): JSON parse başarılı, anahtarlar=%s", list(parsed.keys()))
-                    return parsed
-                logger.debug("get_widget_config_by_token(): dict config_data döndürüldü")
-                return result.get("config_data")
-            else:
-                logger.warning(
-                    "get_widget_config_by_token(): token bulunamadı veya platform=spotify değil: token='%s'",
-                    widget_token,
-                )
-                return None
-        except json.JSONDecodeError as e:
-            logger.error("get_widget_config_by_token(): JSONDecodeError: %s", e, exc_info=True)
-            return None
-        except MySQLError as e:
-            logger.error("get_widget_config_by_token(): MySQLError: %s", e, exc_info=True)
+        """Widget token'ına göre widget konfigürasyon verisini döndürür.
+
+        Önbellekteki config paylaşıldığı için çağırana bir kopyası verilir.
+        """
+        entry = self.get_widget_entry_by_token(widget_token)
+        if entry is None or entry.config is None:
             return None
-        finally:
-            self._close_if_owned()
+        return copy.deepcopy(entry.config)
 
     def get_widget_token_by_username(self, username: str) -> Optional[str]:
         """Kullanıcı adına göre widget token'ını döndürür."""
         self._ensure_connection()
         try:
             logger.debug("get_widget_token_by_username(): username='%s'", username)
-            query = """
-                SELECT widget_token
-                FROM widgets
-                WHERE beatify_username = %s AND platform = 'spotify'
-            """
-            self.db.cursor.execute(query, (username,))
-            result = self.db.cursor.fetchone()
-            if result:
-                token = result.get("widget_token")
+            cursor = self.db.tuple_cursor
+            cursor.execute(SQL_WIDGET_TOKEN_BY_USERNAME, (username,))
+            row = cursor.fetchone()
+            if row:
+                token = row[0]
                 logger.debug("get_widget_token_by_username(): username='%s', token='%s'", username, token)
                 return token
             logger.debug("get_widget_token_by_username(): username='%s', token bulunamadı", username)
@@ -243,30 +255,36 @@ class SpotifyWidgetRepository:
         """Widget token'ına göre kullanıcı adını döndürür."""
         self._ensure_connection()
         try:
-            query = "SELECT beatify_username FROM widgets WHERE widget_token = %s AND platform = 'spotify'"
-            self.db.cursor.execute(query, (token,))
-            result = self.db.cursor.fetchone()
-            if result:
-                return result.get("beatify_username")
-            return None
+            query = """
+                SELECT u.username
+                FROM widgets w JOIN users u ON u.id = w.user_id
+                WHERE w.widget_token = %s AND w.platform = 'spotify'
+            """
+            cursor = self.db.tuple_cursor
+            cursor.execute(query, (token,))
+            row = cursor.fetchone()
+            return row[0] if row else None
         except MySQLError:
             return None
         finally:
             self._close_if_owned()
 
-    def get_data_by_widget_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """Widget token'ına göre tüm widget satır verisini döndürür."""
+    def get_data_by_widget_token(self, token: str) -> Optional[WidgetMeta]:
+        """Widget token'ına göre widget kaydını (config hariç) döndürür.
+
+        Config için `get_widget_entry_by_token()` / `get_widget_config_by_token()`
+        kullanılır (önbellekli).
+        """
         self._ensure_connection()
         try:
             logger.debug("get_data_by_widget_token(): token='%s'", token)
-            query = "SELECT * FROM widgets WHERE widget_token = %s AND platform = 'spotify'"
-            self.db.cursor.execute(query, (token,))
-            result = self.db.cursor.fetchone()
-            if result:
+            rows = self.db.fetch_prepared(SQL_WIDGET_META_BY_TOKEN, (token,))
+            if rows:
+                result = WidgetMeta.from_row(rows[0])
                 logger.debug(
                     "get_data_by_widget_token(): token='%s' için kayıt bulundu. beatify_username='%s'",
                     token,
-                    result.get("beatify_username"),
+                    result.beatify_username,
                 )
                 return result
             logger.warning("get_data_by_widget_token(): token bulunamadı veya platform=spotify değil: token='%s'", token)
@@ -277,6 +295,101 @@ class SpotifyWidgetRepository:
         finally:
             self._close_if_owned()
 
+    def get_widget_entry_by_token(self, token: str, strict: bool = False) -> Optional[WidgetCacheEntry]:
+        """Widget token'ına göre (kullanıcı, config, tip) kaydını döndürür.
+
+        Önce süreç içi önbelleğe bakılır; yalnızca önbellekte yoksa DB'ye gidilir.
+        Dönen `config` paylaşılan nesnedir, değiştirilmemelidir.
+
+        Args:
+            strict: True ise DB hatası None ("bulunamadı") yerine yükseltilir;
+                widget'ın silindiğine yalnızca kesin sonuçla karar verilir.
+
+        Raises:
+            MySQLError: `strict=True` iken DB okuması başarısız olursa.
+        """
+        if not token:
+            return None
+
+        entry = widget_token_cache.get(token)
+        if entry is not None:
+            return entry
+
+        marker = widget_token_cache.load_marker()
+        self._ensure_connection()
+        try:
+            logger.debug("get_widget_entry_by_token(): önbellekte yok, DB'den okunuyor: token='%s'", token)
+            rows = self.db.fetch_prepared(SQL_WIDGET_ENTRY_BY_TOKEN, (token,))
+            row = rows[0] if rows else None
+        except MySQLError as e:
+            logger.error("get_widget_entry_by_token(): MySQLError: %s", e, exc_info=True)
+            if strict:
+                raise
+            return None
+        finally:
+            self._close_if_owned()
+
+        if not row:
+            logger.warning("get_widget_entry_by_token(): token bulunamadı veya platform=spotify değil: token='%s'", token)
+            return None
+
+        username, widget_type, config_data = row
+        config = self._parse_config_data(config_data)
+        entry = WidgetCacheEntry(
+            widget_token=token,
+            username=username,
+            widget_type=widget_type,
+            config=config,
+            config_version=self._config_version(widget_type, config),
+        )
+        widget_token_cache.set(token, entry, marker)
+        return entry
+
+    def get_widget_entries_by_tokens(self, tokens: Iterable[str]) -> Dict[str, WidgetCacheEntry]:
+        """Birden fazla widget token'ının kayıtlarını döndürür (bulunamayanlar sonuçta yer almaz).
+
+        Önbellekte olmayan token'lar tek bir `WHERE widget_token IN (...)`
+        sorgusuyla okunur ve önbelleğe yazılır.
+        """
+        unique = list(dict.fromkeys(t for t in tokens if t))
+        entries: Dict[str, WidgetCacheEntry] = widget_token_cache.get_many(unique)
+        missing = [token for token in unique if token not in entries]
+        if not missing:
+            return entries
+
+        marker = widget_token_cache.load_marker()
+        self._ensure_connection()
+        try:
+            logger.debug("get_widget_entries_by_tokens(): %s token DB'den okunuyor", len(missing))
+            placeholders = ", ".join(["%s"] * len(missing))
+            query = f"""
+                SELECT w.widget_token, u.username, w.widget_type, w.config_data
+                FROM widgets w JOIN users u ON u.id = w.user_id
+                WHERE w.widget_token IN ({placeholders}) AND w.platform = 'spotify'
+            """
+            cursor = self.db.tuple_cursor
+            cursor.execute(query, tuple(missing))
+            results = cursor.fetchall() or []
+        except MySQLError as e:
+            logger.error("get_widget_entries_by_tokens(): MySQLError: %s", e, exc_info=True)
+            return entries
+        finally:
+            self._close_if_owned()
+
+        loaded: Dict[str, WidgetCacheEntry] = {}
+        for token, username, widget_type, config_data in results:
+            config = self._parse_config_data(config_data)
+            loaded[token] = WidgetCacheEntry(
+                widget_token=token,
+                username=username,
+                widget_type=widget_type,
+                config=config,
+                config_version=self._config_version(widget_type, config),
+            )
+        widget_token_cache.set_many(loaded, marker)
+        entries.update(loaded)
+        return entries
+
     def update_widget_design_for_user(self, username: str, design: str) -> bool:
         """Kullanıcının widget tasarım tercihini günceller.
 
@@ -285,7 +398,7 @@ class SpotifyWidgetRepository:
         """
         self._ensure_connection()
         try:
-            query = "UPDATE spotify_accounts SET design = %s WHERE username = %s"
+            query = f"UPDATE spotify_accounts SET design = %s WHERE user_id = {USER_ID_BY_USERNAME}"
             self.db.cursor.execute(query, (design, username))
             self.db.connection.commit()
             return self.db.cursor.rowcount > 0
@@ -300,7 +413,10 @@ class SpotifyWidgetRepository:
         """Kullanıcının widget verilerini temizler."""
         self._ensure_connection()
         try:
-            query = "UPDATE spotify_accounts SET widget_token = NULL, short_token = NULL, design = 'standard' WHERE username = %s"
+            query = f"""
+                UPDATE spotify_accounts SET widget_token = NULL, short_token = NULL, design = 'standard'
+                WHERE user_id = {USER_ID_BY_USERNAME}
+            """
             self.db.cursor.execute(query, (username,))
             self.db.connection.commit()
             return self.db.cursor.rowcount > 0
@@ -320,7 +436,10 @@ class SpotifyWidgetRepository:
         self._ensure_connection()
         try:
             logger.debug("debug_get_all_widgets(): widgets tablosundaki tüm satırlar isteniyor")
-            query = "SELECT * FROM widgets"
+            query = """
+                SELECT w.*, u.username AS beatify_username
+                FROM widgets w LEFT JOIN users u ON u.id = w.user_id
+            """
             self.db.cursor.execute(query)
             results = self.db.cursor.fetchall() or []
             logger.debug("debug_get_all_widgets(): toplam %s satır bulundu", len(results))
@@ -335,14 +454,31 @@ class SpotifyWidgetRepository:
     # 3.3. Dahili yardımcılar (Internal helpers)
     # -------------------------------------------------------------------------
 
-    def _ensure_connection(self) -> None:
-        """Veritabanı bağlantısını kontrol eder."""
-        self.db.ensure_connection()
+    @staticmethod
+    def _parse_config_data(raw: Any) -> Optional[Dict[str, Any]]:
+        """`config_data` kolonunu (JSON string/bytes veya dict) dict'e çevirir."""
+        if isinstance(raw, dict):
+            return raw
+        if isinstance(raw, (bytes, bytearray)):
+            raw = raw.decode("utf-8")
+        if not isinstance(raw, str):
+            return None
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.error("_parse_config_data(): JSONDecodeError: %s", e, exc_info=True)
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    @staticmethod
+    def _config_version(widget_type: Optional[str], config: Optional[Dict[str, Any]]) -> str:
+        """Widget tipi ve config içeriğinden kısa bir sürüm değeri üretir.
 
-    def _close_if_owned(self) -> None:
-        """Bağlantıyı bu sınıf oluşturduysa kapatır."""
-        if self._own_connection:
-            self.db.close()
+        `updated_at` saniye hassasiyetindedir; aynı saniyedeki iki kayıt aynı
+        sürümü verirdi. İçerik özeti her değişiklikte farklıdır.
+        """
+        raw = json.dumps([widget_type, config], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
 
 
 # =============================================================================
@@ -0,0 +1,87 @@
+# =============================================================================
+# İstek Kapsamlı Bağlantı Modülü (request_scope.py)
+# =============================================================================
+# Bu modül, her HTTP isteğine tek bir `DatabaseConnection` bağlar. İstek
+# içindeki tüm repository çağrıları aynı (havuzdan ödünç alınmış) bağlantıyı
+# kullanır; bağlantı, istek bittiğinde teardown hook'u ile havuza iade edilir.
+#
+# Böylece modül seviyesinde oluşturulan repository nesneleri (ör.
+# `widget_repo`, `spotify_repo`) `threaded=True` altında eşzamanlı isteklerde
+# aynı bağlantı/cursor çiftini paylaşmaz.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. _G_ATTRIBUTE
+#
+# 3.0  FONKSİYONLAR (FUNCTIONS)
+#      3.1. has_request_connection_scope()
+#      3.2. get_request_connection()
+#      3.3. close_request_connection(exc=None)
+#      3.4. init_request_connection_scope(app)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Optional
+
+# Üçüncü parti
+from flask import Flask, g, has_request_context
+
+# Uygulama içi
+from app.database.db_connection import DatabaseConnection
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+# Flask `g` nesnesi üzerinde bağlantının tutulduğu alan adı
+_G_ATTRIBUTE: str = "_beatify_db_connection"
+
+
+# =============================================================================
+# 3.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def has_request_connection_scope() -> bool:
+    """Aktif bir Flask isteği içinde olunup olunmadığını döndürür."""
+    return has_request_context()
+
+
+def get_request_connection() -> Optional[DatabaseConnection]:
+    """Aktif isteğe bağlı `DatabaseConnection` nesnesini döndürür.
+
+    İstek dışında (ör. arka plan thread'leri, CLI) `None` döner. Bağlantının
+    kendisi ilk sorguda (`ensure_connection()`) havuzdan alınır.
+    """
+    if not has_request_context():
+        return None
+
+    db: Optional[DatabaseConnection] = getattr(g, _G_ATTRIBUTE, None)
+    if db is None:
+        db = DatabaseConnection()
+        setattr(g, _G_ATTRIBUTE, db)
+    return db
+
+
+def close_request_connection(exc: Optional[BaseException] = None) -> None:
+    """İsteğe bağlı bağlantıyı kapatır / havuza iade eder (teardown hook)."""
+    db: Optional[DatabaseConnection] = g.pop(_G_ATTRIBUTE, None)
+    if db is not None:
+        db.close()
+
+
+def init_request_connection_scope(app: Flask) -> None:
+    """İstek sonunda bağlantının iade edilmesi için teardown hook'unu kaydeder."""
+    app.teardown_appcontext(close_request_connection)
+
+
+# =============================================================================
+# İstek Kapsamlı Bağlantı Modülü Sonu
+# =============================================================================
@@ -0,0 +1,310 @@
+# =============================================================================
+# Widget Token Önbellek Modülü (widget_cache.py)
+# =============================================================================
+# Bu modül, widget token'ı -> (kullanıcı adı, parse edilmiş config, widget tipi,
+# config sürümü)
+# eşlemesini süreç içinde tutan LRU + TTL önbelleği içerir.
+#
+# `SpotifyWidgetRepository` okuma yaparken önce bu önbelleğe bakar; yazma ve
+# silme işlemleri (store_widget_config / delete_widget_by_token) ilgili token'ı
+# geçersiz kılar (write-through invalidation).
+#
+# Paylaşılan bir önbellek (ör. Redis) yapılandırılmışsa ikinci seviye olarak
+# kullanılır: bir worker'ın DB'den okuduğu kayıt diğer worker'lara da gider,
+# geçersiz kılma tüm worker'ların ikinci seviyesini temizler.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SINIFLAR (CLASSES)
+#      2.1. WidgetCacheEntry
+#           2.1.1. to_dict()
+#           2.1.2. from_dict(widget_token, data)
+#      2.2. WidgetTokenCache
+#           2.2.1. __init__(max_entries=1024, ttl=60.0, shared=None)
+#           2.2.2. get(token, local_only=False)
+#           2.2.3. get_many(tokens)
+#           2.2.4. load_marker()
+#           2.2.5. set(token, entry, marker=None)
+#           2.2.6. set_many(entries, marker=None)
+#           2.2.7. invalidate(token)
+#           2.2.8. clear()
+#           2.2.9. stats()
+#           2.2.10. _get_local(token, now)
+#           2.2.11. _set_local(token, entry, now)
+#
+# 3.0  FONKSİYONLAR (FUNCTIONS)
+#      3.1. _shared_key(token)
+#
+# 4.0  ÖNBELLEK NESNESİ (CACHE INSTANCE)
+#      3.1. widget_token_cache
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Uygulama içi
+from app.config.config import WIDGET_CACHE_CONFIG
+from app.services.cache.backend import CacheBackend
+from app.services.cache.shared_cache import distributed_cache
+
+
+# =============================================================================
+# 2.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class WidgetCacheEntry:
+    """Bir widget token'ı için önbellekte tutulan değer.
+
+    Not: `config` paylaşılan bir nesnedir; değiştirecek çağıranlar kopyasını almalıdır.
+    """
+
+    __slots__ = ("widget_token", "username", "widget_type", "config", "config_version")
+
+    def __init__(
+        self,
+        widget_token: str,
+        username: str,
+        widget_type: Optional[str],
+        config: Optional[Dict[str, Any]],
+        config_version: Optional[str] = None,
+    ) -> None:
+        self.widget_token: str = widget_token
+        self.username: str = username
+        self.widget_type: Optional[str] = widget_type
+        self.config: Optional[Dict[str, Any]] = config
+        # Config içeriğinden türetilen sürüm; açık widget'lar değişikliği bununla fark eder
+        self.config_version: Optional[str] = config_version
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Paylaşılan önbelleğe yazılacak JSON uyumlu hali."""
+        return {
+            "username": self.username,
+            "widget_type": self.widget_type,
+            "config": self.config,
+            "config_version": self.config_version,
+        }
+
+    @classmethod
+    def from_dict(cls, widget_token: str, data: Dict[str, Any]) -> "WidgetCacheEntry":
+        """`to_dict()` çıktısından kaydı yeniden oluşturur."""
+        return cls(
+            widget_token=widget_token,
+            username=data["username"],
+            widget_type=data.get("widget_type"),
+            config=data.get("config"),
+            config_version=data.get("config_version"),
+        )
+
+
+class WidgetTokenCache:
+    """Thread-safe LRU + TTL widget token önbelleği (hit/miss sayaçlı)."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0, shared: Optional[CacheBackend] = None) -> None:
+        """
+        Args:
+            max_entries: Süreç içi en fazla kayıt.
+            ttl: Kayıt ömrü (saniye); iki seviyede de aynıdır.
+            shared: Worker'lar arası paylaşılan ikinci seviye önbellek (opsiyonel).
+        """
+        self.max_entries: int = max(1, int(max_entries))
+        self.ttl: float = max(0.0, float(ttl))
+        self.shared: Optional[CacheBackend] = shared
+
+        self._entries: "OrderedDict[str, Tuple[float, WidgetCacheEntry]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Her geçersiz kılmada artar; DB'den okuma sürerken yapılan bir yazmanın
+        # ardından eski değerin önbelleğe geri yazılmasını engeller.
+        self._epoch: int = 0
+
+        self.hits: int = 0
+        self.shared_hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+
+    def get(self, token: str, local_only: bool = False) -> Optional[WidgetCacheEntry]:
+        """Token için geçerli (süresi dolmamış) kaydı döndürür.
+
+        Args:
+            local_only: True ise paylaşılan önbelleğe gidilmez (ağ beklemesi
+                istenmeyen yerler için, ör. event loop).
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._get_local(token, now)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            if local_only or self.shared is None:
+                self.misses += 1
+                return None
+            marker = self._epoch
+
+        data = self.shared.get(_shared_key(token))
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.shared_hits += 1
+            entry = WidgetCacheEntry.from_dict(token, data)
+            if marker == self._epoch:
+                self._set_local(token, entry, now)
+            return entry
+
+    def get_many(self, tokens: Iterable[str]) -> Dict[str, WidgetCacheEntry]:
+        """Birden fazla token'ın kayıtlarını döndürür (bulunamayanlar sonuçta yer almaz).
+
+        Süreç içinde olmayanlar paylaşılan önbellekten tek seferde okunur.
+        """
+        now = time.monotonic()
+        found: Dict[str, WidgetCacheEntry] = {}
+        missing = []
+        with self._lock:
+            for token in tokens:
+                entry = self._get_local(token, now)
+                if entry is not None:
+                    self.hits += 1
+                    found[token] = entry
+                else:
+                    missing.append(token)
+            if not missing or self.shared is None:
+                self.misses += len(missing)
+                return found
+            marker = self._epoch
+
+        shared = self.shared.get_many(_shared_key(token) for token in missing)
+        with self._lock:
+            for token in missing:
+                data = shared.get(_shared_key(token))
+                if data is None:
+                    self.misses += 1
+                    continue
+                self.shared_hits += 1
+                entry = WidgetCacheEntry.from_dict(token, data)
+                found[token] = entry
+                if marker == self._epoch:
+                    self._set_local(token, entry, now)
+        return found
+
+    def load_marker(self) -> int:
+        """DB okuması başlamadan önce alınır ve `set()`'e geri verilir."""
+        with self._lock:
+            return self._epoch
+
+    def set(self, token: str, entry: WidgetCacheEntry, marker: Optional[int] = None) -> None:
+        """Kaydı önbelleğe yazar.
+
+        Args:
+            marker: `load_marker()` çıktısı. Okuma sırasında bir geçersiz kılma
+                olduysa kayıt yazılmaz (eski veri önbelleğe girmesin).
+        """
+        self.set_many({token: entry}, marker)
+
+    def set_many(self, entries: Dict[str, WidgetCacheEntry], marker: Optional[int] = None) -> None:
+        """Birden fazla kaydı yazar (paylaşılan önbelleğe tek seferde)."""
+        if self.ttl <= 0 or not entries:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if marker is not None and marker != self._epoch:
+                return
+            for token, entry in entries.items():
+                self._set_local(token, entry, now)
+        if self.shared is not None:
+            self.shared.set_many(
+                {_shared_key(token): entry.to_dict() for token, entry in entries.items()},
+                ttl=self.ttl,
+            )
+
+    def invalidate(self, token: Optional[str]) -> None:
+        """Token'a ait kaydı önbellekten (ve paylaşılan önbellekten) siler.
+
+        Not: Diğer worker'ların süreç içi kopyası en geç `ttl` sonra yenilenir.
+        """
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += 1
+            if token:
+                self._entries.pop(token, None)
+        if token and self.shared is not None:
+            self.shared.delete(_shared_key(token))
+
+    def clear(self) -> None:
+        """Tüm süreç içi kayıtları siler."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek sayaçlarını döndürür."""
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    def _get_local(self, token: str, now: float) -> Optional[WidgetCacheEntry]:
+        """Süreç içi kaydı döndürür; süresi dolmuşsa siler (kilit altında çağrılır)."""
+        item = self._entries.get(token)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at <= now:
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return entry
+
+    def _set_local(self, token: str, entry: WidgetCacheEntry, now: float) -> None:
+        """Kaydı süreç içine yazar ve LRU sınırını uygular (kilit altında çağrılır)."""
+        self._entries[token] = (now + self.ttl, entry)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# =============================================================================
+# 3.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def _shared_key(token: str) -> str:
+    """Paylaşılan önbellekteki anahtar."""
+    return f"widget:{token}"
+
+
+# =============================================================================
+# 4.0 ÖNBELLEK NESNESİ (CACHE INSTANCE)
+# =============================================================================
+
+widget_token_cache: WidgetTokenCache = WidgetTokenCache(
+    max_entries=int(WIDGET_CACHE_CONFIG["max_entries"]),
+    ttl=float(WIDGET_CACHE_CONFIG["ttl"]),
+    shared=distributed_cache(),
+)
+
+
+# =============================================================================
+# Widget Token Önbellek Modülü Sonu
+# =============================================================================
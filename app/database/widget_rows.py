@@ -0,0 +1,104 @@
+# =============================================================================
+# Widget Satır Tipleri Modülü (widget_rows.py)
+# =============================================================================
+# Bu modül, `widgets` sorgularının döndürdüğü kompakt, `__slots__`'lu satır
+# tiplerini içerir.
+#
+# Her tip yalnızca kendi kullanım yerinin ihtiyaç duyduğu kolonları taşır ve
+# `COLUMNS` ile kendi SELECT listesini tanımlar; repository sorguları bu
+# listeyi kullanır, satırlar tuple cursor'dan (`DatabaseConnection.tuple_cursor`)
+# satır başına dict üretmeden oluşturulur:
+#
+#   WidgetSummary -> widget listesi (Widget Manager; önizleme için config_data dahil)
+#   WidgetMeta    -> kayıt / kopya oluşturma akışları (config_data yok)
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SINIFLAR (CLASSES)
+#      2.1. WidgetSummary
+#           2.1.1. from_row(row)
+#           2.1.2. to_dict()
+#      2.2. WidgetMeta
+#           2.2.1. from_row(row)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Any, Dict, Optional, Sequence
+
+
+# =============================================================================
+# 2.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class WidgetSummary:
+    """Widget listesindeki tek bir widget (`/spotify/widget-list`)."""
+
+    __slots__ = ("widget_token", "widget_name", "widget_type", "config_data", "created_at", "updated_at")
+
+    # `widgets w` takma adıyla, `__slots__` sırasında
+    COLUMNS = "w.widget_token, w.widget_name, w.widget_type, w.config_data, w.created_at, w.updated_at"
+
+    def __init__(
+        self,
+        widget_token: str,
+        widget_name: Optional[str],
+        widget_type: Optional[str],
+        config_data: Any,
+        created_at: Any,
+        updated_at: Any,
+    ) -> None:
+        self.widget_token: str = widget_token
+        self.widget_name: Optional[str] = widget_name
+        self.widget_type: Optional[str] = widget_type
+        # Ham JSON kolonu (str); istemci kendisi çözer
+        self.config_data: Any = config_data
+        self.created_at: Any = created_at
+        self.updated_at: Any = updated_at
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "WidgetSummary":
+        """`COLUMNS` sırasındaki tuple satırdan oluşturur."""
+        return cls(*row)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON yanıtı için dict hali."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class WidgetMeta:
+    """Config içeriği olmadan widget kaydının tanımlayıcı alanları."""
+
+    __slots__ = ("widget_token", "beatify_username", "widget_name", "widget_type", "spotify_user_id")
+
+    # `widgets w JOIN users u` takma adlarıyla, `__slots__` sırasında
+    COLUMNS = "w.widget_token, u.username, w.widget_name, w.widget_type, w.spotify_user_id"
+
+    def __init__(
+        self,
+        widget_token: str,
+        beatify_username: str,
+        widget_name: Optional[str],
+        widget_type: Optional[str],
+        spotify_user_id: Optional[str],
+    ) -> None:
+        self.widget_token: str = widget_token
+        self.beatify_username: str = beatify_username
+        self.widget_name: Optional[str] = widget_name
+        self.widget_type: Optional[str] = widget_type
+        self.spotify_user_id: Optional[str] = spotify_user_id
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "WidgetMeta":
+        """`COLUMNS` sırasındaki tuple satırdan oluşturur."""
+        return cls(*row)
+
+
+# =============================================================================
+# Widget Satır Tipleri Modülü Sonu
+# =============================================================================
@@ -12,10 +12,13 @@
 # 2.0  UYGULAMA FABRİKASI (APP FACTORY)
 #      2.1. create_app()
 #           2.1.1. Flask app oluşturma
-#           2.1.2. Migration (tablo oluşturma) akışı
+#           2.1.2. Şema sürüm kontrolü (migrations)
 #           2.1.3. Session/Cookie güvenlik ayarları
 #           2.1.4. Jinja2 filtreleri
 #           2.1.5. Route kayıtları
+#           2.1.6. İstek kapsamlı veritabanı bağlantısı
+#           2.1.7. Spotify HTTP bağlantı ön ısıtması
+#           2.1.8. Migration CLI komutları
 #
 # 3.0  WSGI GİRİŞİ (WSGI ENTRYPOINT)
 #      3.1. app (create_app çıktısı)
@@ -30,13 +33,19 @@ import datetime
 from typing import Any, Optional
 
 # Üçüncü parti
+import click
 from flask import Flask
 
 # Uygulama içi
-from app.config.config import COOKIE_HTTPONLY, COOKIE_SAMESITE, COOKIE_SECURE, DEBUG, SECRET_KEY
+from app.config.config import COOKIE_HTTPONLY, COOKIE_SAMESITE, COOKIE_SECURE, DEBUG, MIGRATIONS_CONFIG, SECRET_KEY
+from app.config.spotify_config import SpotifyConfig
+from app.database.migration_commands import init_migration_commands
+from app.database.migrations.registry import MigrationError
 from app.database.migrations_repository import MigrationsRepository
+from app.database.request_scope import init_request_connection_scope
 from app.routes import auth_routes, main_routes
 from app.routes.spotify_routes import spotify_routes
+from app.services.spotify.http_client import spotify_http_client
 
 
 def create_app() -> Flask:
@@ -45,7 +54,7 @@ def create_app() -> Flask:
 
     Bu fonksiyon:
     - Flask uygulamasını başlatır
-    - Veritabanı tablolarını (migrations) kontrol eder/oluşturur
+    - Veritabanı şema sürümünü kontrol eder (gerekirse migration'ları uygular)
     - Güvenlik ve temel ayarları yükler
     - Jinja2 filtrelerini kaydeder
     - Rotaları (routes) uygular
@@ -64,11 +73,21 @@ def create_app() -> Flask:
     )
 
     # -------------------------------------------------------------------------
-    # 2.1.2. Veritabanı tablolarını oluştur (migrations)
+    # 2.1.2. Şema sürüm kontrolü (migrations)
     # -------------------------------------------------------------------------
+    # Şema güncelse yalnızca sürüm okunur (DDL çalışmaz); sonuç süreç boyunca
+    # hatırlanır. Gerideyse, izin verilmişse yalnızca açılışta güvenli
+    # (`BOOT_SAFE`) migration'lar uygulanır; diğerleri `db-upgrade` bekler.
+    # Şema kodun gerektirdiği sürümün altında kalırsa sunucu açılmaz; Flask
+    # CLI altında (`db-upgrade`, `db-status`) şemayı güncelleyebilmek için açılır.
     try:
-        migrations_repo = MigrationsRepository()
-        migrations_repo.create_all_tables()
+        if MIGRATIONS_CONFIG["check_on_boot"]:
+            migrations_repo = MigrationsRepository()
+            migrations_repo.ensure_schema(auto_upgrade=bool(MIGRATIONS_CONFIG["auto_upgrade"]))
+    except MigrationError as exc:
+        if click.get_current_context(silent=True) is None:
+            raise
+        click.echo(f"Uyarı: {exc}", err=True)
     except Exception:
         # Migration hatası durumunda uygulamanın tamamen çökmesini istemiyoruz;
         # loglama altyapısı eklendiğinde burada loglanabilir.
@@ -129,6 +148,27 @@ def create_app() -> Flask:
         # loglama altyapısı eklendiğinde burada loglanabilir.
         pass
 
+    # -------------------------------------------------------------------------
+    # 2.1.6. İstek kapsamlı veritabanı bağlantısı
+    # -------------------------------------------------------------------------
+    # Her istek, tüm repository çağrıları için havuzdan tek bir bağlantı alır;
+    # istek bitince bağlantı havuza iade edilir.
+    init_request_connection_scope(app)
+
+    # -------------------------------------------------------------------------
+    # 2.1.7. Spotify HTTP bağlantı ön ısıtması
+    # -------------------------------------------------------------------------
+    # İlk widget isteği DNS + TCP + TLS kurulumunu beklemesin diye Spotify
+    # host'larına bağlantı arka planda önceden açılır.
+    if SpotifyConfig.HTTP_PREWARM:
+        spotify_http_client.prewarm_in_background()
+
+    # -------------------------------------------------------------------------
+    # 2.1.8. Migration CLI komutları
+    # -------------------------------------------------------------------------
+    # `flask --app app.main db-upgrade` / `db-status`
+    init_migration_commands(app)
+
     return app
 
 
@@ -41,6 +41,7 @@ from typing import Any, Dict, Optional, Tuple
 from flask import Blueprint, Flask, jsonify, request, session
 
 # Servisler
+from app.services.spotify.playback_snapshot import playback_snapshot_store
 from app.services.spotify.player_service import SpotifyPlayerService
 from app.services.spotify.playlist_service import SpotifyPlaylistService
 
@@ -91,7 +92,9 @@ def api_spotify_player_control() -> Tuple[Dict[str, Any], int]:
         else:
             logger.warning(f"Geçersiz oynatıcı eylemi: {action}")
             return jsonify({"error": "Geçersiz eylem.", "success": False}), 400
-        
+
+        # Widget'lar eski çalma durumunu göstermesin
+        playback_snapshot_store.invalidate(username)
         return jsonify({"message": f"Eylem '{action}' başarıyla gerçekleştirildi.", "success": True}), 200
     except Exception as e:
         logger.error(f"Oynatıcı kontrol hatası (Kullanıcı: {username}, Eylem: {action}): {e}", exc_info=True)
@@ -110,7 +113,7 @@ def api_spotify_player_status() -> Tuple[Dict[str, Any], int]:
 
     try:
         now_playing = spotify_player_service.get_playback_state(username)
-        if now_playing and now_playing.get('is_playing'):
+        if now_playing and not now_playing.get('error') and now_playing.get('is_playing'):
             track_data = spotify_player_service.format_playback_state(now_playing)
             return jsonify(track_data), 200
         else:
@@ -128,6 +128,7 @@ def spotify_callback() -> Any:
             credentials["client_id"],
             credentials["client_secret"],
             redirect_uri=redirect_uri,
+            username=username,
         )
         logger.info(f"[DEBUG] Token info received: {bool(token_info)}")
         
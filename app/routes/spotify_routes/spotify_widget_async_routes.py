@@ -0,0 +1,243 @@
+# =============================================================================
+# Spotify Widget Async Rota Modülü (Spotify Widget Async Routes Module)
+# =============================================================================
+# Bu modül, ASGI sunucusunda (`app.asgi`) widget verisi ve SSE akışını
+# event loop üzerinde karşılayan asyncio rotalarını içerir.
+#
+# Kararlı durumda bir widget isteği hiç thread tutmaz: token süreç içi
+# önbellekten, çalma durumu ise arka plan poller'ının yazdığı snapshot'tan
+# okunur. Yalnızca engelleyen işler (önbellekte olmayan token için DB, henüz
+# snapshot'ı olmayan kullanıcı için ilk Spotify sorgusu) sınırlı bir thread
+# havuzunda çalışır. SSE akışları bekleme sırasında `asyncio.sleep` kullanır;
+# tek süreç binlerce açık widget bağlantısı tutabilir.
+#
+# Rotalar `None` döndürürse istek Flask uygulamasına devredilir (ör. demo modu).
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER, TİPLER & LOGGER (CONSTANTS, TYPES & LOGGER)
+#      2.1. logger
+#      2.2. AsyncResponse
+#      2.3. _JSON_HEADERS
+#
+# 3.0  THREAD HAVUZU (EXECUTOR)
+#      3.1. _widget_executor
+#      3.2. _run_blocking(fn, *args)
+#      3.3. shutdown_async_widget_routes()
+#
+# 4.0  YARDIMCI FONKSİYONLAR (HELPER FUNCTIONS)
+#      4.1. _json_response(status, body, headers=None)
+#      4.2. _resolve_widget(widget_token, strict=False)
+#      4.3. _playback_for(username)
+#      4.4. _config_info(widget_token)
+#
+# 5.0  ROTA TANIMLARI (ROUTE DEFINITIONS)
+#      5.1. widget_data(widget_token, query, headers) -> GET /spotify/api/widget-data/<widget_token>
+#      5.2. widget_stream(widget_token, query, headers) -> GET /spotify/api/widget-stream/<widget_token>
+#
+# 6.0  ROTA TABLOSU (ROUTE TABLE)
+#      6.1. ASYNC_WIDGET_ROUTES
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import asyncio
+import functools
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Pattern, Tuple, Union
+
+# Üçüncü parti
+from werkzeug.http import parse_etags
+
+# Uygulama içi
+from app.config.config import ASGI_CONFIG
+from app.config.spotify_config import SpotifyConfig
+from app.database.widget_cache import WidgetCacheEntry, widget_token_cache
+from app.routes.spotify_routes.spotify_widget_routes import (
+    _get_widget_playback_data,
+    _peek_widget_playback_data,
+    _playback_response_parts,
+    widget_repo,
+)
+from app.services.spotify.deadline import Deadline
+from app.services.spotify.widget.stream_service import WidgetPlaybackStream
+
+
+# =============================================================================
+# 2.0 SABİTLER, TİPLER & LOGGER (CONSTANTS, TYPES & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# (durum kodu, başlıklar, gövde) — gövde bayt veya SSE parçaları üreten async iterator
+AsyncResponse = Tuple[int, Dict[str, str], Union[bytes, AsyncIterator[str]]]
+
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+
+# =============================================================================
+# 3.0 THREAD HAVUZU (EXECUTOR)
+# =============================================================================
+
+# Widget rotalarının engelleyen işleri için sınırlı havuz; Flask rotalarının
+# havuzundan ayrıdır (biri dolduğunda diğeri etkilenmez)
+_widget_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=int(ASGI_CONFIG["widget_workers"]),
+    thread_name_prefix="asgi-widget",
+)
+
+
+async def _run_blocking(fn: Callable[..., Any], *args: Any) -> Any:
+    """Engelleyen bir fonksiyonu widget havuzunda çalıştırır ve sonucunu bekler."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_widget_executor, functools.partial(fn, *args))
+
+
+def shutdown_async_widget_routes() -> None:
+    """Widget havuzunu kapatır (ASGI lifespan shutdown)."""
+    _widget_executor.shutdown(wait=False)
+
+
+# =============================================================================
+# 4.0 YARDIMCI FONKSİYONLAR (HELPER FUNCTIONS)
+# =============================================================================
+
+def _json_response(status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> AsyncResponse:
+    """JSON gövdeli bir yanıt üretir."""
+    payload = json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return status, dict(_JSON_HEADERS, **(headers or {})), payload
+
+
+async def _resolve_widget(widget_token: str, strict: bool = False) -> Optional[WidgetCacheEntry]:
+    """Token kaydını önce önbellekten, yoksa havuzda DB'den okur.
+
+    `strict=True` ise DB hatası None yerine yükseltilir (bkz. `get_widget_entry_by_token`).
+    """
+    entry = widget_token_cache.get(widget_token, local_only=True)
+    if entry is None:
+        entry = await _run_blocking(widget_repo.get_widget_entry_by_token, widget_token, strict)
+    if entry is None or not entry.username:
+        return None
+    return entry
+
+
+async def _playback_for(username: str) -> Dict[str, Any]:
+    """Kullanıcının çalma durumu: snapshot varsa beklemeden, yoksa havuzda alınır."""
+    data = _peek_widget_playback_data(username)
+    if data is not None:
+        return data
+    # Süre bütçesi havuz kuyruğunda geçen süreyi de kapsar
+    deadline = Deadline(SpotifyConfig.WIDGET_DATA_DEADLINE_SECONDS)
+    return await _run_blocking(_get_widget_playback_data, username, deadline)
+
+
+async def _config_info(widget_token: str) -> Optional[Dict[str, Any]]:
+    """Widget'ın güncel config bilgisini döndürür; token bulunamadıysa None.
+
+    Raises:
+        MySQLError: Token DB'den okunamadıysa (widget silinmiş sayılmamalı).
+    """
+    entry = await _resolve_widget(widget_token, strict=True)
+    if entry is None:
+        return None
+    return {
+        "config_version": entry.config_version,
+        "widget_type": entry.widget_type,
+        "config": entry.config,
+    }
+
+
+# =============================================================================
+# 5.0 ROTA TANIMLARI (ROUTE DEFINITIONS)
+# =============================================================================
+
+async def widget_data(widget_token: str, query: Mapping[str, str], headers: Mapping[str, str]) -> Optional[AsyncResponse]:
+    """`spotify_widget_routes.widget_data` ile aynı yanıtı (ETag / 304 dahil) üretir."""
+    if query.get("demo") == "1":
+        return None
+
+    entry = await _resolve_widget(widget_token)
+    if entry is None:
+        logger.warning("Geçersiz widget token ile veri talebi: widget_token='%s'", widget_token)
+        return _json_response(401, {
+            "error": "Geçersiz widget token",
+            "details": "Lütfen widget token'ınızı kontrol edin veya yeni bir token oluşturun."
+        })
+
+    try:
+        data = await _playback_for(entry.username)
+    except Exception as e:
+        logger.error("async widget_data(): beklenmeyen hata (widget_token='%s'): %s", widget_token, e, exc_info=True)
+        return _json_response(500, {
+            "is_playing": False,
+            "error": "Beklenmeyen bir hata oluştu",
+            "details": str(e)
+        })
+
+    if not data or "error" in data:
+        data = {
+            "is_playing": False,
+            "error": (data or {}).get("error", "Çalma durumu alınamadı"),
+            "details": "Spotify'da aktif bir çalma işlemi bulunamadı veya bağlantı hatası oluştu."
+        }
+
+    etag, response_headers, body = _playback_response_parts(data, config_version=entry.config_version)
+    if parse_etags(headers.get("if-none-match")).contains(etag):
+        return 304, response_headers, b""
+    return _json_response(200, body, response_headers)
+
+
+async def widget_stream(widget_token: str, query: Mapping[str, str], headers: Mapping[str, str]) -> Optional[AsyncResponse]:
+    """`spotify_widget_routes.widget_stream` ile aynı SSE olaylarını asyncio üzerinde üretir."""
+    if query.get("demo") == "1":
+        return _json_response(400, {"error": "Demo modunda akış desteklenmiyor"})
+
+    entry = await _resolve_widget(widget_token)
+    if entry is None:
+        logger.warning("Geçersiz widget token ile akış talebi: widget_token='%s'", widget_token)
+        return _json_response(401, {"error": "Geçersiz widget token"})
+
+    username = entry.username
+    logger.info("async widget_stream(): akış açıldı: username='%s', widget_token='%s'", username, widget_token)
+
+    stream = WidgetPlaybackStream(
+        check_interval=SpotifyConfig.WIDGET_STREAM_CHECK_SECONDS,
+        heartbeat_interval=SpotifyConfig.WIDGET_STREAM_HEARTBEAT_SECONDS,
+        max_duration=SpotifyConfig.WIDGET_STREAM_MAX_SECONDS,
+        seek_tolerance_ms=SpotifyConfig.WIDGET_STREAM_SEEK_TOLERANCE_MS,
+        config_version=query.get("config_version") or entry.config_version,
+    )
+    events = stream.async_events(
+        fetch=lambda: _playback_for(username),
+        config_probe=lambda: _config_info(widget_token),
+    )
+    return 200, {
+        "Content-Type": "text/event-stream; charset=utf-8",
+        "Cache-Control": "no-cache",
+        # Nginx vb. proxy'lerin olayları tamponlamaması için
+        "X-Accel-Buffering": "no",
+    }, events
+
+
+# =============================================================================
+# 6.0 ROTA TABLOSU (ROUTE TABLE)
+# =============================================================================
+
+# Yalnızca GET; eşleşmeyen her istek Flask uygulamasına gider
+ASYNC_WIDGET_ROUTES: List[Tuple[Pattern[str], Callable[..., Awaitable[Optional[AsyncResponse]]]]] = [
+    (re.compile(r"^/spotify/api/widget-data/(?P<widget_token>[^/]+)$"), widget_data),
+    (re.compile(r"^/spotify/api/widget-stream/(?P<widget_token>[^/]+)$"), widget_stream),
+]
+
+
+# =============================================================================
+# Spotify Widget Async Rota Modülü Sonu
+# =============================================================================
@@ -9,15 +9,26 @@
 # 1.0  İÇE AKTARMALAR (IMPORTS)
 # 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
 #      2.1. logger
+#      2.2. _ETAG_PROGRESS_STEP_MS
 #
 # 3.0  BLUEPRINT VE SERVİS BAŞLATMA (BLUEPRINT & SERVICE INITIALIZATION)
 #      3.1. spotify_widget_bp
 #      3.2. widget_token_service
 #      3.3. spotify_player_service
 #      3.4. widget_repo
+#      3.5. playback_poller
 #
 # 4.0  YARDIMCI FONKSİYONLAR (HELPER FUNCTIONS)
-#      4.1. _get_widget_playback_data(username)
+#      4.1. _get_widget_playback_data(username, deadline=None)
+#      4.2. _peek_widget_playback_data(username)
+#      4.3. _advance_progress(data, age)
+#      4.4. _fetch_widget_playback_data(username, deadline=None)
+#      4.5. _poll_hint_ms(data)
+#      4.6. _playback_etag(data, config_version=None)
+#      4.7. _playback_response_parts(data, config_version=None)
+#      4.8. _playback_response(data, config_version=None)
+#      4.9. _widget_config_info(widget_token)
+#      4.10. _shed_widget_data(widget_token)
 #
 # 5.0  ROTA TANIMLARI (ROUTE DEFINITIONS)
 #      5.1. Arayüz Rotaları (UI Routes)
@@ -26,10 +37,16 @@
 #           5.1.3. create_widget() -> @spotify_widget_bp.route('/widget/create', methods=['POST'])
 #           5.1.4. delete_widget() -> @spotify_widget_bp.route('/widget/delete', methods=['POST'])
 #           5.1.5. debug_widgets() -> @spotify_widget_bp.route('/debug/widgets', methods=['GET'])
+#           5.1.5.1. debug_widget_cache() -> @spotify_widget_bp.route('/debug/widget-cache', methods=['GET'])
+#           5.1.5.2. debug_spotify_http() -> @spotify_widget_bp.route('/debug/spotify-http', methods=['GET'])
+#           5.1.5.3. debug_bulkheads() -> @spotify_widget_bp.route('/debug/bulkheads', methods=['GET'])
 #           5.1.6. spotify_widget(widget_token) -> @spotify_widget_bp.route('/widget/<string:widget_token>', methods=['GET'])
 #      5.2. API Rotaları (API Routes)
 #           5.2.1. get_widget_list() -> @spotify_widget_bp.route('/widget-list', methods=['GET'])
 #           5.2.2. widget_data(widget_token) -> @spotify_widget_bp.route('/api/widget-data/<string:widget_token>', methods=['GET'])
+#           5.2.3. widget_data_batch() -> @spotify_widget_bp.route('/api/widget-data-batch', methods=['GET', 'POST'])
+#           5.2.4. widget_config(widget_token) -> @spotify_widget_bp.route('/api/widget-config/<string:widget_token>', methods=['GET'])
+#           5.2.5. widget_stream(widget_token) -> @spotify_widget_bp.route('/api/widget-stream/<string:widget_token>', methods=['GET'])
 #
 # 6.0  ROTA KAYDI (ROUTE REGISTRATION)
 #      6.1. init_spotify_widget_routes(app)
@@ -39,17 +56,31 @@
 # 1.0 İÇE AKTARMALAR (IMPORTS)
 # =============================================================================
 import datetime
+import hashlib
 import json
 import logging
+import time
 from typing import Any, Dict, Optional, Tuple
 
-from flask import Blueprint, Flask, jsonify, render_template, request
+from flask import Blueprint, Flask, Response, jsonify, render_template, request
+from mysql.connector import Error as MySQLError
 
 # Servisler ve Depolar
 from app.services.auth_service import login_required, session_is_user_logged_in
+from app.services.bulkhead import WIDGET_DATA, WIDGET_STREAM, bulkhead, bulkhead_stats
+from app.services.cache.shared_cache import shared_cache
+from app.config.spotify_config import SpotifyConfig
+from app.services.spotify.circuit_breaker import spotify_api_breaker
+from app.services.spotify.deadline import Deadline
+from app.services.spotify.http_client import spotify_http_client
+from app.services.spotify.playback_poller import PlaybackPoller, playback_poll_interval
+from app.services.spotify.playback_snapshot import playback_snapshot_store
 from app.services.spotify.player_service import SpotifyPlayerService
+from app.services.spotify.rate_limiter import spotify_rate_limiter
+from app.services.spotify.widget.stream_service import WidgetPlaybackStream
 from app.services.spotify.widget.token_service import WidgetTokenService
 from app.database.repositories.widget_repository import SpotifyWidgetRepository
+from app.database.widget_cache import widget_token_cache
 
 # =============================================================================
 # 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
@@ -57,6 +88,10 @@ from app.database.repositories.widget_repository import SpotifyWidgetRepository
 
 logger = logging.getLogger(__name__)
 
+# Duraklatılmışken ETag'e giren ilerlemenin yuvarlama adımı (ms); Spotify'ın
+# ms düzeyindeki sapmaları yeni bir sürüm sayılmaz
+_ETAG_PROGRESS_STEP_MS: int = 2000
+
 # =============================================================================
 # 3.0 BLUEPRINT VE SERVİS BAŞLATMA (BLUEPRINT & SERVICE INITIALIZATION)
 # =============================================================================
@@ -64,29 +99,234 @@ spotify_widget_bp = Blueprint('spotify_widget_bp', __name__, template_folder='..
 widget_token_service = WidgetTokenService()
 spotify_player_service = SpotifyPlayerService()
 widget_repo = SpotifyWidgetRepository()
+# Aktif kullanıcıları arka planda sorgular; ilk `touch()` çağrısında başlar
+playback_poller = PlaybackPoller(
+    fetch=lambda username: _fetch_widget_playback_data(username),
+    store=playback_snapshot_store,
+    playing_interval=SpotifyConfig.PLAYBACK_POLLER_PLAYING_SECONDS,
+    paused_interval=SpotifyConfig.PLAYBACK_POLLER_PAUSED_SECONDS,
+    error_interval=SpotifyConfig.PLAYBACK_POLLER_ERROR_SECONDS,
+    idle_timeout=SpotifyConfig.PLAYBACK_POLLER_IDLE_SECONDS,
+    workers=SpotifyConfig.PLAYBACK_POLLER_WORKERS,
+)
 
 # =============================================================================
 # 4.0 YARDIMCI FONKSİYONLAR (HELPER FUNCTIONS)
 # =============================================================================
 
-def _get_widget_playback_data(username: str) -> Dict[str, Any]:
-    """Kullanıcının şu an çalan parça bilgilerini getirir."""
+def _get_widget_playback_data(username: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """Kullanıcının şu an çalan parça bilgilerini getirir.
+
+    Poller açıkken kullanıcı aktif olarak işaretlenir ve arka planda yazılan
+    son snapshot döndürülür; istek Spotify'ı beklemez. Snapshot henüz yoksa
+    (ilk istek, oynatıcı kontrolü sonrası) veya poller kapalıysa aynı
+    kullanıcının widget'ları kısa süreli snapshot'ı paylaşır; süresi
+    dolduğunda Spotify'a yalnızca tek bir istek gider. `deadline` biterse
+    eski snapshot (`stale=True`) veya hata döndürülür.
+
+    Spotify hata verirken son başarılı snapshot `stale=True` ile döner
+    (widget boşalmaz); ilerleme snapshot'ın yaşı kadar ileri alınır.
+    """
+    data = _peek_widget_playback_data(username)
+    if data is not None:
+        return data
+
     try:
-        logger.debug("_get_widget_playback_data(): username='%s' için playback verisi isteniyor", username)
-        playback_data = spotify_player_service.get_playback_state(username)
+        data = playback_snapshot_store.get_or_fetch(
+            username,
+            lambda: _fetch_widget_playback_data(username, deadline=deadline),
+            timeout=deadline.remaining() if deadline is not None else None,
+        )
+        if data.get("stale_age_ms"):
+            return _advance_progress(data, data["stale_age_ms"] / 1000.0)
+        return data
+    except TimeoutError:
+        logger.warning("_get_widget_playback_data(): süre bütçesi doldu: username='%s'", username)
+        return {"is_playing": False, "error": "Spotify yanıtı süre sınırı içinde alınamadı."}
+
+
+def _peek_widget_playback_data(username: str) -> Optional[Dict[str, Any]]:
+    """Poller açıksa kullanıcıyı aktif işaretler ve son snapshot'ı döndürür.
+
+    Beklemez (DB / Spotify çağrısı yapmaz); snapshot yoksa, `max_stale`'dan
+    eskiyse veya poller kapalıysa None döner. Snapshot paylaşımı kapalıysa
+    (TTL 0) depo sonuç saklamadığından poller de başlatılmaz. ASGI yolu bunu
+    event loop üzerinde çağırır.
+    """
+    if not SpotifyConfig.PLAYBACK_POLLER_ENABLED or playback_snapshot_store.ttl <= 0:
+        return None
+    playback_poller.touch(username)
+    latest = playback_snapshot_store.get_latest(username, max_age=playback_snapshot_store.max_stale)
+    if latest is None:
+        return None
+    data, age = latest
+    resolved = playback_snapshot_store.resolve(username, data)
+    if resolved is not data:
+        age = resolved["stale_age_ms"] / 1000.0
+    return _advance_progress(resolved, age)
+
+
+def _advance_progress(data: Dict[str, Any], age: float) -> Dict[str, Any]:
+    """Çalan parçanın ilerlemesini snapshot'ın yaşı kadar ileri alır (kopya döndürür)."""
+    item = data.get("item") or {}
+    if not data.get("is_playing") or not item or age <= 0:
+        return data
+    result = dict(data)
+    progress = int(data.get("progress_ms") or 0) + int(age * 1000)
+    duration = int(item.get("duration_ms") or 0)
+    result["progress_ms"] = min(progress, duration) if duration else progress
+    return result
+
+
+def _fetch_widget_playback_data(username: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """Kullanıcının çalma durumunu doğrudan Spotify'dan alır."""
+    try:
+        logger.debug("_fetch_widget_playback_data(): username='%s' için playback verisi isteniyor", username)
+        playback_data = spotify_player_service.get_playback_state(username, deadline=deadline)
         if not playback_data:
-            logger.info("_get_widget_playback_data(): aktif çalma durumu bulunamadı: username='%s'", username)
+            logger.info("_fetch_widget_playback_data(): aktif çalma durumu bulunamadı: username='%s'", username)
             return {"is_playing": False, "error": "No active device or playback"}
+        if playback_data.get("error"):
+            return playback_data
+        if playback_data.get("stale"):
+            # API katmanının son başarılı yanıtı (rate limit, açık devre, süre
+            # bütçesi) güncel sonuç gibi saklanmaz; `progress_ms`'i saklandığı
+            # andadır. Hata olarak döner, snapshot deposu kendi son başarılı
+            # snapshot'ını yaşıyla (`stale_age_ms`) sunar.
+            logger.info(
+                "_fetch_widget_playback_data(): Spotify'a gidilmedi, eski yanıt kullanılmıyor: username='%s', yaş=%sms",
+                username,
+                playback_data.get("stale_age_ms"),
+            )
+            result: Dict[str, Any] = {"is_playing": False, "error": "Spotify'dan güncel çalma durumu alınamadı."}
+            for flag in ("throttled", "circuit_open", "deadline_exceeded", "retry_after"):
+                if flag in playback_data:
+                    result[flag] = playback_data[flag]
+            return result
         logger.info(
-            "_get_widget_playback_data(): veri alındı: username='%s', is_playing=%s, track_id=%s",
+            "_fetch_widget_playback_data(): veri alındı: username='%s', is_playing=%s, track_id=%s",
             username,
             playback_data.get("is_playing"),
             (playback_data.get("item") or {}).get("id"),
         )
-        return playback_data
+        # Widget'a yalnızca kullandığı alanlar gider (device, markets vb. atılır)
+        return spotify_player_service.format_playback_state(playback_data)
     except Exception as e:
         logger.error("Playback verisi alınırken hata (Kullanıcı: %s): %s", username, e, exc_info=True)
         return {"is_playing": False, "error": str(e)}
+
+
+def _poll_hint_ms(data: Dict[str, Any]) -> int:
+    """Çalma durumuna göre widget'ın bir sonraki sorgusu için önerilen bekleme (ms)."""
+    interval = playback_poll_interval(
+        data,
+        playing=SpotifyConfig.WIDGET_POLL_PLAYING_SECONDS,
+        paused=SpotifyConfig.WIDGET_POLL_PAUSED_SECONDS,
+        error=SpotifyConfig.WIDGET_POLL_ERROR_SECONDS,
+        min_interval=SpotifyConfig.WIDGET_POLL_MIN_SECONDS,
+    )
+    return int(interval * 1000)
+
+
+def _playback_etag(data: Dict[str, Any], config_version: Optional[str] = None) -> str:
+    """Widget'ın gösterdiği alanlar üzerinden kararlı bir sürüm etiketi üretir.
+
+    Etikete yalnızca yanıtın kendisinden gelen alanlar girer (sunucu saati
+    girmez). Çalarken `progress_ms` her sorguda değiştiği için yerine
+    Spotify'ın `timestamp`'i (son oynat/duraklat/atla/seek anı) kullanılır;
+    ilerleme widget'ta yerel olarak türetilirken seek yine yeni sürüm sayılır.
+    Duraklatılmışken (veya `timestamp` yoksa) yuvarlanmış ilerleme kullanılır.
+    """
+    item = data.get("item") or {}
+    if data.get("is_playing") and data.get("timestamp") is not None:
+        position = ["t", int(data["timestamp"])]
+    else:
+        position = ["p", int(data.get("progress_ms") or 0) // _ETAG_PROGRESS_STEP_MS]
+    key = json.dumps(
+        [bool(data.get("is_playing")), item.get("id"), item.get("name"), position, data.get("error"), config_version],
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _playback_response_parts(
+    data: Dict[str, Any], config_version: Optional[str] = None
+) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+    """widget-data yanıtının ETag'ini, başlıklarını ve gövdesini üretir (istekten bağımsız).
+
+    `config_version` yanıta eklenir; polling yapan widget değiştiğini görünce
+    yeni config'i `/api/widget-config/<token>` üzerinden alır.
+    """
+    etag = _playback_etag(data, config_version)
+    next_poll_ms = _poll_hint_ms(data)
+    headers = {
+        "ETag": f'"{etag}"',
+        "X-Next-Poll-Ms": str(next_poll_ms),
+        # Tarayıcı önbelleğe alabilir ama her seferinde sunucuya sormalı
+        "Cache-Control": "no-cache",
+    }
+    # `server_time`: yanıtın üretildiği an (epoch ms); widget saat farkını tahmin edip
+    # `progress_ms`'e yanıtın yolda geçirdiği süreyi ekler
+    body = dict(data)
+    body["next_poll_ms"] = next_poll_ms
+    body["server_time"] = int(time.time() * 1000)
+    if config_version is not None:
+        body["config_version"] = config_version
+    return etag, headers, body
+
+
+def _playback_response(data: Dict[str, Any], config_version: Optional[str] = None) -> Any:
+    """widget-data yanıtını üretir; `If-None-Match` eşleşirse gövdesiz 304 döndürür."""
+    etag, headers, body = _playback_response_parts(data, config_version)
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+    response = jsonify(body)
+    response.headers.update(headers)
+    return response, 200
+
+def _widget_config_info(widget_token: str) -> Optional[Dict[str, Any]]:
+    """Widget'ın güncel config bilgisini döndürür; token bulunamadıysa None.
+
+    Raises:
+        MySQLError: Token DB'den okunamadıysa (widget silinmiş sayılmamalı).
+    """
+    is_valid, payload = widget_token_service.validate_widget_token(widget_token, strict=True)
+    if not is_valid or not payload:
+        return None
+    return {
+        "config_version": payload.get("config_version"),
+        "widget_type": payload.get("widget_type"),
+        "config": payload.get("config"),
+    }
+
+def _shed_widget_data(widget_token: str) -> Any:
+    """widget-data bölmesi doluyken DB'ye ve Spotify'a gitmeden yanıt üretir.
+
+    Token önbellekte ve kullanıcının snapshot'ı bellekteyse son durum
+    `stale=True` ile döndürülür; aksi halde `Retry-After` başlıklı 503 döner.
+    """
+    entry = widget_token_cache.get(widget_token, local_only=True)
+    latest = (
+        playback_snapshot_store.get_latest(entry.username, max_age=playback_snapshot_store.max_stale)
+        if entry is not None
+        else None
+    )
+    if latest is not None and request.args.get('demo') != '1':
+        data, age = latest
+        data = _advance_progress(playback_snapshot_store.resolve(entry.username, data), age)
+        return _playback_response(dict(data, stale=True), config_version=entry.config_version)
+
+    next_poll_ms = int(SpotifyConfig.WIDGET_POLL_ERROR_SECONDS * 1000)
+    response = jsonify({
+        "is_playing": False,
+        "error": "Sunucu şu an yoğun, lütfen kısa süre sonra tekrar deneyin.",
+        "next_poll_ms": next_poll_ms,
+    })
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    response.headers["X-Next-Poll-Ms"] = str(next_poll_ms)
+    return response
+
 # =============================================================================
 # 5.0 ROTA TANIMLARI (ROUTE DEFINITIONS)
 # =============================================================================
@@ -232,7 +472,7 @@ def update_widget_config() -> Any:
         if isinstance(current_config.get('theme'), dict):
             inferred_type = current_config.get('theme', {}).get('name')
         widget_type_value = (
-            (full_widget.get('widget_type') if full_widget else None)
+            (full_widget.widget_type if full_widget else None)
             or inferred_type
             or "now_playing"
         )
@@ -241,10 +481,11 @@ def update_widget_config() -> Any:
             "beatify_username": username,
             "widget_token": widget_token,
             "widget_name": new_widget_name
-                or (full_widget.get('widget_name', "Spotify Widget") if full_widget else "Spotify Widget"),
+                or (full_widget.widget_name if full_widget else None)
+                or "Spotify Widget",
             "widget_type": widget_type_value,
             "config_data": json.dumps(current_config),
-            "spotify_user_id": full_widget.get('spotify_user_id') if full_widget else None
+            "spotify_user_id": full_widget.spotify_user_id if full_widget else None
         }
         
         success = widget_repo.store_widget_config(widget_data)
@@ -298,10 +539,10 @@ def create_widget() -> Any:
         theme_name = None
         if isinstance(base_config.get('theme'), dict):
             theme_name = base_config.get('theme', {}).get('name')
-        widget_type_value = (theme_name or (base_row.get('widget_type') if base_row else None) or "now_playing")
+        widget_type_value = (theme_name or (base_row.widget_type if base_row else None) or "now_playing")
 
         # İsim belirle
-        base_name = (base_row.get('widget_name') if base_row else None) or "Spotify Widget"
+        base_name = (base_row.widget_name if base_row else None) or "Spotify Widget"
         new_name = None
         if isinstance(requested_name, str) and requested_name.strip():
             new_name = requested_name.strip()[:255]
@@ -311,7 +552,7 @@ def create_widget() -> Any:
             if len(new_name) > 255:
                 new_name = new_name[:255]
 
-        spotify_user_id = base_row.get('spotify_user_id') if base_row else None
+        spotify_user_id = base_row.spotify_user_id if base_row else None
 
         # Yeni token üret ve kaydet (çakışma ihtimaline karşı birkaç deneme)
         new_token: Optional[str] = None
@@ -397,6 +638,31 @@ def debug_widgets() -> Any:
 
     return jsonify(rows), 200
 
+@spotify_widget_bp.route('/debug/widget-cache', methods=['GET'])
+@login_required
+def debug_widget_cache() -> Any:
+    """DEBUG AMAÇLI: widget token önbelleği, playback snapshot, poller ve paylaşılan önbellek sayaçlarını döndürür."""
+    stats = widget_token_cache.stats()
+    stats["playback_snapshots"] = playback_snapshot_store.stats()
+    stats["playback_poller"] = playback_poller.stats()
+    stats["shared_cache"] = shared_cache.stats()
+    return jsonify(stats), 200
+
+@spotify_widget_bp.route('/debug/spotify-http', methods=['GET'])
+@login_required
+def debug_spotify_http() -> Any:
+    """DEBUG AMAÇLI: Spotify HTTP istemcisinin gecikme histogramlarını, rate limit ve circuit breaker durumunu döndürür."""
+    stats = spotify_http_client.stats()
+    stats["rate_limit"] = spotify_rate_limiter.stats()
+    stats["circuit_breaker"] = spotify_api_breaker.stats()
+    return jsonify(stats), 200
+
+@spotify_widget_bp.route('/debug/bulkheads', methods=['GET'])
+@login_required
+def debug_bulkheads() -> Any:
+    """DEBUG AMAÇLI: widget bölmelerinin eşzamanlılık sayaçlarını döndürür."""
+    return jsonify(bulkhead_stats()), 200
+
 @spotify_widget_bp.route('/widget/<string:widget_token>', methods=['GET'])
 def spotify_widget(widget_token: str) -> Any:
     """Belirtilen widget_token ile ilişkili Spotify widget'ını render eder.
@@ -409,7 +675,9 @@ def spotify_widget(widget_token: str) -> Any:
     """
     logger.info("Spotify widget render talebi alındı: widget_token='%s', query_args=%s", widget_token, request.args)
     try:
-        config = widget_repo.get_widget_config_by_token(widget_token)
+        # Önbellekteki config paylaşılır; burada yalnızca okunur (tojson)
+        entry = widget_repo.get_widget_entry_by_token(widget_token)
+        config = entry.config if entry is not None else None
         if not config:
             logger.warning("Spotify widget config bulunamadı, geçersiz token: widget_token='%s'", widget_token)
             return render_template("spotify/widgets/widget-error.html", error="Widget bulunamadı."), 404
@@ -431,6 +699,7 @@ def spotify_widget(widget_token: str) -> Any:
         return render_template(
             template_name,
             config=config,
+            config_version=entry.config_version,
             widget_token=widget_token,
             preview_mode=is_demo_mode,
         )
@@ -448,13 +717,14 @@ def get_widget_list() -> Tuple[Dict[str, Any], int]:
     """Mevcut kullanıcının widget'larını listeler."""
     username = session_is_user_logged_in()
     try:
-        widgets = widget_repo.get_widgets_by_username(username)
-        return jsonify(widgets), 200
+        widgets = widget_repo.get_widgets_by_username(username) or []
+        return jsonify([widget.to_dict() for widget in widgets]), 200
     except Exception as e:
         logger.error(f"Widget listesi alınırken hata (Kullanıcı: {username}): {e}", exc_info=True)
         return jsonify({"error": "Widget listesi alınamadı."}), 500
 
 @spotify_widget_bp.route('/api/widget-data/<string:widget_token>', methods=['GET'])
+@bulkhead(WIDGET_DATA, on_reject=_shed_widget_data)
 def widget_data(widget_token: str) -> Tuple[Dict[str, Any], int]:
     """Widget için gerekli verileri (örn: şu an çalan parça) JSON formatında sağlar.
 
@@ -462,12 +732,20 @@ def widget_data(widget_token: str) -> Tuple[Dict[str, Any], int]:
     Eğer istek ?demo=1 ile gelirse, Spotify'a hiç gitmeden mock/demo
     verisi döndürülür. Böylece Widget Studio önizlemesinde gerçek
     çalma durumuna ihtiyaç kalmaz.
+
+    Gerçek modda yanıt bir `ETag` taşır; widget bunu `If-None-Match` ile geri
+    gönderir ve görünen durum değişmediyse gövdesiz 304 döner.
+
+    Widget istekleri sınırlı bir bölmede çalışır; bölme doluysa son snapshot
+    `stale=True` ile veya 503 döner (bkz. `_shed_widget_data`).
     """
     logger.debug(
         "widget_data(): API isteği alındı: widget_token='%s', query_args=%s",
         widget_token,
         request.args,
     )
+    # İsteğin toplam süre bütçesi: token yenileme + Spotify çağrısı bunu aşamaz
+    deadline = Deadline(SpotifyConfig.WIDGET_DATA_DEADLINE_SECONDS)
 
     # Token'ı doğrula (demo modda bile güvenlik için token'ı kontrol ediyoruz)
     is_valid, payload = widget_token_service.validate_widget_token(widget_token)
@@ -522,18 +800,18 @@ def widget_data(widget_token: str) -> Tuple[Dict[str, Any], int]:
     # --------------------------------------------------------------
     try:
         logger.debug("widget_data(): playback verisi isteniyor: username='%s', widget_token='%s'", username, widget_token)
-        data = _get_widget_playback_data(username)
+        data = _get_widget_playback_data(username, deadline=deadline)
         if not data or 'error' in data:
             logger.warning(
                 "widget_data(): Kullanıcı için çalma durumu alınamadı veya hata döndü: username='%s', error='%s'",
                 username,
                 (data or {}).get("error"),
             )
-            return jsonify({
+            return _playback_response({
                 "is_playing": False,
-                "error": data.get('error', 'Çalma durumu alınamadı'),
+                "error": (data or {}).get('error', 'Çalma durumu alınamadı'),
                 "details": "Spotify'da aktif bir çalma işlemi bulunamadı veya bağlantı hatası oluştu."
-            }), 200
+            }, config_version=payload.get('config_version'))
             
         logger.info(
             "widget_data(): veri başarıyla döndürüldü: username='%s', widget_token='%s', is_playing=%s, track_id=%s",
@@ -542,7 +820,7 @@ def widget_data(widget_token: str) -> Tuple[Dict[str, Any], int]:
             data.get("is_playing"),
             (data.get("item") or {}).get("id"),
         )
-        return jsonify(data), 200
+        return _playback_response(data, config_version=payload.get('config_version'))
         
     except Exception as e:
         logger.error("widget_data(): beklenmeyen hata (widget_token='%s'): %s", widget_token, e, exc_info=True)
@@ -552,6 +830,138 @@ def widget_data(widget_token: str) -> Tuple[Dict[str, Any], int]:
             "details": str(e)
         }), 500
 
+@spotify_widget_bp.route('/api/widget-data-batch', methods=['GET', 'POST'])
+@bulkhead(WIDGET_DATA)
+def widget_data_batch() -> Tuple[Dict[str, Any], int]:
+    """Birden fazla widget token'ı için çalma durumunu tek istekte döndürür.
+
+    Token'lar `?tokens=a,b,c` veya JSON gövdesinde `{"tokens": [...]}` ile
+    verilir. Token'lar tek sorguda doğrulanır, sahiplerine göre gruplanır ve
+    her kullanıcı için playback bir kez alınır. Yanıt `results` altında
+    token -> payload eşlemesidir; geçersiz token'lar `error` içerir.
+    """
+    if request.method == 'POST':
+        body = request.get_json(silent=True) or {}
+        tokens = body.get('tokens') if isinstance(body, dict) else None
+    else:
+        tokens = (request.args.get('tokens') or '').split(',')
+    if not isinstance(tokens, list):
+        return jsonify({"error": "tokens listesi gerekli"}), 400
+
+    tokens = list(dict.fromkeys(t.strip() for t in tokens if isinstance(t, str) and t.strip()))
+    if not tokens:
+        return jsonify({"error": "tokens listesi gerekli"}), 400
+    if len(tokens) > SpotifyConfig.WIDGET_BATCH_MAX_TOKENS:
+        return jsonify({
+            "error": "Çok fazla token",
+            "details": f"Tek istekte en fazla {SpotifyConfig.WIDGET_BATCH_MAX_TOKENS} token gönderilebilir.",
+        }), 400
+
+    deadline = Deadline(SpotifyConfig.WIDGET_DATA_DEADLINE_SECONDS)
+    payloads = widget_token_service.validate_widget_tokens(tokens)
+
+    # Aynı kullanıcının widget'ları tek playback sonucunu paylaşır. Sahipler
+    # sırayla alınır; her biri kalan bütçenin eşit payını kullanır, böylece
+    # yavaş bir sahip sonrakilerin bütçesini tüketmez.
+    owners = list(dict.fromkeys(payloads[t]['beatify_username'] for t in tokens if t in payloads))
+    by_owner: Dict[str, Dict[str, Any]] = {}
+    for index, username in enumerate(owners):
+        try:
+            by_owner[username] = _get_widget_playback_data(username, deadline=deadline.share(len(owners) - index))
+        except Exception as e:
+            logger.error("widget_data_batch(): playback hatası (Kullanıcı: %s): %s", username, e, exc_info=True)
+            by_owner[username] = {"is_playing": False, "error": "Beklenmeyen bir hata oluştu"}
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for token in tokens:
+        payload = payloads.get(token)
+        if payload is None:
+            results[token] = {"is_playing": False, "error": "Geçersiz widget token"}
+            continue
+        data = by_owner[payload['beatify_username']] or {"is_playing": False, "error": "Çalma durumu alınamadı"}
+        results[token] = dict(data, next_poll_ms=_poll_hint_ms(data), config_version=payload.get('config_version'))
+
+    logger.debug(
+        "widget_data_batch(): token=%s, geçerli=%s, kullanıcı=%s",
+        len(tokens),
+        len(payloads),
+        len(by_owner),
+    )
+    return jsonify({"results": results}), 200
+
+@spotify_widget_bp.route('/api/widget-config/<string:widget_token>', methods=['GET'])
+@bulkhead(WIDGET_DATA)
+def widget_config(widget_token: str) -> Any:
+    """Açık bir widget'ın sayfayı yenilemeden yeni temayı uygulayabilmesi için config'ini döndürür.
+
+    `ETag` config sürümüdür; değişiklik yoksa gövdesiz 304 döner.
+    """
+    try:
+        info = _widget_config_info(widget_token)
+    except MySQLError:
+        response = jsonify({"error": "Widget config şu an okunamıyor, lütfen tekrar deneyin."})
+        response.status_code = 503
+        response.headers["Retry-After"] = "1"
+        return response
+    if info is None:
+        logger.warning("Geçersiz widget token ile config talebi: widget_token='%s'", widget_token)
+        return jsonify({"error": "Geçersiz widget token"}), 401
+
+    headers = {"ETag": f'"{info["config_version"]}"', "Cache-Control": "no-cache"}
+    if request.if_none_match.contains(info["config_version"] or ""):
+        return Response(status=304, headers=headers)
+    response = jsonify(info)
+    response.headers.update(headers)
+    return response, 200
+
+@spotify_widget_bp.route('/api/widget-stream/<string:widget_token>', methods=['GET'])
+@bulkhead(WIDGET_STREAM, hold_until_close=True)
+def widget_stream(widget_token: str) -> Any:
+    """Widget'a çalma durumu değişikliklerini Server-Sent Events ile iletir.
+
+    Bağlantı açık kaldığı sürece yalnızca parça değişimi, çal/duraklat, seek
+    ve hata durumlarında `playback` olayı gönderilir; arada heartbeat yollanır.
+    Widget ayarları değişince `config`, widget silinince `revoked` olayı gider.
+    Demo modu desteklenmez (widget bu durumda polling kullanır).
+
+    Açık akışlar ayrı bir bölmede sayılır; yer bağlantı kapanınca boşalır.
+    Bölme doluysa 503 döner ve widget polling'e geçer.
+    """
+    if request.args.get('demo') == '1':
+        return jsonify({"error": "Demo modunda akış desteklenmiyor"}), 400
+
+    is_valid, payload = widget_token_service.validate_widget_token(widget_token)
+    username = payload.get('beatify_username') if is_valid and payload else None
+    if not username:
+        logger.warning("Geçersiz widget token ile akış talebi: widget_token='%s'", widget_token)
+        return jsonify({"error": "Geçersiz widget token"}), 401
+
+    logger.info("widget_stream(): akış açıldı: username='%s', widget_token='%s'", username, widget_token)
+
+    # Not: Generator istek bağlamı dışında çalışır; istek kapsamlı DB bağlantısı
+    # akış başlamadan havuza iade edilir.
+    stream = WidgetPlaybackStream(
+        fetch=lambda: _get_widget_playback_data(
+            username, deadline=Deadline(SpotifyConfig.WIDGET_DATA_DEADLINE_SECONDS)
+        ),
+        check_interval=SpotifyConfig.WIDGET_STREAM_CHECK_SECONDS,
+        heartbeat_interval=SpotifyConfig.WIDGET_STREAM_HEARTBEAT_SECONDS,
+        max_duration=SpotifyConfig.WIDGET_STREAM_MAX_SECONDS,
+        seek_tolerance_ms=SpotifyConfig.WIDGET_STREAM_SEEK_TOLERANCE_MS,
+        config_probe=lambda: _widget_config_info(widget_token),
+        # Sayfa render edildiğinden beri değişiklik olduysa ilk kontrolde gönderilir
+        config_version=request.args.get('config_version') or payload.get('config_version'),
+    )
+    return Response(
+        stream.events(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            # Nginx vb. proxy'lerin olayları tamponlamaması için
+            'X-Accel-Buffering': 'no',
+        },
+    )
+
 # =============================================================================
 # 6.0 ROTA KAYDI (ROUTE REGISTRATION)
 # =============================================================================
@@ -11,8 +11,10 @@
 #      1.1. auth          : Kimlik doğrulama servisleri (paket).
 #      1.2. users         : Kullanıcı domain servisleri (paket).
 #      1.3. spotify       : Spotify domain servisleri (paket).
+#      1.4. cache         : Worker'lar arası paylaşılan önbellek (paket).
 #
 # 2.0  MODÜLLER (MODULES)
 #      2.1. auth_service  : Uygulama genel auth helper/fonksiyonları.
+#      2.2. bulkhead      : Widget rotaları için eşzamanlılık bölmeleri.
 # =============================================================================
 
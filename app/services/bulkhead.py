@@ -0,0 +1,209 @@
+# =============================================================================
+# Bulkhead Modülü (bulkhead.py)
+# =============================================================================
+# Bu modül, rota sınıfları (ör. widget poll'ları, SSE akışları) için
+# eşzamanlılığı sınırlayan `Bulkhead` sınıfını ve `bulkhead` dekoratörünü
+# içerir.
+#
+# Her rota sınıfının kendi semaforu vardır. Sınır doluysa istek kısa bir süre
+# (`max_wait`) bekler; yer açılmazsa işlenmeden reddedilir (load shedding).
+# Reddedilen istek için rotaya özel bir yanıt (ör. eski snapshot) veya
+# varsayılan olarak `Retry-After` başlıklı 503 döndürülür.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. Bulkhead
+#           3.1.1. __init__(name, max_concurrent, max_wait)
+#           3.1.2. acquire()
+#           3.1.3. release()
+#           3.1.4. stats()
+#
+# 4.0  FONKSİYONLAR (FUNCTIONS)
+#      4.1. get_bulkhead(name)
+#      4.2. bulkhead_stats()
+#      4.3. bulkhead(name, on_reject=None, hold_until_close=False)
+#      4.4. _default_reject(compartment)
+#
+# 5.0  BULKHEAD NESNELERİ (BULKHEAD INSTANCES)
+#      5.1. WIDGET_DATA / WIDGET_STREAM
+#      5.2. _bulkheads
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import logging
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+# Üçüncü parti
+from flask import Response, jsonify
+
+# Uygulama içi
+from app.config.config import BULKHEAD_CONFIG
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class Bulkhead:
+    """Bir rota sınıfı için sınırlı eşzamanlılık bölmesi."""
+
+    def __init__(self, name: str, max_concurrent: int, max_wait: float = 0.05) -> None:
+        """
+        Args:
+            name: Bölme adı (loglar / istatistikler için).
+            max_concurrent: Aynı anda işlenebilecek en fazla istek.
+            max_wait: Sınır doluysa yer açılması için en fazla bekleme (saniye).
+        """
+        self.name: str = name
+        self.max_concurrent: int = max(1, int(max_concurrent))
+        self.max_wait: float = max(0.0, float(max_wait))
+
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self.active: int = 0
+        self.accepted: int = 0
+        self.rejected: int = 0
+
+    def acquire(self) -> bool:
+        """Bölmede yer ayırır; `max_wait` içinde yer açılmazsa False döner."""
+        if self.max_wait > 0:
+            acquired = self._semaphore.acquire(timeout=self.max_wait)
+        else:
+            acquired = self._semaphore.acquire(blocking=False)
+        if not acquired:
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            self.active += 1
+            self.accepted += 1
+        return True
+
+    def release(self) -> None:
+        """`acquire()` ile ayrılan yeri bırakır."""
+        with self._lock:
+            self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Bölme sayaçlarını döndürür."""
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "active": self.active,
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+            }
+
+
+# =============================================================================
+# 4.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def get_bulkhead(name: str) -> Optional[Bulkhead]:
+    """Adı verilen bölmeyi döndürür; bulkhead kapalıysa veya tanımsızsa None."""
+    if not BULKHEAD_CONFIG.get("enabled", True):
+        return None
+    return _bulkheads.get(name)
+
+
+def bulkhead_stats() -> Dict[str, Dict[str, Any]]:
+    """Tüm bölmelerin sayaçlarını döndürür."""
+    return {name: compartment.stats() for name, compartment in _bulkheads.items()}
+
+
+def bulkhead(
+    name: str,
+    on_reject: Optional[Callable[..., Any]] = None,
+    hold_until_close: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Rotayı adı verilen bölmede çalıştıran dekoratör.
+
+    Args:
+        name: Bölme adı (ör. `WIDGET_DATA`).
+        on_reject: Bölme doluyken rotanın argümanlarıyla çağrılır ve yanıtı
+            döndürülür. Verilmezse `Retry-After` başlıklı 503 döner.
+        hold_until_close: Akış (SSE) yanıtları için yer, rota döndüğünde değil
+            yanıt kapandığında bırakılır.
+    """
+    def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(f)
+        def decorated_function(*args: Any, **kwargs: Any) -> Any:
+            compartment = get_bulkhead(name)
+            if compartment is None:
+                return f(*args, **kwargs)
+
+            if not compartment.acquire():
+                logger.warning("Bulkhead '%s' dolu, istek reddedildi (%s).", name, f.__name__)
+                if on_reject is not None:
+                    return on_reject(*args, **kwargs)
+                return _default_reject(compartment)
+
+            released = False
+            try:
+                result = f(*args, **kwargs)
+                if hold_until_close and isinstance(result, Response) and result.is_streamed:
+                    result.call_on_close(compartment.release)
+                    released = True
+                return result
+            finally:
+                if not released:
+                    compartment.release()
+        return decorated_function
+    return decorator
+
+
+def _default_reject(compartment: Bulkhead) -> Any:
+    """Bölme doluyken döndürülen varsayılan 503 yanıtı."""
+    response = jsonify({
+        "error": "Sunucu şu an yoğun, lütfen kısa süre sonra tekrar deneyin.",
+        "bulkhead": compartment.name,
+    })
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    return response
+
+
+# =============================================================================
+# 5.0 BULKHEAD NESNELERİ (BULKHEAD INSTANCES)
+# =============================================================================
+
+WIDGET_DATA: str = "widget_data"
+WIDGET_STREAM: str = "widget_stream"
+
+_bulkheads: Dict[str, Bulkhead] = {
+    WIDGET_DATA: Bulkhead(
+        WIDGET_DATA,
+        max_concurrent=int(BULKHEAD_CONFIG["widget_data_max_concurrent"]),
+        max_wait=float(BULKHEAD_CONFIG["max_wait"]),
+    ),
+    WIDGET_STREAM: Bulkhead(
+        WIDGET_STREAM,
+        max_concurrent=int(BULKHEAD_CONFIG["widget_stream_max_concurrent"]),
+        max_wait=float(BULKHEAD_CONFIG["max_wait"]),
+    ),
+}
+
+
+# =============================================================================
+# Bulkhead Modülü Sonu
+# =============================================================================
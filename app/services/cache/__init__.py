@@ -0,0 +1,15 @@
+# =============================================================================
+# Önbellek Servis Paket Tanımı (app.services.cache)
+# =============================================================================
+# Bu paket, worker'lar arasında paylaşılabilen önbellek arayüzünü ve arka
+# uçlarını içerir. Token, widget ve Spotify servisleri kendi süreç içi
+# önbelleklerinin arkasında ikinci seviye olarak bu arayüzü kullanır.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  MODÜLLER (MODULES)
+#      1.1. backend       : CacheBackend arayüzü.
+#      1.2. memory_cache  : Süreç içi arka uç (tek süreç / testler).
+#      1.3. redis_cache   : Redis protokolü konuşan arka uç.
+#      1.4. shared_cache  : Yapılandırmaya göre seçilen ortak önbellek nesnesi.
+# =============================================================================
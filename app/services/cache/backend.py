@@ -0,0 +1,109 @@
+# =============================================================================
+# Önbellek Arayüzü Modülü (backend.py)
+# =============================================================================
+# Bu modül, paylaşılan önbellek arka uçlarının uyguladığı `CacheBackend`
+# arayüzünü içerir.
+#
+# Değerler JSON'a çevrilebilir olmalıdır (dict, list, str, sayı, bool, None).
+# TTL saniye cinsindendir; verilmezse kayıt silinene kadar tutulur.
+# `set_if_absent` atomiktir ve worker'lar arası single-flight kilidi olarak
+# kullanılır.
+#
+# Arka uç hataları (ör. Redis'e ulaşılamaması) çağırana yansıtılmaz: okuma
+# ıska (miss), yazma no-op, `set_if_absent` ise True (kilit alındı) sayılır;
+# böylece önbellek yokken de iş süreç içinde yapılmaya devam eder.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SINIFLAR (CLASSES)
+#      2.1. CacheBackend
+#           2.1.1. get(key)
+#           2.1.2. set(key, value, ttl=None)
+#           2.1.3. delete(key)
+#           2.1.4. set_if_absent(key, value, ttl)
+#           2.1.5. get_many(keys)
+#           2.1.6. set_many(mapping, ttl=None)
+#           2.1.7. wait_for(key, timeout, accept=None, interval=0.05)
+#           2.1.8. stats()
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import time
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+
+# =============================================================================
+# 2.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class CacheBackend:
+    """Paylaşılan önbellek arayüzü (anahtar -> JSON değer, TTL'li)."""
+
+    # Worker'lar (süreçler) arasında paylaşılıyor mu; süreç içi arka uçta False
+    distributed: bool = False
+
+    def get(self, key: str) -> Optional[Any]:
+        """Anahtarın değerini döndürür; yoksa veya süresi dolduysa None."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Değeri yazar (varsa üzerine)."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Anahtarı siler."""
+        raise NotImplementedError
+
+    def set_if_absent(self, key: str, value: Any, ttl: float) -> bool:
+        """Anahtar yoksa değeri yazar ve True döner; varsa dokunmaz ve False döner (atomik)."""
+        raise NotImplementedError
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Birden fazla anahtarı okur; yalnızca bulunanlar döner."""
+        result: Dict[str, Any] = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def set_many(self, mapping: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Birden fazla anahtarı aynı TTL ile yazar."""
+        for key, value in mapping.items():
+            self.set(key, value, ttl)
+
+    def wait_for(
+        self,
+        key: str,
+        timeout: float,
+        accept: Optional[Callable[[Any], bool]] = None,
+        interval: float = 0.05,
+    ) -> Optional[Any]:
+        """Anahtar (kabul edilen) bir değer alana kadar en fazla `timeout` saniye bekler.
+
+        Kilidi başka bir worker tutarken onun sonucu yazmasını beklemek için kullanılır.
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            value = self.get(key)
+            if value is not None and (accept is None or accept(value)):
+                return value
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(interval, remaining))
+
+    def stats(self) -> Dict[str, Any]:
+        """Arka uç sayaçlarını döndürür."""
+        return {}
+
+
+# =============================================================================
+# Önbellek Arayüzü Modülü Sonu
+# =============================================================================
@@ -0,0 +1,141 @@
+# =============================================================================
+# Süreç İçi Önbellek Modülü (memory_cache.py)
+# =============================================================================
+# Bu modül, `CacheBackend` arayüzünün süreç içi (thread-safe LRU + TTL)
+# uygulaması olan `MemoryCache` sınıfını içerir.
+#
+# Worker'lar arasında paylaşılmaz; tek süreçli kurulumlar ve Redis olmadan
+# (çevrimdışı) test için kullanılır. Değerler kopyalanmadan saklanır;
+# dönen nesneler değiştirilmemelidir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SINIFLAR (CLASSES)
+#      2.1. MemoryCache
+#           2.1.1. __init__(max_entries=4096)
+#           2.1.2. get(key)
+#           2.1.3. set(key, value, ttl=None)
+#           2.1.4. delete(key)
+#           2.1.5. set_if_absent(key, value, ttl)
+#           2.1.6. get_many(keys)
+#           2.1.7. set_many(mapping, ttl=None)
+#           2.1.8. stats()
+#           2.1.9. _live(key, now)
+#           2.1.10. _store(key, value, ttl, now)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+# Uygulama içi
+from app.services.cache.backend import CacheBackend
+
+
+# =============================================================================
+# 2.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class MemoryCache(CacheBackend):
+    """Thread-safe, süreç içi LRU + TTL önbellek."""
+
+    distributed = False
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries: int = max(1, int(max_entries))
+        # anahtar -> (bitiş zamanı (monotonic, None: süresiz), değer)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._live(key, time.monotonic())
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._store(key, value, ttl, time.monotonic())
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def set_if_absent(self, key: str, value: Any, ttl: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._live(key, now) is not None:
+                return False
+            self._store(key, value, ttl, now)
+            return True
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        now = time.monotonic()
+        result: Dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                value = self._live(key, now)
+                if value is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    result[key] = value
+        return result
+
+    def set_many(self, mapping: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, value in mapping.items():
+                self._store(key, value, ttl, now)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    def _live(self, key: str, now: float) -> Optional[Any]:
+        """Süresi dolmamış değeri döndürür; dolmuşsa siler (kilit altında çağrılır)."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any, ttl: Optional[float], now: float) -> None:
+        """Değeri yazar ve LRU sınırını uygular (kilit altında çağrılır)."""
+        expires_at = now + float(ttl) if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# =============================================================================
+# Süreç İçi Önbellek Modülü Sonu
+# =============================================================================
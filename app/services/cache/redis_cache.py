@@ -0,0 +1,302 @@
+# =============================================================================
+# Redis Önbellek Modülü (redis_cache.py)
+# =============================================================================
+# Bu modül, `CacheBackend` arayüzünü Redis protokolü (RESP) üzerinden
+# uygulayan `RedisCache` sınıfını içerir. Harici bir istemci kütüphanesi
+# gerektirmez; Redis ve RESP uyumlu sunucularla (KeyDB, Dragonfly vb.)
+# çalışır.
+#
+# Kullanılan komutlar: GET, MGET, SET (PX / NX), DEL, AUTH, SELECT.
+# Toplu yazmalar tek bir pipeline'da gönderilir.
+#
+# Sunucuya ulaşılamazsa hata loglanır ve `retry_after` süresi boyunca
+# istek gönderilmez (her widget isteği bağlantı timeout'u beklemesin).
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _MAX_IDLE_CONNECTIONS
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. RedisCacheError
+#      3.2. _RedisConnection
+#           3.2.1. __init__(host, port, timeout)
+#           3.2.2. execute(commands)
+#           3.2.3. close()
+#           3.2.4. _read_reply()
+#      3.3. RedisCache
+#           3.3.1. __init__(url, prefix, socket_timeout, retry_after)
+#           3.3.2. get(key) / set(...) / delete(key) / set_if_absent(...)
+#           3.3.3. get_many(keys) / set_many(mapping, ttl)
+#           3.3.4. stats()
+#           3.3.5. _execute(*commands)
+#           3.3.6. _acquire() / _release(connection)
+#
+# 4.0  FONKSİYONLAR (FUNCTIONS)
+#      4.1. _encode_command(args)
+#      4.2. _ttl_args(ttl)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+from urllib.parse import unquote, urlparse
+
+# Uygulama içi
+from app.services.cache.backend import CacheBackend
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Havuzda boşta bekletilecek en fazla bağlantı
+_MAX_IDLE_CONNECTIONS: int = 8
+
+Command = Sequence[Union[str, bytes, int]]
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class RedisCacheError(Exception):
+    """Redis bağlantı veya protokol hatası."""
+
+
+class _RedisConnection:
+    """Tek bir Redis TCP bağlantısı (thread-safe değildir; havuzdan alınır)."""
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile("rb")
+
+    def execute(self, commands: Sequence[Command]) -> List[Any]:
+        """Komutları tek seferde gönderir (pipeline) ve yanıtlarını sırayla döndürür."""
+        self.sock.sendall(b"".join(_encode_command(command) for command in commands))
+        return [self._read_reply() for _ in commands]
+
+    def close(self) -> None:
+        """Bağlantıyı kapatır."""
+        try:
+            self.reader.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+    def _read_reply(self) -> Any:
+        """Tek bir RESP yanıtını okur."""
+        line = self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise RedisCacheError("Redis bağlantısı kapandı")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            raise RedisCacheError(payload.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self.reader.read(length + 2)
+            if len(data) != length + 2:
+                raise RedisCacheError("Redis bağlantısı kapandı")
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            if count < 0:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise RedisCacheError(f"Beklenmeyen RESP yanıtı: {line[:32]!r}")
+
+
+class RedisCache(CacheBackend):
+    """Redis protokolü üzerinden paylaşılan önbellek (thread-safe, bağlantı havuzlu)."""
+
+    distributed = True
+
+    def __init__(
+        self,
+        url: str = "redis://127.0.0.1:6379/0",
+        prefix: str = "",
+        socket_timeout: float = 0.25,
+        retry_after: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            url: `redis://[[kullanıcı]:parola@]host[:port][/db]` biçiminde adres.
+            prefix: Tüm anahtarların başına eklenen ön ek.
+            socket_timeout: Bağlantı ve okuma/yazma zaman aşımı (saniye).
+            retry_after: Sunucuya ulaşılamazsa yeniden denemeden önce beklenecek süre.
+        """
+        parsed = urlparse(url)
+        self.host: str = parsed.hostname or "127.0.0.1"
+        self.port: int = parsed.port or 6379
+        self.username: Optional[str] = unquote(parsed.username) if parsed.username else None
+        self.password: Optional[str] = unquote(parsed.password) if parsed.password else None
+        self.db: int = int(parsed.path.lstrip("/") or 0)
+        self.prefix: str = prefix
+        self.socket_timeout: float = max(0.01, float(socket_timeout))
+        self.retry_after: float = max(0.0, float(retry_after))
+
+        self._idle: List[_RedisConnection] = []
+        self._lock = threading.Lock()
+        self._pid: int = os.getpid()
+        self._down_until: float = 0.0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.errors: int = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        reply = self._execute(["GET", self.prefix + key])
+        raw = reply[0] if reply else None
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._execute(["SET", self.prefix + key, json.dumps(value, separators=(",", ":")), *_ttl_args(ttl)])
+
+    def delete(self, key: str) -> None:
+        self._execute(["DEL", self.prefix + key])
+
+    def set_if_absent(self, key: str, value: Any, ttl: float) -> bool:
+        reply = self._execute(["SET", self.prefix + key, json.dumps(value, separators=(",", ":")), "NX", *_ttl_args(ttl)])
+        if reply is None:
+            # Sunucu yok: kilit alınmış sayılır, iş süreç içinde yapılır
+            return True
+        return reply[0] == "OK"
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        reply = self._execute(["MGET", *(self.prefix + key for key in keys)])
+        values = reply[0] if reply else [None] * len(keys)
+        result = {key: json.loads(raw) for key, raw in zip(keys, values) if raw is not None}
+        with self._lock:
+            self.hits += len(result)
+            self.misses += len(keys) - len(result)
+        return result
+
+    def set_many(self, mapping: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        if not mapping:
+            return
+        ttl_args = _ttl_args(ttl)
+        self._execute(*[
+            ["SET", self.prefix + key, json.dumps(value, separators=(",", ":")), *ttl_args]
+            for key, value in mapping.items()
+        ])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "redis",
+                "host": f"{self.host}:{self.port}/{self.db}",
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "idle_connections": len(self._idle),
+                "available": time.monotonic() >= self._down_until,
+            }
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    def _execute(self, *commands: Command) -> Optional[List[Any]]:
+        """Komutları çalıştırır; sunucuya ulaşılamazsa veya hata olursa None döner."""
+        if time.monotonic() < self._down_until:
+            return None
+        connection: Optional[_RedisConnection] = None
+        try:
+            connection = self._acquire()
+            reply = connection.execute(commands)
+        except (OSError, RedisCacheError, ValueError) as exc:
+            if connection is not None:
+                connection.close()
+            with self._lock:
+                self.errors += 1
+                self._down_until = time.monotonic() + self.retry_after
+            logger.warning("RedisCache: komut başarısız (%s:%s): %s", self.host, self.port, exc)
+            return None
+        self._release(connection)
+        return reply
+
+    def _acquire(self) -> _RedisConnection:
+        """Havuzdan boşta bir bağlantı alır; yoksa yenisini açar."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Fork edilen süreç ebeveynin soketlerini kullanamaz
+                self._idle = []
+                self._pid = os.getpid()
+            if self._idle:
+                return self._idle.pop()
+
+        connection = _RedisConnection(self.host, self.port, self.socket_timeout)
+        setup: List[Command] = []
+        if self.password:
+            setup.append(["AUTH", self.username, self.password] if self.username else ["AUTH", self.password])
+        if self.db:
+            setup.append(["SELECT", self.db])
+        if setup:
+            try:
+                connection.execute(setup)
+            except Exception:
+                connection.close()
+                raise
+        return connection
+
+    def _release(self, connection: _RedisConnection) -> None:
+        """Bağlantıyı havuza iade eder (havuz doluysa kapatır)."""
+        with self._lock:
+            if self._pid == os.getpid() and len(self._idle) < _MAX_IDLE_CONNECTIONS:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+
+# =============================================================================
+# 4.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def _encode_command(args: Command) -> bytes:
+    """Komutu RESP dizisi olarak kodlar."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def _ttl_args(ttl: Optional[float]) -> List[Union[str, int]]:
+    """TTL'i `PX <ms>` argümanlarına çevirir (TTL yoksa boş)."""
+    if ttl is None:
+        return []
+    return ["PX", max(1, int(float(ttl) * 1000))]
+
+
+# =============================================================================
+# Redis Önbellek Modülü Sonu
+# =============================================================================
@@ -0,0 +1,82 @@
+# =============================================================================
+# Paylaşılan Önbellek Modülü (shared_cache.py)
+# =============================================================================
+# Bu modül, `CACHE_CONFIG` ayarına göre seçilen ortak önbellek nesnesini
+# (`shared_cache`) ve servislerin ikinci seviye önbellek olarak kullandığı
+# `distributed_cache()` fonksiyonunu içerir.
+#
+# Servislerin süreç içi önbellekleri birinci seviyedir. Arka uç worker'lar
+# arasında paylaşılmıyorsa (memory) ikinci seviye kullanılmaz; davranış tek
+# süreçli kurulumla aynı kalır.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#
+# 3.0  FONKSİYONLAR (FUNCTIONS)
+#      3.1. create_cache_backend(config)
+#      3.2. distributed_cache()
+#
+# 4.0  ÖNBELLEK NESNESİ (CACHE INSTANCE)
+#      4.1. shared_cache
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import logging
+from typing import Mapping, Optional
+
+# Uygulama içi
+from app.config.config import CACHE_CONFIG
+from app.services.cache.backend import CacheBackend
+from app.services.cache.memory_cache import MemoryCache
+from app.services.cache.redis_cache import RedisCache
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# 3.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def create_cache_backend(config: Mapping[str, object] = CACHE_CONFIG) -> CacheBackend:
+    """Yapılandırmaya göre önbellek arka ucunu oluşturur."""
+    backend = str(config.get("backend") or "memory")
+    if backend == "redis":
+        return RedisCache(
+            url=str(config["redis_url"]),
+            prefix=str(config.get("key_prefix") or ""),
+            socket_timeout=float(config["socket_timeout"]),
+            retry_after=float(config["retry_after"]),
+        )
+    if backend != "memory":
+        logger.warning("Bilinmeyen CACHE_BACKEND='%s', süreç içi önbellek kullanılıyor.", backend)
+    return MemoryCache(max_entries=int(config["memory_max_entries"]))
+
+
+def distributed_cache() -> Optional[CacheBackend]:
+    """Worker'lar arasında paylaşılan arka ucu döndürür; paylaşım yoksa None."""
+    return shared_cache if shared_cache.distributed else None
+
+
+# =============================================================================
+# 4.0 ÖNBELLEK NESNESİ (CACHE INSTANCE)
+# =============================================================================
+
+shared_cache: CacheBackend = create_cache_backend()
+
+
+# =============================================================================
+# Paylaşılan Önbellek Modülü Sonu
+# =============================================================================
@@ -15,12 +15,19 @@
 #      2.1. SpotifyApiService
 #           2.1.1. __init__(auth_service=None)
 #           2.1.2. handle_spotify_response(response)
-#           2.1.3. _make_api_request(username, endpoint, method=\"GET\", data=None)
+#           2.1.3. _make_api_request(username, endpoint, method=\"GET\", data=None, deadline=None)
+#           2.1.3.1. _wait_for_rate_limit(username, client_id, deadline=None)
+#           2.1.3.2. _throttled_result(cache_key, retry_after)
+#           2.1.3.3. _deadline_result(cache_key)
+#           2.1.3.4. _circuit_open_result(cache_key)
+#           2.1.3.5. _stale_result(cache_key)
+#           2.1.3.6. _record_outcome(status_code)
+#           2.1.3.7. _record_request_error(error, timeout)
 #           2.1.4. get_user_profile(username)
 #           2.1.5. get_user_playlists(username, limit=20, offset=0)
 #           2.1.6. get_user_top_items(username, item_type, time_range=\"medium_term\", limit=20)
-#           2.1.7. get_playback_state(username)
-#           2.1.8. get_currently_playing(username)
+#           2.1.7. get_playback_state(username, deadline=None)
+#           2.1.8. get_currently_playing(username, deadline=None)
 #           2.1.9. get_recently_played(username, limit=20)
 #           2.1.10. get_available_devices(username)
 #           2.1.11. play(username, context_uri=None, uris=None, device_id=None)
@@ -39,7 +46,9 @@
 # =============================================================================
 
 # Standart kütüphane
-from typing import Any, Dict, List, Optional
+import logging
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 # Üçüncü parti
 import requests
@@ -47,6 +56,12 @@ import requests
 # Uygulama içi
 from app.config.spotify_config import SpotifyConfig
 from app.services.spotify.auth_service import SpotifyAuthService
+from app.services.spotify.circuit_breaker import CircuitBreaker, spotify_api_breaker
+from app.services.spotify.deadline import Deadline, bound_timeout
+from app.services.spotify.http_client import SpotifyHttpClient, spotify_http_client
+from app.services.spotify.rate_limiter import SpotifyRateLimiter, spotify_rate_limiter
+
+logger = logging.getLogger(__name__)
 
 
 class SpotifyApiService:
@@ -63,6 +78,10 @@ class SpotifyApiService:
         self.auth_service: SpotifyAuthService = auth_service or SpotifyAuthService()
         self.base_url: str = SpotifyConfig.API_BASE_URL
         self.profile_url: str = SpotifyConfig.PROFILE_URL
+        self.http: SpotifyHttpClient = spotify_http_client
+        self.rate_limiter: SpotifyRateLimiter = spotify_rate_limiter
+        self.rate_limit_max_wait: float = SpotifyConfig.RATE_LIMIT_MAX_WAIT_SECONDS
+        self.breaker: CircuitBreaker = spotify_api_breaker
 
     # -------------------------------------------------------------------------
     # İç yardımcılar
@@ -111,17 +130,45 @@ class SpotifyApiService:
         username: str,
         endpoint: str,
         method: str = "GET",
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Belirtilen Spotify API endpoint'ine bir HTTP isteği yapar.
+
+        İstekler rate limiter'dan geçer. Soğuma (429 Retry-After) veya bucket
+        beklemesi kısa ise istek bekletilir; uzunsa Spotify'a gidilmez ve GET
+        istekleri için son başarılı yanıt `throttled=True` ile döndürülür.
+
+        `deadline` verilirse token yenileme, rate limit beklemesi ve HTTP
+        timeout'ları kalan bütçeyle sınırlanır; bütçe biterse son başarılı
+        yanıt (`stale=True`) veya 504 hatası döndürülür.
+
+        Art arda ağ hatası / 5xx sonrası circuit breaker açılır; açıkken
+        Spotify'a gidilmez, son başarılı yanıt (`stale=True`) veya 503 döner.
+
+        Son başarılı yanıt döndürüldüğünde yaşı `stale_age_ms` ile verilir.
         """
         try:
-            access_token: Optional[str] = self.auth_service.get_valid_access_token(username)
+            url: str = endpoint if endpoint.startswith("http") else f"{self.base_url}/{endpoint.lstrip('/')}"
+            cache_key: Optional[Tuple[str, str]] = (username, url) if method.upper() == "GET" else None
+
+            access_token: Optional[str] = self.auth_service.get_valid_access_token(username, deadline=deadline)
+            if deadline is not None and deadline.expired:
+                return self._deadline_result(cache_key)
             if not access_token:
                 return {"error": "Geçerli erişim tokenı bulunamadı.", "status_code": 401}
 
-            url: str = endpoint if endpoint.startswith("http") else f"{self.base_url}/{endpoint.lstrip('/')}"
+            client_id: Optional[str] = self.auth_service.get_client_id(username)
+
+            wait: Optional[float] = self._wait_for_rate_limit(username, client_id, deadline=deadline)
+            if wait is not None:
+                return self._throttled_result(cache_key, wait)
+            timeout: float = bound_timeout(deadline, self.http.timeout)
+
+            if not self.breaker.allow():
+                return self._circuit_open_result(cache_key)
+
             headers: Dict[str, str] = {
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/json",
@@ -130,41 +177,66 @@ class SpotifyApiService:
             response: Optional[requests.Response] = None
             try:
                 if method.upper() == "GET":
-                    response = requests.get(url, headers=headers, timeout=10)
+                    response = self.http.get(url, headers=headers, timeout=timeout)
                 elif method.upper() == "POST":
-                    response = requests.post(url, json=data, headers=headers, timeout=10)
+                    response = self.http.post(url, json=data, headers=headers, timeout=timeout)
                 elif method.upper() == "PUT":
-                    response = requests.put(url, json=data, headers=headers, timeout=10)
+                    response = self.http.put(url, json=data, headers=headers, timeout=timeout)
                 elif method.upper() == "DELETE":
-                    response = requests.delete(url, headers=headers, timeout=10)
+                    response = self.http.delete(url, headers=headers, timeout=timeout)
                 else:
                     return {"error": f"Desteklenmeyen HTTP metodu: {method}", "status_code": 405}
             except requests.exceptions.RequestException as req_err:
+                if deadline is not None and deadline.expired:
+                    return self._deadline_result(cache_key)
+                self._record_request_error(req_err, timeout)
                 return {"error": f"Spotify API'sine bağlanırken ağ hatası: {str(req_err)}", "status_code": 503}
 
             if response is None:
                 return {"error": "API isteği yapılamadı (yanıt alınamadı).", "status_code": 500}
+            self._record_outcome(response.status_code)
+
+            if response.status_code == 429:
+                retry_after = self.rate_limiter.on_rate_limited(
+                    client_id,
+                    self.rate_limiter.parse_retry_after(response.headers.get("Retry-After")),
+                )
+                return self._throttled_result(cache_key, retry_after)
 
             response_info: Dict[str, Any] = self.handle_spotify_response(response)
 
             if response_info["action"] == "success":
-                return (
+                result: Dict[str, Any] = (
                     response.json()
                     if response.status_code != 204 and response.text
                     else {"status": "success", "message": response_info["message"], "status_code": response.status_code}
                 )
+                if cache_key is not None:
+                    self.rate_limiter.remember(cache_key, result)
+                return result
             elif response_info["action"] == "refresh_access_token":
-                new_token: Optional[str] = self.auth_service.refresh_access_token(username)
+                new_token: Optional[str] = self.auth_service.refresh_access_token(
+                    username, rejected_token=access_token, deadline=deadline
+                )
+                if deadline is not None and deadline.expired:
+                    return self._deadline_result(cache_key)
                 if new_token:
                     headers["Authorization"] = f"Bearer {new_token}"
                     retry_response: Optional[requests.Response] = None
+                    retry_timeout: float = bound_timeout(deadline, self.http.timeout)
                     try:
                         if method.upper() in ["GET", "POST", "PUT", "DELETE"]:
-                            retry_response = requests.request(method, url, headers=headers, json=data, timeout=10)
+                            retry_response = self.http.request(
+                                method, url, headers=headers, json=data, timeout=retry_timeout
+                            )
                     except requests.exceptions.RequestException as retry_err:
+                        if deadline is not None and deadline.expired:
+                            return self._deadline_result(cache_key)
+                        self._record_request_error(retry_err, retry_timeout)
                         return {"error": f"Token yenileme sonrası ağ hatası: {str(retry_err)}", "status_code": 503}
 
                     if retry_response is not None:
+                        self._record_outcome(retry_response.status_code)
                         retry_info: Dict[str, Any] = self.handle_spotify_response(retry_response)
                         if retry_info["action"] == "success":
                             return (
@@ -192,6 +264,118 @@ class SpotifyApiService:
         except Exception as e:
             return {"error": f"API isteği sırasında beklenmedik bir hata oluştu: {str(e)}", "status_code": 500}
 
+    def _wait_for_rate_limit(
+        self,
+        username: str,
+        client_id: Optional[str],
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[float]:
+        """
+        Rate limiter'dan izin alır. Kısa beklemeler (deadline'a sığıyorsa) burada beklenir.
+
+        Returns:
+            None ise istek gönderilebilir; aksi halde kalan bekleme süresi (saniye).
+        """
+        wait = self.rate_limiter.acquire(username, client_id)
+        if wait <= 0:
+            return None
+        max_wait = self.rate_limit_max_wait if deadline is None else min(self.rate_limit_max_wait, deadline.remaining())
+        if wait > max_wait:
+            return wait
+        time.sleep(wait)
+        wait = self.rate_limiter.acquire(username, client_id)
+        return None if wait <= 0 else wait
+
+    def _throttled_result(self, cache_key: Optional[Hashable], retry_after: float) -> Dict[str, Any]:
+        """
+        Rate limit nedeniyle gönderilmeyen istek için yanıt üretir: varsa son
+        başarılı GET yanıtı (`stale=True`), yoksa 429 hatası (her ikisi de
+        `throttled=True`).
+        """
+        result = self._stale_result(cache_key)
+        if result is not None:
+            result["throttled"] = True
+            result["retry_after"] = round(retry_after, 2)
+            return result
+
+        logger.info("Spotify isteği rate limit nedeniyle gönderilmedi: retry_after=%.2fs", retry_after)
+        return {
+            "error": "Spotify istek limiti aşıldı; istek bir süre sonra tekrar denenecek.",
+            "status_code": 429,
+            "action": "rate_limit_error",
+            "throttled": True,
+            "retry_after": round(retry_after, 2),
+        }
+
+    def _deadline_result(self, cache_key: Optional[Hashable]) -> Dict[str, Any]:
+        """
+        Süre bütçesi biten istek için yanıt üretir: varsa son başarılı GET
+        yanıtı (`stale=True`), yoksa 504 hatası.
+        """
+        result = self._stale_result(cache_key)
+        if result is not None:
+            result["deadline_exceeded"] = True
+            return result
+
+        return {
+            "error": "Spotify yanıtı süre sınırı içinde alınamadı.",
+            "status_code": 504,
+            "deadline_exceeded": True,
+        }
+
+    def _circuit_open_result(self, cache_key: Optional[Hashable]) -> Dict[str, Any]:
+        """
+        Devre açıkken gönderilmeyen istek için yanıt üretir: varsa son başarılı
+        GET yanıtı (`stale=True`), yoksa 503 hatası.
+        """
+        retry_in = round(self.breaker.retry_in(), 2)
+        result = self._stale_result(cache_key)
+        if result is not None:
+            result["circuit_open"] = True
+            result["retry_after"] = retry_in
+            return result
+
+        return {
+            "error": "Spotify şu an yanıt vermiyor; istek bir süre sonra tekrar denenecek.",
+            "status_code": 503,
+            "action": "server_error",
+            "circuit_open": True,
+            "retry_after": retry_in,
+        }
+
+    def _stale_result(self, cache_key: Optional[Hashable]) -> Optional[Dict[str, Any]]:
+        """
+        Son başarılı GET yanıtının `stale=True` ve `stale_age_ms` işaretli
+        kopyasını döndürür (yoksa None). Yanıttaki zamana bağlı alanlar
+        (ör. `progress_ms`) saklandığı andaki değerlerdir; çağıran yaşı
+        hesaba katmalıdır.
+        """
+        cached = self.rate_limiter.last_good(cache_key) if cache_key is not None else None
+        if cached is None:
+            return None
+        data, age = cached
+        result: Dict[str, Any] = dict(data)
+        result["stale"] = True
+        result["stale_age_ms"] = int(age * 1000)
+        return result
+
+    def _record_outcome(self, status_code: int) -> None:
+        """Yanıt durumunu circuit breaker'a bildirir (5xx hata, diğerleri başarı)."""
+        if status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def _record_request_error(self, error: requests.exceptions.RequestException, timeout: float) -> None:
+        """
+        Ağ hatasını circuit breaker'a bildirir. Deadline'ın kısalttığı bir
+        timeout ile alınan zaman aşımı Spotify'ın değil çağıranın bütçesinin
+        sonucudur; hata sayılmaz.
+        """
+        if isinstance(error, requests.exceptions.Timeout) and timeout < self.http.timeout:
+            return
+        self.breaker.record_failure()
+
     # -------------------------------------------------------------------------
     # Profil ve kullanıcı verileri
     # -------------------------------------------------------------------------
@@ -224,13 +408,17 @@ class SpotifyApiService:
     # -------------------------------------------------------------------------
     # Oynatma bilgisi
     # -------------------------------------------------------------------------
-    def get_playback_state(self, username: str) -> Optional[Dict[str, Any]]:
+    def get_playback_state(self, username: str, deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
         """Mevcut çalma durumu hakkında bilgi alır. (Endpoint: GET /v1/me/player)"""
-        return self._make_api_request(username=username, endpoint="me/player")
+        return self._make_api_request(username=username, endpoint="me/player?market=from_token", deadline=deadline)
 
-    def get_currently_playing(self, username: str) -> Optional[Dict[str, Any]]:
+    def get_currently_playing(self, username: str, deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
         """O anda çalan parça hakkında detaylı bilgi alır. (Endpoint: GET /v1/me/player/currently-playing)"""
-        return self._make_api_request(username=username, endpoint="me/player/currently-playing")
+        return self._make_api_request(
+            username=username,
+            endpoint="me/player/currently-playing?market=from_token",
+            deadline=deadline,
+        )
 
     def get_recently_played(self, username: str, limit: int = 20) -> Optional[Dict[str, Any]]:
         """Son dinlenen parçaları alır. (Endpoint: GET /v1/me/player/recently-played)"""
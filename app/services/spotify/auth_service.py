@@ -18,13 +18,16 @@
 #           3.1.1. __init__()
 #           3.1.2. normalize_redirect_uri(redirect_uri)
 #           3.1.3. get_authorization_url(username, client_id, redirect_uri=None)
-#           3.1.4. exchange_code_for_token(code, client_id, client_secret, redirect_uri=None)
-#           3.1.5. get_valid_access_token(username)
-#           3.1.6. refresh_access_token(username)
-#           3.1.7. save_spotify_user_info(username, access_token, refresh_token_to_save)
-#           3.1.8. unlink_spotify_account(username)
-#           3.1.9. get_spotify_user_id_from_token(access_token)
-#           3.1.10. _ensure_datetime_naive(dt)
+#           3.1.4. exchange_code_for_token(code, client_id, client_secret, redirect_uri=None, username=None)
+#           3.1.5. get_valid_access_token(username, deadline=None)
+#           3.1.6. refresh_access_token(username, rejected_token=None, deadline=None)
+#           3.1.7. _refresh_access_token(username)
+#           3.1.8. get_client_id(username)
+#           3.1.9. save_spotify_user_info(username, access_token, refresh_token_to_save)
+#           3.1.10. unlink_spotify_account(username)
+#           3.1.11. get_spotify_user_id_from_token(access_token)
+#           3.1.12. _ensure_datetime_naive(dt)
+#           3.1.13. _set_session_token(access_token, expires_in)
 # =============================================================================
 
 # =============================================================================
@@ -34,17 +37,22 @@
 # Standart kütüphane
 import base64
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Union
 from urllib.parse import urlparse, urlunparse
 
 # Üçüncü parti
 import requests
-from flask import session
+from flask import has_request_context, session
 
 # Uygulama içi
 from app.config.spotify_config import SpotifyConfig
 from app.database.repositories.spotify_account_repository import SpotifyUserRepository
+from app.services.spotify.deadline import Deadline, bound_timeout
+from app.services.spotify.http_client import SpotifyHttpClient, spotify_http_client
+from app.services.spotify.single_flight import SingleFlight
+from app.services.spotify.token_store import SpotifyAccessToken, SpotifyTokenStore, spotify_token_store
 
 
 # =============================================================================
@@ -53,6 +61,13 @@ from app.database.repositories.spotify_account_repository import SpotifyUserRepo
 
 logger = logging.getLogger(__name__)
 
+# Token yenilemeyi bekleyen çağıranların en fazla bekleme süresi (saniye).
+# Token endpoint'inin HTTP timeout'undan (10 sn) biraz uzun tutulur.
+_REFRESH_WAIT_SECONDS: float = 15.0
+
+# Kullanıcı başına aynı anda tek token yenileme (tüm servis örnekleri paylaşır)
+_refresh_flight: SingleFlight = SingleFlight()
+
 
 class SpotifyAuthService:
     """
@@ -68,6 +83,9 @@ class SpotifyAuthService:
         self.token_url: str = SpotifyConfig.TOKEN_URL
         self.redirect_uri: str = SpotifyConfig.REDIRECT_URI
         self.scopes: str = SpotifyConfig.SCOPES
+        self.token_store: SpotifyTokenStore = spotify_token_store
+        self.http: SpotifyHttpClient = spotify_http_client
+        self.refresh_margin_seconds: int = SpotifyConfig.TOKEN_REFRESH_MARGIN_SECONDS
         self.spotify_repo: SpotifyUserRepository = SpotifyUserRepository()
         self.profile_url: str = SpotifyConfig.PROFILE_URL
 
@@ -139,9 +157,11 @@ class SpotifyAuthService:
         client_id: str,
         client_secret: str,
         redirect_uri: Optional[str] = None,
+        username: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Spotify'dan alınan yetkilendirme kodunu erişim ve yenileme token'larını almak için kullanır.
+        `username` verilirse alınan access token sunucu tarafı depoya da yazılır.
         """
         try:
             credentials: str = f"{client_id}:{client_secret}"
@@ -158,14 +178,15 @@ class SpotifyAuthService:
                 "Content-Type": "application/x-www-form-urlencoded",
             }
 
-            response = requests.post(self.token_url, data=payload, headers=headers, timeout=10)
+            response = self.http.post(self.token_url, data=payload, headers=headers)
             response.raise_for_status()
 
             token_info: Dict[str, Any] = response.json()
             if "access_token" in token_info:
-                session["spotify_access_token"] = token_info["access_token"]
                 expires_in = token_info.get("expires_in", 3600)
-                session["spotify_token_expires_at"] = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
+                self._set_session_token(token_info["access_token"], expires_in)
+                if username:
+                    self.token_store.put(username, token_info["access_token"], expires_in, client_id=client_id)
                 if "refresh_token" in token_info:
                     session["spotify_refresh_token"] = token_info["refresh_token"]
 
@@ -176,28 +197,97 @@ class SpotifyAuthService:
     # -------------------------------------------------------------------------
     # TOKEN YÖNETİMİ METOTLARI (TOKEN MANAGEMENT METHODS)
     # -------------------------------------------------------------------------
-    def get_valid_access_token(self, username: str) -> Optional[str]:
+    def get_valid_access_token(self, username: str, deadline: Optional[Deadline] = None) -> Optional[str]:
         """
         Geçerli bir Spotify erişim token'ı döndürür. Gerekirse yeniler.
+
+        Token sunucu tarafı depodan (`spotify_token_store`) okunur; bu sayede
+        oturumu olmayan çağıranlar (OBS widget'ı, arka plan thread'leri) her
+        seferinde token yenilemez.
+
+        Args:
+            deadline: Çağıran isteğin süre bütçesi; yenileme gerekirse yalnızca
+                sonucun bekleneceği süre bununla sınırlanır.
         """
-        access_token: Optional[str] = session.get("spotify_access_token")
-        token_expires_at_iso: Optional[str] = session.get("spotify_token_expires_at")
+        stored = self.token_store.get(username)
+        if stored is not None and stored.is_valid(self.refresh_margin_seconds):
+            return stored.access_token
 
-        if access_token and token_expires_at_iso:
+        return self.refresh_access_token(username, deadline=deadline)
+
+    def refresh_access_token(
+        self,
+        username: str,
+        rejected_token: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[str]:
+        """
+        Süresi dolmuş bir erişim token'ını yenileme token'ı kullanarak yeniler.
+
+        Aynı kullanıcı için eşzamanlı çağrılar tek bir yenilemede birleştirilir;
+        diğer çağıranlar onun sonucunu bekler. Sıra gelen çağıran, depoda bu
+        arada yenilenmiş geçerli bir token bulursa yeni istek atmaz. Paylaşılan
+        önbellek varsa birleştirme worker'lar arasında da yapılır: yenilemeyi
+        başka bir worker yapıyorsa onun yazacağı token beklenir.
+
+        Yenileme arka plan thread'inde tam HTTP timeout'uyla çalışır; süresi
+        biten çağıran None alır ama yenileme sürer ve depodaki token, bir
+        çağıranın kısa bütçesi yüzünden geçersiz kılınmaz.
+
+        Args:
+            username: Beatify kullanıcı adı.
+            rejected_token: Spotify'ın 401 ile reddettiği token; depoda hâlâ bu
+                token varsa geçerli sayılmaz ve yenileme yapılır.
+            deadline: Çağıran isteğin süre bütçesi (yalnızca beklemeyi sınırlar).
+        """
+        def usable(token: Optional[SpotifyAccessToken]) -> bool:
+            return (
+                token is not None
+                and token.access_token != rejected_token
+                and token.is_valid(self.refresh_margin_seconds)
+            )
+
+        def refresh() -> Optional[str]:
+            stored = self.token_store.get(username)
+            if usable(stored):
+                return stored.access_token
+            # Başka bir worker bu arada yenilemiş olabilir
+            shared = self.token_store.get_shared(username)
+            if usable(shared):
+                return shared.access_token
+
+            owns_lock = self.token_store.acquire_refresh_lock(username)
+            if not owns_lock:
+                # Yenilemeyi başka bir worker yapıyor; yazmasını bekle
+                waited = self.token_store.wait_for_shared(username, usable, timeout=_REFRESH_WAIT_SECONDS)
+                if waited is not None:
+                    return waited.access_token
+                logger.warning("Başka worker'ın token yenilemesi beklenemedi, yeniden deneniyor: username='%s'", username)
             try:
-                token_expires_at_dt = self._ensure_datetime_naive(datetime.fromisoformat(token_expires_at_iso))
-                now_naive = self._ensure_datetime_naive(datetime.now())
+                return self._refresh_access_token(username)
+            finally:
+                if owns_lock:
+                    self.token_store.release_refresh_lock(username)
 
-                if token_expires_at_dt and now_naive and (token_expires_at_dt > now_naive + timedelta(minutes=5)):
-                    return access_token
-            except ValueError:
-                pass
+        try:
+            # Yenileme arka planda tam HTTP timeout'uyla sürer; çağıranın
+            # deadline'ı yalnızca kendi beklemesini kısaltır
+            access_token = _refresh_flight.do_detached(
+                username, refresh, timeout=bound_timeout(deadline, _REFRESH_WAIT_SECONDS)
+            )
+        except TimeoutError:
+            logger.warning("Spotify token yenilemesi beklenirken süre doldu: username='%s'", username)
+            return None
 
-        return self.refresh_access_token(username)
+        stored = self.token_store.get(username)
+        if access_token and stored is not None and stored.access_token == access_token:
+            self._set_session_token(access_token, int(stored.expires_at - time.time()))
+        return access_token
 
-    def refresh_access_token(self, username: str) -> Optional[str]:
+    def _refresh_access_token(self, username: str) -> Optional[str]:
         """
-        Süresi dolmuş bir erişim token'ını yenileme token'ı kullanarak yeniler.
+        Token endpoint'ine yenileme isteği atar (yalnızca single-flight
+        çalıştırması çağırır; istek bağlamı olmayan bir thread'de çalışır).
         """
         try:
             spotify_user_data = self.spotify_repo.get_spotify_user_data(username)
@@ -220,7 +310,7 @@ class SpotifyAuthService:
                 "Content-Type": "application/x-www-form-urlencoded",
             }
 
-            response = requests.post(self.token_url, data=payload, headers=headers, timeout=10)
+            response = self.http.post(self.token_url, data=payload, headers=headers, timeout=self.http.timeout)
             response.raise_for_status()
 
             new_token_info = response.json()
@@ -229,13 +319,11 @@ class SpotifyAuthService:
             if not new_access_token:
                 return None
 
-            session["spotify_access_token"] = new_access_token
             expires_in = new_token_info.get("expires_in", 3600)
-            session["spotify_token_expires_at"] = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
+            self.token_store.put(username, new_access_token, expires_in, client_id=client_id)
 
             new_refresh_token = new_token_info.get("refresh_token")
             if new_refresh_token and spotify_user_data.get("spotify_user_id"):
-                session["spotify_refresh_token"] = new_refresh_token
                 self.spotify_repo.update_user_connection(
                     username=username,
                     spotify_user_id=spotify_user_data["spotify_user_id"],
@@ -243,10 +331,19 @@ class SpotifyAuthService:
                 )
             return new_access_token
         except requests.exceptions.RequestException:
-            session.pop("spotify_access_token", None)
-            session.pop("spotify_token_expires_at", None)
+            self.token_store.invalidate(username)
             return None
 
+    def get_client_id(self, username: str) -> Optional[str]:
+        """
+        Kullanıcının token'ını aldığı Spotify uygulamasının client_id'sini döndürür.
+        """
+        stored = self.token_store.get(username)
+        if stored is not None and stored.client_id:
+            return stored.client_id
+        spotify_user_data = self.spotify_repo.get_spotify_user_data(username)
+        return spotify_user_data.get("client_id") if spotify_user_data else None
+
     # -------------------------------------------------------------------------
     # HESAP VE VERİ YÖNETİMİ (ACCOUNT & DATA MANAGEMENT)
     # -------------------------------------------------------------------------
@@ -327,6 +424,7 @@ class SpotifyAuthService:
             session.pop("spotify_token_expires_at", None)
             session.pop("spotify_refresh_token", None)
             session.pop("spotify_user_id", None)
+            self.token_store.invalidate(username)
 
             return self.spotify_repo.delete_linked_account(username)
         except Exception:
@@ -341,7 +439,7 @@ class SpotifyAuthService:
 
         headers = {"Authorization": f"Bearer {access_token}"}
         try:
-            response = requests.get(self.profile_url, headers=headers, timeout=10)
+            response = self.http.get(self.profile_url, headers=headers)
             response.raise_for_status()
             return response.json().get("id")
         except requests.exceptions.RequestException:
@@ -370,6 +468,13 @@ class SpotifyAuthService:
             return dt_obj.replace(tzinfo=None)
         return dt_obj
 
+    def _set_session_token(self, access_token: str, expires_in: int) -> None:
+        """Token'ı (varsa) aktif isteğin session'ına da yazar."""
+        if not has_request_context():
+            return
+        session["spotify_access_token"] = access_token
+        session["spotify_token_expires_at"] = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
+
 
 __all__ = ["SpotifyAuthService"]
 
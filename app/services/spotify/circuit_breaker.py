@@ -0,0 +1,180 @@
+# =============================================================================
+# Circuit Breaker Modülü (circuit_breaker.py)
+# =============================================================================
+# Bu modül, Spotify API host'u için art arda gelen hatalardan sonra istekleri
+# bir süre kesen `CircuitBreaker` sınıfını içerir.
+#
+# Durumlar:
+#   - closed    : istekler normal gönderilir; art arda hata sayılır
+#   - open      : eşik aşıldı; `reset_timeout` boyunca istek gönderilmez
+#   - half_open : süre doldu; tek bir deneme (probe) isteğine izin verilir.
+#                 Başarılıysa closed, başarısızsa yeniden open olur.
+#
+# Hata sayılanlar: ağ hataları / timeout ve 5xx yanıtlar. 4xx ve 429 host'un
+# ayakta olduğunu gösterdiği için başarı sayılır (429 rate limiter'ın işidir).
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. CLOSED / OPEN / HALF_OPEN
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. CircuitBreaker
+#           3.1.1. __init__(name, failure_threshold, reset_timeout)
+#           3.1.2. allow()
+#           3.1.3. record_success()
+#           3.1.4. record_failure()
+#           3.1.5. state
+#           3.1.6. retry_in()
+#           3.1.7. stats()
+#
+# 4.0  BREAKER NESNESİ (BREAKER INSTANCE)
+#      4.1. spotify_api_breaker
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Uygulama içi
+from app.config.spotify_config import SpotifyConfig
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+CLOSED: str = "closed"
+OPEN: str = "open"
+HALF_OPEN: str = "half_open"
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class CircuitBreaker:
+    """Thread-safe, host bazlı basit circuit breaker."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 15.0) -> None:
+        """
+        Args:
+            name: Loglarda görünen ad (ör. host).
+            failure_threshold: Devreyi açan art arda hata sayısı.
+            reset_timeout: Açık devrenin deneme isteğine izin vermeden önce beklediği süre (saniye).
+        """
+        self.name: str = name
+        self.failure_threshold: int = max(1, int(failure_threshold))
+        self.reset_timeout: float = max(0.1, float(reset_timeout))
+
+        self._state: str = CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+        self.rejected: int = 0
+        self.trips: int = 0
+
+    def allow(self) -> bool:
+        """İsteğin gönderilip gönderilemeyeceğini döndürür.
+
+        half_open durumunda aynı anda tek bir deneme isteğine izin verilir;
+        deneme sonuçlanmadan `reset_timeout` geçerse yeni bir denemeye izin verilir.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if now - self._opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self._state = HALF_OPEN
+                self._probe_started_at = None
+            # HALF_OPEN
+            if self._probe_started_at is not None and now - self._probe_started_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self._probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Başarılı isteği kaydeder; devre açıksa kapatır."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("CircuitBreaker[%s]: deneme başarılı, devre kapandı.", self.name)
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Başarısız isteği kaydeder; eşik aşılırsa (veya deneme başarısızsa) devreyi açar."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.trips += 1
+                    logger.warning(
+                        "CircuitBreaker[%s]: %s art arda hata, devre %.1f sn açık.",
+                        self.name,
+                        self._failures,
+                        self.reset_timeout,
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+    @property
+    def state(self) -> str:
+        """Güncel durum (closed / open / half_open)."""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def retry_in(self) -> float:
+        """Açık devrenin deneme isteğine izin vermesine kalan süre (saniye)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker durumunu ve sayaçlarını döndürür."""
+        state = self.state
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": state,
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+# =============================================================================
+# 4.0 BREAKER NESNESİ (BREAKER INSTANCE)
+# =============================================================================
+
+spotify_api_breaker: CircuitBreaker = CircuitBreaker(
+    name="api.spotify.com",
+    failure_threshold=SpotifyConfig.CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=SpotifyConfig.CIRCUIT_RESET_SECONDS,
+)
+
+
+# =============================================================================
+# Circuit Breaker Modülü Sonu
+# =============================================================================
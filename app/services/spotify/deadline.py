@@ -0,0 +1,93 @@
+# =============================================================================
+# İstek Süre Bütçesi Modülü (deadline.py)
+# =============================================================================
+# Bu modül, bir isteğin toplam süre bütçesini (deadline) taşıyan `Deadline`
+# sınıfını içerir.
+#
+# Rota bir bütçe ile `Deadline` oluşturur (ör. widget_data için 1.5 sn) ve
+# bunu `SpotifyPlayerService` -> `SpotifyApiService` -> `SpotifyAuthService`
+# zincirine `deadline` argümanıyla geçirir. Her adım HTTP timeout'unu kendi
+# varsayılanı ile kalan bütçenin küçüğü olarak seçer; bütçe bittiyse Spotify'a
+# gitmeden önbellekteki / eski veriyle döner.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER (CONSTANTS)
+#      2.1. _MIN_TIMEOUT_SECONDS
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. Deadline
+#           3.1.1. __init__(budget_seconds)
+#           3.1.2. remaining()
+#           3.1.3. expired
+#           3.1.4. timeout(default)
+#           3.1.5. share(parts)
+#      3.2. bound_timeout(deadline, default)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import time
+from typing import Optional
+
+
+# =============================================================================
+# 2.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+# requests'e verilecek en küçük timeout; 0 veya negatif timeout geçersizdir
+_MIN_TIMEOUT_SECONDS: float = 0.05
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class Deadline:
+    """Monotonic saate dayalı istek süre bütçesi."""
+
+    __slots__ = ("budget_seconds", "expires_at")
+
+    def __init__(self, budget_seconds: float) -> None:
+        self.budget_seconds: float = max(0.0, float(budget_seconds))
+        self.expires_at: float = time.monotonic() + self.budget_seconds
+
+    def remaining(self) -> float:
+        """Kalan süreyi (saniye, en az 0) döndürür."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Bütçenin tükenip tükenmediğini döndürür."""
+        return time.monotonic() >= self.expires_at
+
+    def timeout(self, default: float) -> float:
+        """`default` ile kalan bütçenin küçüğünü döndürür (HTTP timeout için)."""
+        return max(_MIN_TIMEOUT_SECONDS, min(float(default), self.remaining()))
+
+    def share(self, parts: int) -> "Deadline":
+        """Kalan bütçenin `parts`'ta birini alan yeni bir `Deadline` döndürür.
+
+        Aynı bütçeyle sırayla yapılan işlerde (ör. toplu istekte sahip başına
+        playback) her iş payını alır; erken biten işin artan süresi sonrakilere
+        kalır, yavaş bir iş diğerlerini aç bırakmaz.
+        """
+        return Deadline(self.remaining() / max(1, int(parts)))
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget_seconds:.3f}s, remaining={self.remaining():.3f}s)"
+
+
+def bound_timeout(deadline: Optional[Deadline], default: float) -> float:
+    """Deadline verilmişse ona göre kısaltılmış, verilmemişse varsayılan timeout."""
+    return deadline.timeout(default) if deadline is not None else float(default)
+
+
+# =============================================================================
+# İstek Süre Bütçesi Modülü Sonu
+# =============================================================================
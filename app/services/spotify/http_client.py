@@ -0,0 +1,259 @@
+# =============================================================================
+# Spotify HTTP İstemci Modülü (http_client.py)
+# =============================================================================
+# Bu modül, Spotify Web API ve token endpoint'ine yapılan tüm HTTP isteklerinin
+# geçtiği `SpotifyHttpClient` sınıfını içerir.
+#
+# Pooled modda tek bir `requests.Session` (urllib3 bağlantı havuzu) paylaşılır;
+# böylece api.spotify.com / accounts.spotify.com bağlantıları keep-alive ile
+# yeniden kullanılır ve her istek DNS + TCP + TLS maliyeti ödemez. Unpooled
+# mod her istekte yeni bağlantı açar ve yalnızca karşılaştırma içindir.
+#
+# Her istek süresi mod bazında bir gecikme histogramına yazılır.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _LATENCY_BUCKETS_MS
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. LatencyHistogram
+#           3.1.1. __init__(buckets_ms=_LATENCY_BUCKETS_MS)
+#           3.1.2. observe(elapsed_ms)
+#           3.1.3. percentile(pct)
+#           3.1.4. snapshot()
+#      3.2. SpotifyHttpClient
+#           3.2.1. __init__(pooled=True, pool_maxsize=20, timeout=10.0)
+#           3.2.2. mode
+#           3.2.3. request(method, url, **kwargs)
+#           3.2.4. get / post / put / delete
+#           3.2.5. prewarm(urls=None)
+#           3.2.6. prewarm_in_background(urls=None)
+#           3.2.7. stats()
+#           3.2.8. close()
+#           3.2.9. _get_session()
+#           3.2.10. _build_session()
+#
+# 4.0  İSTEMCİ NESNESİ (CLIENT INSTANCE)
+#      4.1. spotify_http_client
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import bisect
+import logging
+import os
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Üçüncü parti
+import requests
+from requests.adapters import HTTPAdapter
+
+# Uygulama içi
+from app.config.spotify_config import SpotifyConfig
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Histogram kova üst sınırları (ms); son kova bunların üstündeki her şeyi sayar
+_LATENCY_BUCKETS_MS: Sequence[float] = (5, 10, 25, 50, 75, 100, 150, 250, 500, 1000, 2500, 5000, 10000)
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class LatencyHistogram:
+    """Kova tabanlı, thread-safe gecikme histogramı (ms)."""
+
+    def __init__(self, buckets_ms: Sequence[float] = _LATENCY_BUCKETS_MS) -> None:
+        self.buckets_ms: List[float] = sorted(float(b) for b in buckets_ms)
+        self._counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self._lock = threading.Lock()
+        self.count: int = 0
+        self.total_ms: float = 0.0
+        self.max_ms: float = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """Bir ölçümü histograma ekler."""
+        idx = bisect.bisect_left(self.buckets_ms, elapsed_ms)
+        with self._lock:
+            self._counts[idx] += 1
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if elapsed_ms > self.max_ms:
+                self.max_ms = elapsed_ms
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Yüzdelik değeri, düştüğü kovanın üst sınırı olarak döndürür."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(1, int(round(self.count * pct / 100.0)))
+            seen = 0
+            for idx, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank:
+                    return self.buckets_ms[idx] if idx < len(self.buckets_ms) else self.max_ms
+            return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Histogram özetini döndürür."""
+        p50, p95, p99 = self.percentile(50), self.percentile(95), self.percentile(99)
+        with self._lock:
+            buckets = {f"le_{int(b)}": c for b, c in zip(self.buckets_ms, self._counts)}
+            buckets["inf"] = self._counts[-1]
+            return {
+                "count": self.count,
+                "mean_ms": round(self.total_ms / self.count, 2) if self.count else None,
+                "max_ms": round(self.max_ms, 2),
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "p99_ms": p99,
+                "buckets": buckets,
+            }
+
+
+class SpotifyHttpClient:
+    """Spotify istekleri için paylaşılan, thread-safe HTTP istemcisi."""
+
+    def __init__(self, pooled: bool = True, pool_maxsize: int = 20, timeout: float = 10.0) -> None:
+        self.pooled: bool = pooled
+        self.pool_maxsize: int = max(1, int(pool_maxsize))
+        self.timeout: float = float(timeout)
+
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self._histograms: Dict[str, LatencyHistogram] = {
+            "pooled": LatencyHistogram(),
+            "unpooled": LatencyHistogram(),
+        }
+        self.errors: int = 0
+
+    @property
+    def mode(self) -> str:
+        """Aktif mod adı ("pooled" / "unpooled")."""
+        return "pooled" if self.pooled else "unpooled"
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """HTTP isteği yapar; `requests.request` ile aynı argümanları alır."""
+        kwargs.setdefault("timeout", self.timeout)
+        mode = self.mode
+        started = time.perf_counter()
+        try:
+            if self.pooled:
+                response = self._get_session().request(method, url, **kwargs)
+            else:
+                response = requests.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self.errors += 1
+            raise
+        self._histograms[mode].observe((time.perf_counter() - started) * 1000.0)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def prewarm(self, urls: Optional[Iterable[str]] = None) -> None:
+        """Spotify host'larına bağlantıyı önceden açar (yalnızca pooled modda)."""
+        if not self.pooled:
+            return
+        targets = list(urls) if urls is not None else [SpotifyConfig.API_BASE_URL, SpotifyConfig.TOKEN_URL]
+        session = self._get_session()
+        for url in targets:
+            try:
+                # Yanıt kodu önemsiz (ör. 401/405); amaç bağlantının havuza girmesi
+                session.head(url, timeout=min(self.timeout, 5.0), allow_redirects=False).close()
+            except requests.exceptions.RequestException as exc:
+                logger.info("Spotify bağlantı ön ısıtması başarısız: url='%s', hata=%s", url, exc)
+
+    def prewarm_in_background(self, urls: Optional[Iterable[str]] = None) -> threading.Thread:
+        """`prewarm()`'u açılışı bekletmeden daemon thread'de çalıştırır."""
+        thread = threading.Thread(target=self.prewarm, args=(urls,), name="spotify-http-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> Dict[str, Any]:
+        """Mod bazında gecikme histogramlarını döndürür."""
+        return {
+            "mode": self.mode,
+            "pool_maxsize": self.pool_maxsize,
+            "errors": self.errors,
+            "latency": {name: hist.snapshot() for name, hist in self._histograms.items()},
+        }
+
+    def close(self) -> None:
+        """Paylaşılan session'ı ve havuzdaki bağlantıları kapatır."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._session_pid = None
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    def _get_session(self) -> requests.Session:
+        """Bu süreç için paylaşılan session'ı döndürür (fork sonrası yeniden kurulur)."""
+        pid = os.getpid()
+        session = self._session
+        if session is not None and self._session_pid == pid:
+            return session
+        with self._lock:
+            if self._session is None or self._session_pid != pid:
+                # Fork edilen süreçte ebeveynin soketleri kullanılmamalı
+                self._session = self._build_session()
+                self._session_pid = pid
+            return self._session
+
+    def _build_session(self) -> requests.Session:
+        """Havuz boyutları ayarlanmış, cookie tutmayan bir session oluşturur."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_maxsize, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Session kullanıcılar arasında paylaşıldığı için hiçbir cookie saklanmaz
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+
+# =============================================================================
+# 4.0 İSTEMCİ NESNESİ (CLIENT INSTANCE)
+# =============================================================================
+
+spotify_http_client: SpotifyHttpClient = SpotifyHttpClient(
+    pooled=SpotifyConfig.HTTP_POOLED,
+    pool_maxsize=SpotifyConfig.HTTP_POOL_MAXSIZE,
+    timeout=SpotifyConfig.HTTP_TIMEOUT_SECONDS,
+)
+
+
+# =============================================================================
+# Spotify HTTP İstemci Modülü Sonu
+# =============================================================================
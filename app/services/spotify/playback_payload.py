@@ -0,0 +1,148 @@
+# =============================================================================
+# Playback Payload Modülü (playback_payload.py)
+# =============================================================================
+# Bu modül, Spotify `GET /me/player` yanıtını widget'ların kullandığı küçük
+# ve sabit şemalı bir payload'a indirgeyen projeksiyon fonksiyonunu içerir.
+#
+# Ham yanıt; cihaz, context, actions ve parça başına `available_markets`
+# dizileri gibi widget'ın hiç kullanmadığı alanlar taşır. Widget yalnızca
+# çalma durumu, ilerleme, süre, parça adı, sanatçılar ve albüm kapağını
+# kullanır. Şema, widget JS'inin beklediği (`item.album.images[0].url` vb.)
+# iç içe yapıyla uyumludur.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  TİPLER (TYPES)
+#      2.1. PlaybackImage
+#      2.2. PlaybackArtist
+#      2.3. PlaybackAlbum
+#      2.4. PlaybackItem
+#      2.5. PlaybackPayload
+#
+# 3.0  SABİTLER (CONSTANTS)
+#      3.1. _PASSTHROUGH_FLAGS
+#
+# 4.0  FONKSİYONLAR (FUNCTIONS)
+#      4.1. project_playback_state(raw)
+#      4.2. _project_item(item)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+
+# =============================================================================
+# 2.0 TİPLER (TYPES)
+# =============================================================================
+
+class PlaybackImage(TypedDict):
+    url: str
+
+
+class PlaybackArtist(TypedDict):
+    name: str
+
+
+class PlaybackAlbum(TypedDict):
+    images: List[PlaybackImage]
+
+
+class PlaybackItem(TypedDict):
+    id: Optional[str]
+    name: str
+    duration_ms: int
+    artists: List[PlaybackArtist]
+    album: PlaybackAlbum
+
+
+class PlaybackPayload(TypedDict, total=False):
+    is_playing: bool
+    progress_ms: int
+    item: Optional[PlaybackItem]
+    # Spotify'ın çalma durumunu son değiştirdiği an (epoch ms; oynat, duraklat,
+    # parça değişimi, seek). İlerleme ilerledikçe değişmez.
+    timestamp: int
+    # Opsiyonel durum işaretleri (rate limit / süre bütçesi)
+    stale: bool
+    throttled: bool
+    retry_after: float
+    deadline_exceeded: bool
+    circuit_open: bool
+    stale_age_ms: int
+    # widget-data yanıtına eklenen polling ipucu
+    next_poll_ms: int
+    server_time: int
+
+
+# =============================================================================
+# 3.0 SABİTLER (CONSTANTS)
+# =============================================================================
+
+# Ham yanıtta varsa olduğu gibi taşınan işaretler
+_PASSTHROUGH_FLAGS: Tuple[str, ...] = ("stale", "throttled", "retry_after", "deadline_exceeded", "circuit_open")
+
+
+# =============================================================================
+# 4.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def project_playback_state(raw: Optional[Dict[str, Any]]) -> PlaybackPayload:
+    """Ham `GET /me/player` yanıtını widget payload'ına indirger.
+
+    Args:
+        raw: Spotify yanıtı (veya `SpotifyApiService` çıktısı). Boş olabilir.
+
+    Returns:
+        `is_playing`, `progress_ms`, `item` ve (varsa) `timestamp` alanlarını
+        içeren sözlük.
+    """
+    raw = raw or {}
+    item = raw.get("item")
+    payload: PlaybackPayload = {
+        "is_playing": bool(raw.get("is_playing")),
+        "progress_ms": int(raw.get("progress_ms") or 0),
+        "item": _project_item(item) if isinstance(item, dict) else None,
+    }
+    if raw.get("timestamp") is not None:
+        payload["timestamp"] = int(raw["timestamp"])
+    for flag in _PASSTHROUGH_FLAGS:
+        if flag in raw:
+            payload[flag] = raw[flag]  # type: ignore[literal-required]
+    return payload
+
+
+def _project_item(item: Dict[str, Any]) -> PlaybackItem:
+    """Parça (veya podcast bölümü) nesnesini sadeleştirir."""
+    artists: List[PlaybackArtist] = [
+        {"name": artist.get("name") or ""}
+        for artist in item.get("artists") or []
+        if isinstance(artist, dict)
+    ]
+    # Podcast bölümlerinde sanatçı yerine program adı, albüm yerine bölüm görselleri var
+    show = item.get("show") if isinstance(item.get("show"), dict) else None
+    if not artists and show and show.get("name"):
+        artists = [{"name": show["name"]}]
+
+    album = item.get("album") if isinstance(item.get("album"), dict) else {}
+    images = album.get("images") or item.get("images") or (show or {}).get("images") or []
+    # Widget yalnızca ilk (en büyük) görseli kullanır
+    first_url = next((img.get("url") for img in images if isinstance(img, dict) and img.get("url")), None)
+
+    return {
+        "id": item.get("id"),
+        "name": item.get("name") or "",
+        "duration_ms": int(item.get("duration_ms") or 0),
+        "artists": artists,
+        "album": {"images": [{"url": first_url}] if first_url else []},
+    }
+
+
+# =============================================================================
+# Playback Payload Modülü Sonu
+# =============================================================================
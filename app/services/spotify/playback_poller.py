@@ -0,0 +1,278 @@
+# =============================================================================
+# Playback Poller Modülü (playback_poller.py)
+# =============================================================================
+# Bu modül, aktif widget'ı olan kullanıcıların çalma durumunu arka planda
+# sorgulayan `PlaybackPoller` sınıfını içerir.
+#
+# Widget istekleri kullanıcıyı `touch()` ile "aktif" olarak işaretler ve
+# sonucu snapshot deposundan okur. Zamanlayıcı thread'i kullanıcıları bir
+# heap üzerinde sıradaki sorgu zamanına göre tutar; sorguları küçük bir
+# thread havuzunda çalıştırır ve sonucu snapshot deposuna yazar. Böylece
+# Spotify trafiği widget sayısıyla değil aktif kullanıcı sayısıyla ölçeklenir.
+#
+# Sorgu aralığı çalma durumuna göre ayarlanır:
+#   - çalıyorsa: temel aralık, parça bitimine yakınsa bitişten hemen sonra
+#   - duraklatılmışsa / cihaz yoksa: daha seyrek
+#   - hata varsa: geri çekilme aralığı
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _TRACK_END_MARGIN_SECONDS
+#
+# 3.0  FONKSİYONLAR (FUNCTIONS)
+#      3.1. playback_poll_interval(data, playing, paused, error, min_interval)
+#
+# 4.0  SINIFLAR (CLASSES)
+#      4.1. PlaybackPoller
+#           4.1.1. __init__(fetch, store, ...)
+#           4.1.2. touch(username)
+#           4.1.3. start()
+#           4.1.4. stop()
+#           4.1.5. next_interval(data)
+#           4.1.6. stats()
+#           4.1.7. _run()
+#           4.1.8. _poll(username)
+#           4.1.9. _schedule(username, due)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import heapq
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Uygulama içi
+from app.services.spotify.playback_snapshot import PlaybackSnapshotStore
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Parça bitiminden bu kadar sonra sorgu yapılır (yeni parça Spotify'da görünsün)
+_TRACK_END_MARGIN_SECONDS: float = 0.5
+
+
+# =============================================================================
+# 3.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def playback_poll_interval(
+    data: Optional[Dict[str, Any]],
+    playing: float,
+    paused: float,
+    error: float,
+    min_interval: float,
+) -> float:
+    """Çalma durumuna göre bir sonraki sorguya kadar beklenecek süre (saniye).
+
+    Hem sunucu tarafı poller hem de widget'a gönderilen `next_poll_ms`
+    ipucu bu kuralı kullanır (farklı aralıklarla).
+    """
+    if not data or data.get("error"):
+        return error
+    item = data.get("item") or {}
+    if not data.get("is_playing") or not item:
+        return paused
+
+    duration_ms = int(item.get("duration_ms") or 0)
+    progress_ms = int(data.get("progress_ms") or 0)
+    remaining = (duration_ms - progress_ms) / 1000.0
+    if 0 < remaining < playing:
+        # Parça bitince hemen yeni parçayı yakala
+        return max(min_interval, remaining + _TRACK_END_MARGIN_SECONDS)
+    return playing
+
+
+# =============================================================================
+# 4.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class PlaybackPoller:
+    """Aktif kullanıcıları arka planda sorgulayan zamanlayıcı."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Dict[str, Any]],
+        store: PlaybackSnapshotStore,
+        playing_interval: float = 2.0,
+        paused_interval: float = 5.0,
+        error_interval: float = 10.0,
+        min_interval: float = 0.5,
+        idle_timeout: float = 60.0,
+        workers: int = 4,
+    ) -> None:
+        """
+        Args:
+            fetch: Kullanıcının çalma durumunu Spotify'dan alan fonksiyon.
+            store: Sonuçların yazılacağı snapshot deposu.
+            playing_interval: Çalarken temel sorgu aralığı (saniye).
+            paused_interval: Duraklatılmışken / cihaz yokken sorgu aralığı.
+            error_interval: Hata sonrası sorgu aralığı.
+            min_interval: En kısa sorgu aralığı.
+            idle_timeout: Bu süre boyunca widget isteği gelmeyen kullanıcı bırakılır.
+            workers: Eşzamanlı Spotify sorgusu sayısı.
+        """
+        self.fetch = fetch
+        self.store: PlaybackSnapshotStore = store
+        self.playing_interval: float = playing_interval
+        self.paused_interval: float = paused_interval
+        self.error_interval: float = error_interval
+        self.min_interval: float = min_interval
+        self.idle_timeout: float = idle_timeout
+        self.workers: int = max(1, int(workers))
+
+        self._heap: List[Tuple[float, str]] = []
+        self._due: Dict[str, float] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._in_progress: Set[str] = set()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._stopping: bool = False
+
+        self.polls: int = 0
+        self.errors: int = 0
+
+    def touch(self, username: str) -> None:
+        """Kullanıcıyı aktif olarak işaretler; ilk kez görülüyorsa hemen sorgu planlar."""
+        self.start()
+        now = time.monotonic()
+        with self._cond:
+            self._last_seen[username] = now
+            if username not in self._due and username not in self._in_progress:
+                self._schedule(username, now)
+
+    def start(self) -> None:
+        """Zamanlayıcı thread'ini başlatır (idempotent, fork sonrası yeniden başlatır)."""
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._cond:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                # Fork edilen süreç ebeveynin planını / thread'lerini devralamaz
+                self._heap.clear()
+                self._due.clear()
+                self._in_progress.clear()
+            self._pid = pid
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="playback-poll")
+            self._thread = threading.Thread(target=self._run, name="playback-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Zamanlayıcıyı durdurur."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def next_interval(self, data: Dict[str, Any]) -> float:
+        """Son çalma durumuna göre bir sonraki sorguya kadar beklenecek süre (saniye)."""
+        return playback_poll_interval(
+            data, self.playing_interval, self.paused_interval, self.error_interval, self.min_interval
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Zamanlayıcı durumunu döndürür."""
+        with self._cond:
+            return {
+                "running": bool(self._thread and self._thread.is_alive()),
+                "active_users": len(self._last_seen),
+                "scheduled": len(self._due),
+                "in_progress": len(self._in_progress),
+                "polls": self.polls,
+                "errors": self.errors,
+            }
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Zamanlayıcı döngüsü: vadesi gelen kullanıcıları havuza gönderir."""
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+                now = time.monotonic()
+                # Planı güncel olmayan (yeniden planlanmış) heap kayıtlarını at
+                while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                due, username = self._heap[0]
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+                heapq.heappop(self._heap)
+                del self._due[username]
+
+                idle = now - self._last_seen.get(username, 0.0) > self.idle_timeout
+                if idle:
+                    # Widget'ı kapanan kullanıcıyı bırak
+                    self._last_seen.pop(username, None)
+                    logger.debug("PlaybackPoller: kullanıcı pasif, sorgu durduruldu: username='%s'", username)
+                else:
+                    self._in_progress.add(username)
+                executor = self._executor
+
+            if idle:
+                # Artık yenilenmeyecek snapshot'ı sil (depo kendi kilidini kullanır)
+                self.store.discard(username)
+                continue
+            try:
+                executor.submit(self._poll, username)
+            except RuntimeError:
+                # Havuz kapatılmış (stop)
+                return
+
+    def _poll(self, username: str) -> None:
+        """Tek kullanıcı için sorgu yapar, sonucu depoya yazar ve sonraki sorguyu planlar."""
+        data: Dict[str, Any]
+        try:
+            # Bu worker'da aynı kullanıcı için devam eden yenilemeye katılır;
+            # başka bir worker yeni sorguladıysa onun sonucu kullanılır
+            data = self.store.get_or_fetch(username, lambda: self.fetch(username), force=True)
+        except Exception as exc:
+            logger.error("PlaybackPoller: sorgu hatası: username='%s', hata=%s", username, exc, exc_info=True)
+            data = {"is_playing": False, "error": str(exc)}
+            self.store.put(username, data)
+
+        interval = self.next_interval(data)
+        with self._cond:
+            self.polls += 1
+            if data.get("error"):
+                self.errors += 1
+            self._in_progress.discard(username)
+            if username in self._last_seen:
+                self._schedule(username, time.monotonic() + interval)
+
+    def _schedule(self, username: str, due: float) -> None:
+        """Kullanıcıyı `due` zamanına planlar (kilit altında çağrılır)."""
+        self._due[username] = due
+        heapq.heappush(self._heap, (due, username))
+        self._cond.notify()
+
+
+# =============================================================================
+# Playback Poller Modülü Sonu
+# =============================================================================
@@ -0,0 +1,395 @@
+# =============================================================================
+# Playback Snapshot Modülü (playback_snapshot.py)
+# =============================================================================
+# Bu modül, kullanıcı başına son `GET /me/player` sonucunu kısa bir süre
+# tutan `PlaybackSnapshotStore` sınıfını içerir.
+#
+# Bir yayıncının birden fazla widget'ı (modern, classic, kopyalar) aynı
+# kullanıcı için ayrı ayrı sorgu yapar. Snapshot süresi dolmamışsa tüm
+# widget'lar aynı sonucu kullanır; süresi dolmuşsa yalnızca bir çağıran
+# Spotify'a gider (single-flight), diğerleri onun sonucunu bekler.
+#
+# Stale-while-revalidate: süresi yeni dolmuş snapshot hemen `stale=True`
+# işaretiyle döndürülür ve yenileme arka planda yapılır. Spotify hata
+# verirken (5xx, timeout, açık devre) son başarılı snapshot `max_stale`
+# süresince `stale=True` ve `stale_age_ms` ile sunulur; widget boşalmaz.
+#
+# Paylaşılan bir önbellek (ör. Redis) yapılandırılmışsa snapshot'lar
+# worker'lar arasında paylaşılır: bir worker'ın Spotify'dan aldığı sonuç
+# diğerlerine de gider ve aynı kullanıcı için aynı anda tek worker sorgu
+# yapar (set-if-absent kilidi).
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _MAX_ENTRIES
+#      2.3. _SHARED_LOCK_SECONDS / _SHARED_WAIT_SECONDS
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. PlaybackSnapshotStore
+#           3.1.1. __init__(ttl=1.5, max_entries=_MAX_ENTRIES, max_stale=30.0, shared=None)
+#           3.1.2. get(username)
+#           3.1.3. get_stale(username)
+#           3.1.4. get_latest(username, max_age=None)
+#           3.1.5. get_or_fetch(username, fetch, timeout=None, force=False)
+#           3.1.6. refresh(username, fetch)
+#           3.1.7. put(username, data)
+#           3.1.8. resolve(username, data)
+#           3.1.9. invalidate(username)
+#           3.1.10. discard(username)
+#           3.1.11. stats()
+#           3.1.12. _store(username, data, age)
+#           3.1.13. _shared_snapshot(username, wait)
+#           3.1.14. _revalidate(username, load)
+#           3.1.15. _stale_copy(data, age)
+#           3.1.16. _prune(now)
+#
+# 4.0  FONKSİYONLAR (FUNCTIONS)
+#      4.1. _shared_key(username)
+#      4.2. _lock_key(username)
+#
+# 5.0  DEPO NESNESİ (STORE INSTANCE)
+#      5.1. playback_snapshot_store
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Uygulama içi
+from app.config.spotify_config import SpotifyConfig
+from app.services.cache.backend import CacheBackend
+from app.services.cache.shared_cache import distributed_cache
+from app.services.spotify.single_flight import SingleFlight
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Bu sayı aşılırsa süresi dolmuş snapshot'lar temizlenir
+_MAX_ENTRIES: int = 1024
+
+# Worker'lar arası sorgu kilidinin ömrü (saniye); kilidi alan worker çökerse
+# diğerleri en geç bu kadar sonra sorgulayabilir
+_SHARED_LOCK_SECONDS: float = 5.0
+
+# Kilidi başka worker tutarken onun sonucunu en fazla bekleme süresi (saniye)
+_SHARED_WAIT_SECONDS: float = 2.0
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class PlaybackSnapshotStore:
+    """Kullanıcı bazlı, kısa ömürlü ve thread-safe playback snapshot deposu.
+
+    Not: Dönen sözlükler çağıranlar arasında paylaşılır; değiştirilmemelidir.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1.5,
+        max_entries: int = _MAX_ENTRIES,
+        max_stale: float = 30.0,
+        shared: Optional[CacheBackend] = None,
+    ) -> None:
+        self.ttl: float = max(0.0, float(ttl))
+        self.max_entries: int = max(1, int(max_entries))
+        self.max_stale: float = max(0.0, float(max_stale))
+        # Worker'lar arası paylaşılan ikinci seviye (opsiyonel)
+        self.shared: Optional[CacheBackend] = shared
+
+        self._snapshots: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Kullanıcı başına son hatasız snapshot ve yazıldığı an (monotonic)
+        self._last_good: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._flight: SingleFlight = SingleFlight()
+
+        self.hits: int = 0
+        self.fetches: int = 0
+        self.stale_served: int = 0
+        self.revalidations: int = 0
+        self.shared_hits: int = 0
+
+    def get(self, username: str) -> Optional[Dict[str, Any]]:
+        """Kullanıcının süresi dolmamış snapshot'ını döndürür."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._snapshots.get(username)
+            if item is None or item[0] <= now:
+                return None
+            self.hits += 1
+            return item[1]
+
+    def get_stale(self, username: str) -> Optional[Dict[str, Any]]:
+        """Kullanıcının son snapshot'ını süresine bakmadan döndürür."""
+        with self._lock:
+            item = self._snapshots.get(username)
+            return item[1] if item is not None else None
+
+    def get_latest(
+        self, username: str, max_age: Optional[float] = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Son snapshot'ı ve yaşını (yazıldığından beri geçen saniye) döndürür.
+
+        Args:
+            max_age: Verilirse bundan eski snapshot yok sayılır (None döner).
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._snapshots.get(username)
+            if item is None:
+                return None
+            age = max(0.0, now - (item[0] - self.ttl))
+            if max_age is not None and age > max_age:
+                return None
+            self.hits += 1
+            return item[1], age
+
+    def get_or_fetch(
+        self,
+        username: str,
+        fetch: Callable[[], Dict[str, Any]],
+        timeout: Optional[float] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Geçerli snapshot'ı döndürür; yoksa `fetch()` ile (tek seferde) yeniler.
+
+        Süresi dolmuş ama `max_stale` içindeki snapshot beklenmeden `stale=True`
+        ile döndürülür ve yenileme arka planda başlatılır.
+
+        Args:
+            timeout: Başka bir çağıranın devam eden yenilemesini en fazla kaç
+                saniye bekleneceği. Süre dolarsa `max_stale` içindeki eski
+                snapshot `stale=True` işaretli bir kopya olarak döndürülür.
+            force: True ise (arka plan poller'ı) geçerli veya eski snapshot'a
+                bakılmadan yenilenir; kullanıcı için devam eden bir yenileme
+                varsa onun sonucu beklenir. Sonuç `resolve` edilmeden döner.
+
+        Raises:
+            TimeoutError: Süre doldu ve `max_stale` içinde eski snapshot yoksa.
+        """
+        if self.ttl <= 0:
+            return fetch()
+        if force:
+            return self._flight.do(username, lambda: self.refresh(username, fetch), timeout=timeout)
+
+        cached = self.get(username)
+        if cached is not None:
+            return self.resolve(username, cached)
+
+        def load() -> Dict[str, Any]:
+            # Sırada beklerken başka bir lider snapshot'ı yenilemiş olabilir
+            fresh = self.get(username)
+            if fresh is not None:
+                return fresh
+            return self.refresh(username, fetch)
+
+        latest = self.get_latest(username)
+        if latest is not None and latest[1] <= self.max_stale:
+            self._revalidate(username, load)
+            return self.resolve(username, self._stale_copy(*latest))
+
+        try:
+            return self.resolve(username, self._flight.do(username, load, timeout=timeout))
+        except TimeoutError:
+            stale = self.get_latest(username, max_age=self.max_stale)
+            if stale is None:
+                raise
+            return self.resolve(username, self._stale_copy(*stale))
+
+    def refresh(self, username: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Snapshot'ı `fetch()` ile yeniler ve döndürür (single-flight liderinde çalışır).
+
+        Paylaşılan önbellekte başka bir worker'ın yazdığı güncel snapshot varsa
+        Spotify'a gidilmez; o worker sorgu yapıyorsa sonucu kısa süre beklenir.
+        """
+        owns_lock = False
+        if self.shared is not None:
+            published = self._shared_snapshot(username)
+            if published is not None:
+                return published
+            owns_lock = self.shared.set_if_absent(_lock_key(username), 1, ttl=_SHARED_LOCK_SECONDS)
+            if not owns_lock:
+                published = self._shared_snapshot(username, wait=_SHARED_WAIT_SECONDS)
+                if published is not None:
+                    return published
+
+        try:
+            with self._lock:
+                self.fetches += 1
+            data = fetch()
+            self.put(username, data)
+            return data
+        finally:
+            if owns_lock:
+                self.shared.delete(_lock_key(username))
+
+    def put(self, username: str, data: Dict[str, Any]) -> None:
+        """Kullanıcının snapshot'ını yazar; hatasızsa son başarılı snapshot olarak da saklar.
+
+        Paylaşılan önbellek varsa snapshot diğer worker'lara da yayınlanır.
+        """
+        if self.ttl <= 0:
+            return
+        self._store(username, data)
+        if self.shared is not None:
+            self.shared.set(_shared_key(username), {"at": time.time(), "data": data}, ttl=self.ttl)
+
+    def resolve(self, username: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Hatalı sonuç yerine (`max_stale` içindeyse) son başarılı snapshot'ı döndürür.
+
+        Dönen kopya `stale=True` ve `stale_age_ms` taşır; hata yoksa `data` aynen döner.
+        """
+        if not data.get("error"):
+            return data
+        with self._lock:
+            item = self._last_good.get(username)
+        if item is None:
+            return data
+        age = time.monotonic() - item[0]
+        if age > self.max_stale:
+            return data
+        return self._stale_copy(item[1], age)
+
+    def invalidate(self, username: str) -> None:
+        """Kullanıcının snapshot'ını siler (ör. oynatıcı kontrolünden sonra).
+
+        Son başarılı snapshot korunur; yenileme başarısız olursa yine sunulabilir.
+        """
+        with self._lock:
+            self._snapshots.pop(username, None)
+        if self.shared is not None:
+            self.shared.delete(_shared_key(username))
+
+    def discard(self, username: str) -> None:
+        """Kullanıcının süreç içindeki snapshot'ını ve son başarılı kaydını siler.
+
+        Poller kullanıcıyı pasif sayıp bıraktığında çağrılır; widget geri
+        döndüğünde eski snapshot güncelmiş gibi sunulmaz.
+        """
+        with self._lock:
+            self._snapshots.pop(username, None)
+            self._last_good.pop(username, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Depo sayaçlarını döndürür."""
+        with self._lock:
+            return {
+                "size": len(self._snapshots),
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "fetches": self.fetches,
+                "last_good": len(self._last_good),
+                "stale_served": self.stale_served,
+                "revalidations": self.revalidations,
+                "shared_hits": self.shared_hits,
+            }
+
+    def _store(self, username: str, data: Dict[str, Any], age: float = 0.0) -> None:
+        """Snapshot'ı süreç içine yazar; `age` snapshot'ın yazıldığından beri geçen süredir."""
+        now = time.monotonic()
+        written_at = now - max(0.0, age)
+        with self._lock:
+            self._snapshots[username] = (written_at + self.ttl, data)
+            if not data.get("error") and not data.get("stale"):
+                self._last_good[username] = (written_at, data)
+            if len(self._snapshots) > self.max_entries or len(self._last_good) > self.max_entries:
+                self._prune(now)
+
+    def _shared_snapshot(self, username: str, wait: float = 0.0) -> Optional[Dict[str, Any]]:
+        """Paylaşılan önbellekteki güncel (`ttl` içindeki) snapshot'ı süreç içine alır ve döndürür.
+
+        Args:
+            wait: Güncel snapshot yoksa yazılmasını en fazla kaç saniye bekleneceği.
+        """
+        def fresh(value: Dict[str, Any]) -> bool:
+            return time.time() - float(value.get("at") or 0) < self.ttl
+
+        if wait > 0:
+            item = self.shared.wait_for(_shared_key(username), wait, accept=fresh)
+        else:
+            item = self.shared.get(_shared_key(username))
+        if item is None or not fresh(item):
+            return None
+        data = item["data"]
+        self._store(username, data, age=time.time() - float(item["at"]))
+        with self._lock:
+            self.shared_hits += 1
+        return data
+
+    def _revalidate(self, username: str, load: Callable[[], Dict[str, Any]]) -> None:
+        """Snapshot'ı arka planda yeniler (kullanıcı için zaten yenileme varsa bir şey yapmaz)."""
+        if self._flight.in_flight(username):
+            return
+        with self._lock:
+            self.revalidations += 1
+
+        def run() -> None:
+            try:
+                self._flight.do(username, load)
+            except Exception as exc:
+                logger.warning("PlaybackSnapshotStore: arka plan yenileme hatası: username='%s', hata=%s", username, exc)
+
+        threading.Thread(target=run, name="playback-revalidate", daemon=True).start()
+
+    def _stale_copy(self, data: Dict[str, Any], age: float) -> Dict[str, Any]:
+        """Snapshot'ın `stale=True` ve `stale_age_ms` işaretli kopyasını döndürür."""
+        with self._lock:
+            self.stale_served += 1
+        result = dict(data)
+        result["stale"] = True
+        result["stale_age_ms"] = int(age * 1000)
+        return result
+
+    def _prune(self, now: float) -> None:
+        """Süresi dolmuş snapshot'ları ve çok eski son başarılı kayıtları siler (kilit altında çağrılır)."""
+        expired = [key for key, (expires_at, _) in self._snapshots.items() if expires_at <= now]
+        for key in expired:
+            del self._snapshots[key]
+        too_old = [key for key, (written_at, _) in self._last_good.items() if now - written_at > self.max_stale]
+        for key in too_old:
+            del self._last_good[key]
+
+
+# =============================================================================
+# 4.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def _shared_key(username: str) -> str:
+    """Paylaşılan önbellekteki snapshot anahtarı."""
+    return f"spotify:playback:{username}"
+
+
+def _lock_key(username: str) -> str:
+    """Paylaşılan önbellekteki sorgu kilidi anahtarı."""
+    return f"spotify:lock:playback:{username}"
+
+
+# =============================================================================
+# 5.0 DEPO NESNESİ (STORE INSTANCE)
+# =============================================================================
+
+playback_snapshot_store: PlaybackSnapshotStore = PlaybackSnapshotStore(
+    ttl=SpotifyConfig.PLAYBACK_SNAPSHOT_TTL_SECONDS,
+    max_stale=SpotifyConfig.PLAYBACK_SNAPSHOT_MAX_STALE_SECONDS,
+    shared=distributed_cache(),
+)
+
+
+# =============================================================================
+# Playback Snapshot Modülü Sonu
+# =============================================================================
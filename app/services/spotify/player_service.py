@@ -13,8 +13,9 @@
 # 2.0  SINIFLAR (CLASSES)
 #      2.1. SpotifyPlayerService
 #           2.1.1. __init__(api_service=None)
-#           2.1.2. get_playback_state(username)
-#           2.1.3. get_currently_playing(username)
+#           2.1.2. get_playback_state(username, deadline=None)
+#           2.1.3. get_currently_playing(username, deadline=None)
+#           2.1.3.1. format_playback_state(playback_state)
 #           2.1.4. get_recently_played(username, limit=20)
 #           2.1.5. get_available_devices(username)
 #           2.1.6. play(username, context_uri=None, uris=None, device_id=None)
@@ -37,6 +38,8 @@ from typing import Any, Dict, List, Optional
 
 # Uygulama içi
 from app.services.spotify.api_service import SpotifyApiService
+from app.services.spotify.deadline import Deadline
+from app.services.spotify.playback_payload import PlaybackPayload, project_playback_state
 
 
 class SpotifyPlayerService:
@@ -54,13 +57,18 @@ class SpotifyPlayerService:
     # -------------------------------------------------------------------------
     # OYNATMA BİLGİSİ METOTLARI (PLAYBACK INFORMATION METHODS)
     # -------------------------------------------------------------------------
-    def get_playback_state(self, username: str) -> Optional[Dict[str, Any]]:
+    def get_playback_state(self, username: str, deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
         """Kullanıcının mevcut çalma durumu hakkında genel bilgi alır."""
-        return self.api_service.get_playback_state(username)
+        return self.api_service.get_playback_state(username, deadline=deadline)
 
-    def get_currently_playing(self, username: str) -> Optional[Dict[str, Any]]:
+    def get_currently_playing(self, username: str, deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
         """Kullanıcının o anda çalmakta olduğu parça hakkında detaylı bilgi alır."""
-        return self.api_service.get_currently_playing(username)
+        return self.api_service.get_currently_playing(username, deadline=deadline)
+
+    @staticmethod
+    def format_playback_state(playback_state: Optional[Dict[str, Any]]) -> PlaybackPayload:
+        """Ham çalma durumunu widget/oynatıcı arayüzünün kullandığı sade payload'a çevirir."""
+        return project_playback_state(playback_state)
 
     def get_recently_played(self, username: str, limit: int = 20) -> Optional[Dict[str, Any]]:
         """Kullanıcının son dinlediği parçaları alır."""
@@ -0,0 +1,242 @@
+# =============================================================================
+# Spotify Rate Limiter Modülü (rate_limiter.py)
+# =============================================================================
+# Bu modül, Spotify Web API isteklerini uygulama (client_id) ve kullanıcı
+# bazında sınırlayan `SpotifyRateLimiter` sınıfını içerir.
+#
+# - Her client_id ve her kullanıcı için ayrı bir token bucket tutulur.
+# - Spotify 429 döndürdüğünde `Retry-After` süresince ilgili client_id için
+#   soğuma (cool-down) uygulanır; bu sürede Spotify'a istek gönderilmez.
+# - Başarılı GET yanıtları saklanır; soğuma sırasında son iyi yanıt
+#   `throttled` işaretiyle ve yaşıyla (`stale_age_ms`) döndürülebilir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _LAST_GOOD_MAX_ENTRIES
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. TokenBucket
+#           3.1.1. __init__(rate, capacity)
+#           3.1.2. wait_time(now)
+#           3.1.3. consume()
+#      3.2. SpotifyRateLimiter
+#           3.2.1. __init__(client_rate, client_burst, user_rate, user_burst, default_retry_after)
+#           3.2.2. acquire(username, client_id=None)
+#           3.2.3. on_rate_limited(client_id, retry_after=None)
+#           3.2.4. cooldown_remaining(client_id)
+#           3.2.5. remember(key, data)
+#           3.2.6. last_good(key)
+#           3.2.7. stats()
+#           3.2.8. parse_retry_after(value)
+#           3.2.9. _bucket(buckets, key, rate, burst)
+#
+# 4.0  LIMITER NESNESİ (LIMITER INSTANCE)
+#      4.1. spotify_rate_limiter
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Uygulama içi
+from app.config.spotify_config import SpotifyConfig
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Saklanan "son iyi yanıt" sayısı üst sınırı (LRU)
+_LAST_GOOD_MAX_ENTRIES: int = 2048
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class TokenBucket:
+    """Basit token bucket (kilitleme çağıranın sorumluluğundadır)."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate: float = max(0.001, float(rate))
+        self.capacity: float = max(1.0, float(capacity))
+        self.tokens: float = self.capacity
+        self.updated_at: float = time.monotonic()
+
+    def wait_time(self, now: float) -> float:
+        """Bir token için beklenmesi gereken süreyi (saniye) döndürür; 0 = hazır."""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        """Bir token harcar (`wait_time()` 0 döndükten sonra çağrılır)."""
+        self.tokens -= 1.0
+
+
+class SpotifyRateLimiter:
+    """client_id ve kullanıcı bazlı, thread-safe Spotify istek sınırlayıcı."""
+
+    def __init__(
+        self,
+        client_rate: float = SpotifyConfig.RATE_LIMIT_CLIENT_PER_SECOND,
+        client_burst: float = SpotifyConfig.RATE_LIMIT_CLIENT_BURST,
+        user_rate: float = SpotifyConfig.RATE_LIMIT_USER_PER_SECOND,
+        user_burst: float = SpotifyConfig.RATE_LIMIT_USER_BURST,
+        default_retry_after: float = SpotifyConfig.RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS,
+    ) -> None:
+        """
+        Varsayılanlar `SpotifyConfig`'ten gelir; client_id limiti arka plan
+        poller'ının beklenen yükünden hesaplanır (bkz. PLAYBACK_POLLER_EXPECTED_USERS).
+        """
+        self.client_rate: float = client_rate
+        self.client_burst: float = client_burst
+        self.user_rate: float = user_rate
+        self.user_burst: float = user_burst
+        self.default_retry_after: float = default_retry_after
+
+        self._client_buckets: Dict[str, TokenBucket] = {}
+        self._user_buckets: Dict[str, TokenBucket] = {}
+        self._cooldowns: Dict[str, float] = {}
+        # anahtar -> (saklandığı an (monotonic), yanıt)
+        self._last_good: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.allowed: int = 0
+        self.limited: int = 0
+        self.rate_limited_responses: int = 0
+
+    def acquire(self, username: str, client_id: Optional[str] = None) -> float:
+        """İstek için izin ister.
+
+        Returns:
+            0 ise istek gönderilebilir (token harcanmıştır); aksi halde
+            isteğin en erken kaç saniye sonra gönderilebileceği.
+        """
+        client_key = client_id or "_default"
+        now = time.monotonic()
+        with self._lock:
+            cooldown = self._cooldowns.get(client_key, 0.0) - now
+            if cooldown > 0:
+                self.limited += 1
+                return cooldown
+
+            client_bucket = self._bucket(self._client_buckets, client_key, self.client_rate, self.client_burst)
+            user_bucket = self._bucket(self._user_buckets, username, self.user_rate, self.user_burst)
+            wait = max(client_bucket.wait_time(now), user_bucket.wait_time(now))
+            if wait > 0:
+                self.limited += 1
+                return wait
+
+            client_bucket.consume()
+            user_bucket.consume()
+            self.allowed += 1
+            return 0.0
+
+    def on_rate_limited(self, client_id: Optional[str], retry_after: Optional[float] = None) -> float:
+        """Spotify'dan 429 alındığında client_id için soğumayı başlatır."""
+        client_key = client_id or "_default"
+        seconds = retry_after if retry_after is not None and retry_after >= 0 else self.default_retry_after
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._cooldowns.get(client_key, 0.0):
+                self._cooldowns[client_key] = until
+            self.rate_limited_responses += 1
+        logger.warning(
+            "Spotify rate limit (429): client_id='%s', retry_after=%.1fs; istekler bu süre boyunca bekletilecek.",
+            client_key,
+            seconds,
+        )
+        return seconds
+
+    def cooldown_remaining(self, client_id: Optional[str]) -> float:
+        """client_id için kalan soğuma süresini (saniye) döndürür."""
+        with self._lock:
+            return max(0.0, self._cooldowns.get(client_id or "_default", 0.0) - time.monotonic())
+
+    def remember(self, key: Hashable, data: Dict[str, Any]) -> None:
+        """Başarılı bir GET yanıtını saklar."""
+        with self._lock:
+            self._last_good[key] = (time.monotonic(), data)
+            self._last_good.move_to_end(key)
+            while len(self._last_good) > _LAST_GOOD_MAX_ENTRIES:
+                self._last_good.popitem(last=False)
+
+    def last_good(self, key: Hashable) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Saklanan son başarılı yanıtı ve yaşını (saniye) döndürür.
+
+        Yanıt paylaşılan nesnedir, değiştirilmemelidir.
+        """
+        with self._lock:
+            item = self._last_good.get(key)
+        if item is None:
+            return None
+        return item[1], max(0.0, time.monotonic() - item[0])
+
+    def stats(self) -> Dict[str, Any]:
+        """Sınırlayıcı sayaçlarını ve aktif soğumaları döndürür."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "allowed": self.allowed,
+                "limited": self.limited,
+                "rate_limited_responses": self.rate_limited_responses,
+                "cooldowns": {
+                    key: round(until - now, 2) for key, until in self._cooldowns.items() if until > now
+                },
+                "last_good_entries": len(self._last_good),
+            }
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """`Retry-After` başlığını saniyeye çevirir (geçersizse None)."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value.strip()))
+        except (TypeError, ValueError):
+            return None
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _bucket(buckets: Dict[str, TokenBucket], key: str, rate: float, burst: float) -> TokenBucket:
+        """Anahtarın bucket'ını döndürür; yoksa oluşturur (kilit altında çağrılır)."""
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate, burst)
+            buckets[key] = bucket
+        return bucket
+
+
+# =============================================================================
+# 4.0 LIMITER NESNESİ (LIMITER INSTANCE)
+# =============================================================================
+
+spotify_rate_limiter: SpotifyRateLimiter = SpotifyRateLimiter()
+
+
+# =============================================================================
+# Spotify Rate Limiter Modülü Sonu
+# =============================================================================
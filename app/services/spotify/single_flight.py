@@ -0,0 +1,136 @@
+# =============================================================================
+# Single-Flight Modülü (single_flight.py)
+# =============================================================================
+# Bu modül, aynı anahtar için eşzamanlı yapılan çağrıları tek bir çalıştırmada
+# birleştiren `SingleFlight` sınıfını içerir.
+#
+# Aynı anahtarla gelen ilk çağıran ("lider") fonksiyonu çalıştırır; o sırada
+# gelen diğer çağıranlar liderin sonucunu bekler ve aynı sonucu (veya aynı
+# hatayı) alır. Çalıştırma bittiğinde anahtar serbest bırakılır; sonraki
+# çağrılar yeni bir çalıştırma başlatır (sonuç önbelleğe alınmaz).
+#
+# `do_detached` ise fonksiyonu arka plan thread'inde çalıştırır; ilk çağıran
+# dahil herkes yalnızca kendi süresi kadar bekler, süre dolsa da çalıştırma
+# kendi süresiyle tamamlanır.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SINIFLAR (CLASSES)
+#      2.1. _Call
+#      2.2. SingleFlight
+#           2.2.1. __init__()
+#           2.2.2. do(key, fn, timeout=None)
+#           2.2.3. do_detached(key, fn, timeout=None)
+#           2.2.4. in_flight(key)
+#           2.2.5. _wait(key, call, timeout)
+#           2.2.6. _run(key, call, fn)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# =============================================================================
+# 2.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class _Call:
+    """Devam eden tek bir çalıştırmanın durumu."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Anahtar bazlı, thread-safe çağrı birleştirici."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """`fn`'i anahtar başına en fazla bir kez eşzamanlı çalıştırır.
+
+        Args:
+            key: Birleştirme anahtarı (ör. kullanıcı adı).
+            fn: Argümansız çağrılacak fonksiyon.
+            timeout: Bekleyen çağıranların lideri en fazla kaç saniye bekleyeceği.
+
+        Returns:
+            Liderin döndürdüğü değer. Lider hata fırlattıysa bekleyenlere de
+            aynı hata fırlatılır.
+
+        Raises:
+            TimeoutError: Bekleyen çağıran süre içinde sonuç alamazsa.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if leader:
+            self._run(key, call, fn)
+            return self._wait(key, call, None)
+        return self._wait(key, call, timeout)
+
+    def do_detached(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """`fn`'i anahtar başına en fazla bir kez, arka plan thread'inde çalıştırır.
+
+        `do`'dan farkı: çalıştırmayı başlatan çağıran da lider olarak beklemez,
+        diğerleri gibi en fazla `timeout` kadar sonucu bekler. Çağıranın süresi
+        çalıştırmanın süresini kısaltmaz.
+
+        Raises:
+            TimeoutError: Çağıran süre içinde sonuç alamazsa (çalıştırma sürer).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                threading.Thread(
+                    target=self._run, args=(key, call, fn), name="single-flight", daemon=True
+                ).start()
+        return self._wait(key, call, timeout)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Anahtar için devam eden bir çalıştırma olup olmadığını döndürür."""
+        with self._lock:
+            return key in self._calls
+
+    def _wait(self, key: Hashable, call: _Call, timeout: Optional[float]) -> Any:
+        """Çalıştırmanın sonucunu bekler; hata varsa aynısını fırlatır."""
+        if not call.done.wait(timeout):
+            raise TimeoutError(f"single-flight bekleme süresi doldu: {key!r}")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> None:
+        """`fn`'i çalıştırır, sonucu/hatayı kaydeder ve anahtarı serbest bırakır."""
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+# =============================================================================
+# Single-Flight Modülü Sonu
+# =============================================================================
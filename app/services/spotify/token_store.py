@@ -0,0 +1,259 @@
+# =============================================================================
+# Spotify Access Token Deposu Modülü (token_store.py)
+# =============================================================================
+# Bu modül, Spotify access token'larını kullanıcı adı bazında sunucu tarafında
+# tutan `SpotifyTokenStore` sınıfını içerir.
+#
+# Flask cookie session'ı yalnızca giriş yapmış tarayıcıda bulunur; OBS
+# browser source'u veya arka plan thread'leri bu session'a erişemez. Depo
+# sayesinde her çağıran aynı token'ı kullanır ve token yenileme kullanıcı
+# başına yaklaşık saatte bir kez yapılır.
+#
+# Paylaşılan bir önbellek (ör. Redis) yapılandırılmışsa token'lar worker'lar
+# arasında da paylaşılır ve yenileme, kullanıcı başına bir kilitle tüm
+# worker'larda tek seferde yapılır.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _REFRESH_LOCK_SECONDS
+#
+# 3.0  SINIFLAR (CLASSES)
+#      3.1. SpotifyAccessToken
+#           3.1.1. is_valid(margin_seconds)
+#           3.1.2. to_dict() / from_dict(data)
+#      3.2. SpotifyTokenStore
+#           3.2.1. __init__(persist=False, repository=None, shared=None)
+#           3.2.2. get(username)
+#           3.2.3. get_shared(username)
+#           3.2.4. put(username, access_token, expires_in, client_id=None)
+#           3.2.5. invalidate(username)
+#           3.2.6. acquire_refresh_lock(username)
+#           3.2.7. release_refresh_lock(username)
+#           3.2.8. wait_for_shared(username, accept, timeout)
+#           3.2.9. _remember(username, token)
+#
+# 4.0  FONKSİYONLAR (FUNCTIONS)
+#      4.1. _shared_key(username)
+#      4.2. _lock_key(username)
+#
+# 5.0  DEPO NESNESİ (STORE INSTANCE)
+#      5.1. spotify_token_store
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+# Uygulama içi
+from app.config.spotify_config import SpotifyConfig
+from app.database.repositories.spotify_account_repository import SpotifyUserRepository
+from app.services.cache.backend import CacheBackend
+from app.services.cache.shared_cache import distributed_cache
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Worker'lar arası yenileme kilidinin ömrü (saniye); kilidi alan worker
+# çökerse diğerleri en geç bu kadar sonra yenileyebilir
+_REFRESH_LOCK_SECONDS: float = 15.0
+
+
+# =============================================================================
+# 3.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class SpotifyAccessToken:
+    """Bir kullanıcının access token'ı ve bitiş zamanı (epoch saniye)."""
+
+    __slots__ = ("access_token", "expires_at", "client_id")
+
+    def __init__(self, access_token: str, expires_at: float, client_id: Optional[str] = None) -> None:
+        self.access_token: str = access_token
+        self.expires_at: float = expires_at
+        self.client_id: Optional[str] = client_id
+
+    def is_valid(self, margin_seconds: float = 0) -> bool:
+        """Token'ın en az `margin_seconds` daha geçerli olup olmadığını döndürür."""
+        return self.expires_at > time.time() + margin_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Paylaşılan önbelleğe yazılacak JSON uyumlu hali."""
+        return {"access_token": self.access_token, "expires_at": self.expires_at, "client_id": self.client_id}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SpotifyAccessToken":
+        """`to_dict()` çıktısından token'ı yeniden oluşturur."""
+        return cls(data["access_token"], float(data["expires_at"]), data.get("client_id"))
+
+
+class SpotifyTokenStore:
+    """Kullanıcı bazlı, thread-safe Spotify access token deposu.
+
+    Token'lar bellekte tutulur; `shared` verilirse worker'lar arasında
+    paylaşılır; `persist=True` ise ayrıca `spotify_accounts` tablosuna
+    yazılır ve bellekte yoksa oradan okunur.
+    """
+
+    def __init__(
+        self,
+        persist: bool = False,
+        repository: Optional[SpotifyUserRepository] = None,
+        shared: Optional[CacheBackend] = None,
+    ) -> None:
+        self.persist: bool = persist
+        self.shared: Optional[CacheBackend] = shared
+        self._repository: SpotifyUserRepository = repository or SpotifyUserRepository()
+        self._tokens: Dict[str, SpotifyAccessToken] = {}
+        self._lock = threading.Lock()
+
+    def get(self, username: str) -> Optional[SpotifyAccessToken]:
+        """Kullanıcının kayıtlı token'ını döndürür (süresi dolmuş olabilir)."""
+        with self._lock:
+            token = self._tokens.get(username)
+        if token is not None:
+            return token
+
+        token = self.get_shared(username)
+        if token is not None or not self.persist:
+            return token
+
+        row = self._repository.get_access_token(username)
+        expires_at_dt = row.get("access_token_expires_at") if row else None
+        if not row or not isinstance(expires_at_dt, datetime):
+            return None
+
+        token = SpotifyAccessToken(
+            access_token=row["access_token"],
+            expires_at=expires_at_dt.timestamp(),
+            client_id=row.get("client_id"),
+        )
+        return self._remember(username, token)
+
+    def get_shared(self, username: str) -> Optional[SpotifyAccessToken]:
+        """Token'ı paylaşılan önbellekten okur (başka bir worker yenilemiş olabilir)."""
+        if self.shared is None:
+            return None
+        data = self.shared.get(_shared_key(username))
+        if data is None:
+            return None
+        return self._remember(username, SpotifyAccessToken.from_dict(data))
+
+    def put(
+        self,
+        username: str,
+        access_token: str,
+        expires_in: float,
+        client_id: Optional[str] = None,
+    ) -> SpotifyAccessToken:
+        """Yeni alınan token'ı depoya yazar."""
+        token = SpotifyAccessToken(
+            access_token=access_token,
+            expires_at=time.time() + float(expires_in),
+            client_id=client_id,
+        )
+        with self._lock:
+            self._tokens[username] = token
+        if self.shared is not None:
+            self.shared.set(_shared_key(username), token.to_dict(), ttl=max(1.0, float(expires_in)))
+
+        if self.persist:
+            stored = self._repository.store_access_token(
+                username,
+                access_token,
+                datetime.fromtimestamp(token.expires_at),
+            )
+            if not stored:
+                logger.warning("Spotify access token DB'ye yazılamadı: username='%s'", username)
+        return token
+
+    def invalidate(self, username: str) -> None:
+        """Kullanıcının token'ını depodan siler."""
+        with self._lock:
+            self._tokens.pop(username, None)
+        if self.shared is not None:
+            self.shared.delete(_shared_key(username))
+        if self.persist:
+            self._repository.store_access_token(username, None, None)
+
+    def acquire_refresh_lock(self, username: str) -> bool:
+        """Kullanıcının token yenileme kilidini worker'lar arasında almaya çalışır.
+
+        Paylaşılan önbellek yoksa her zaman True döner (süreç içi single-flight yeterli).
+        """
+        if self.shared is None:
+            return True
+        return self.shared.set_if_absent(_lock_key(username), 1, ttl=_REFRESH_LOCK_SECONDS)
+
+    def release_refresh_lock(self, username: str) -> None:
+        """`acquire_refresh_lock()` ile alınan kilidi bırakır."""
+        if self.shared is not None:
+            self.shared.delete(_lock_key(username))
+
+    def wait_for_shared(
+        self,
+        username: str,
+        accept: Callable[[SpotifyAccessToken], bool],
+        timeout: float,
+    ) -> Optional[SpotifyAccessToken]:
+        """Kilidi tutan worker'ın kabul edilebilir bir token yazmasını bekler."""
+        if self.shared is None:
+            return None
+        data = self.shared.wait_for(
+            _shared_key(username),
+            timeout,
+            accept=lambda value: accept(SpotifyAccessToken.from_dict(value)),
+        )
+        if data is None:
+            return None
+        return self._remember(username, SpotifyAccessToken.from_dict(data))
+
+    def _remember(self, username: str, token: SpotifyAccessToken) -> SpotifyAccessToken:
+        """Token'ı belleğe yazar; bu arada daha yeni bir token yazılmışsa onu döndürür."""
+        with self._lock:
+            current = self._tokens.get(username)
+            if current is None or current.expires_at < token.expires_at:
+                self._tokens[username] = token
+                return token
+            return current
+
+
+# =============================================================================
+# 4.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def _shared_key(username: str) -> str:
+    """Paylaşılan önbellekteki token anahtarı."""
+    return f"spotify:token:{username}"
+
+
+def _lock_key(username: str) -> str:
+    """Paylaşılan önbellekteki yenileme kilidi anahtarı."""
+    return f"spotify:lock:refresh:{username}"
+
+
+# =============================================================================
+# 5.0 DEPO NESNESİ (STORE INSTANCE)
+# =============================================================================
+
+spotify_token_store: SpotifyTokenStore = SpotifyTokenStore(
+    persist=SpotifyConfig.TOKEN_STORE_PERSIST,
+    shared=distributed_cache(),
+)
+
+
+__all__ = ["SpotifyAccessToken", "SpotifyTokenStore", "spotify_token_store"]
@@ -7,6 +7,7 @@
 # -----------------------------------------------------------------------------
 # 1.0  MODÜLLER (MODULES)
 #      1.1. token_service
+#      1.2. stream_service
 # =============================================================================
 
 
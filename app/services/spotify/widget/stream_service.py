@@ -0,0 +1,287 @@
+# =============================================================================
+# Widget SSE Akış Servis Modülü (stream_service.py)
+# =============================================================================
+# Bu modül, bir widget'a açık tutulan Server-Sent Events (SSE) bağlantısı
+# üzerinden yalnızca anlamlı değişiklikleri gönderen `WidgetPlaybackStream`
+# sınıfını içerir.
+#
+# Olaylar:
+#   - playback  : ilk durum, parça değişimi, çal/duraklat, seek veya hata
+#   - config    : widget ayarları Widget Manager'da değişti (yeni config)
+#   - revoked   : widget bulunamadı (silindi); akış kapanır, widget polling'e geçer
+#   - heartbeat : değişiklik olmasa da bağlantıyı canlı tutan yorum satırı
+#   - reconnect : en uzun akış süresi doldu (tarayıcı yeniden bağlanır)
+#
+# İlerleme (progress) widget tarafında yerel olarak ilerletilir; sunucu
+# yalnızca beklenen ilerlemeden sapma (seek) olduğunda yeni durum gönderir.
+#
+# İÇİNDEKİLER:
+# -----------------------------------------------------------------------------
+# 1.0  İÇE AKTARMALAR (IMPORTS)
+#
+# 2.0  SABİTLER & LOGGER (CONSTANTS & LOGGER)
+#      2.1. logger
+#      2.2. _RETRY_MS
+#      2.3. _HEARTBEAT
+#
+# 3.0  FONKSİYONLAR (FUNCTIONS)
+#      3.1. format_sse(event, data)
+#
+# 4.0  SINIFLAR (CLASSES)
+#      4.1. WidgetPlaybackStream
+#           4.1.1. __init__(fetch, check_interval, heartbeat_interval, max_duration, seek_tolerance_ms,
+#                           config_probe, config_version)
+#           4.1.2. events()
+#           4.1.3. async_events(fetch, config_probe)
+#           4.1.4. change_reason(previous, current, elapsed_ms)
+#           4.1.5. _begin()
+#           4.1.6. _expired(now)
+#           4.1.7. _config_step(info, now)
+#           4.1.7.1. _probe_failed(exc)
+#           4.1.8. _playback_step(current, now)
+#           4.1.9. _config_event(info)
+# =============================================================================
+
+# =============================================================================
+# 1.0 İÇE AKTARMALAR (IMPORTS)
+# =============================================================================
+
+# Standart kütüphane
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+
+# =============================================================================
+# 2.0 SABİTLER & LOGGER (CONSTANTS & LOGGER)
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# Bağlantı koparsa tarayıcının yeniden bağlanmadan önce bekleyeceği süre (ms)
+_RETRY_MS: int = 2000
+
+_HEARTBEAT: str = ": heartbeat\n\n"
+
+
+# =============================================================================
+# 3.0 FONKSİYONLAR (FUNCTIONS)
+# =============================================================================
+
+def format_sse(event: str, data: Any) -> str:
+    """Tek bir SSE olayını metin olarak biçimlendirir."""
+    payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+# =============================================================================
+# 4.0 SINIFLAR (CLASSES)
+# =============================================================================
+
+class WidgetPlaybackStream:
+    """Bir widget bağlantısı için değişiklik odaklı SSE olay üreticisi."""
+
+    def __init__(
+        self,
+        fetch: Optional[Callable[[], Dict[str, Any]]] = None,
+        check_interval: float = 1.0,
+        heartbeat_interval: float = 15.0,
+        max_duration: float = 1800.0,
+        seek_tolerance_ms: int = 3000,
+        config_probe: Optional[Callable[[], Optional[Dict[str, Any]]]] = None,
+        config_version: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            fetch: Güncel (projeksiyonu yapılmış) çalma durumunu döndürür
+                (`events()` için; `async_events()` kendi fonksiyonlarını alır).
+            check_interval: Durum kontrolleri arasındaki süre (saniye).
+            heartbeat_interval: Olay gönderilmediğinde heartbeat aralığı (saniye).
+            max_duration: Akışın en uzun süresi (saniye).
+            seek_tolerance_ms: Seek sayılacak en küçük ilerleme sapması (ms).
+            config_probe: Widget'ın güncel `config_version`/`widget_type`/`config`
+                bilgisini döndürür; widget bulunamadıysa None. Okuma başarısız
+                olursa (ör. DB hatası) exception yükseltmelidir; o kontrol atlanır.
+            config_version: Widget'ın şu an kullandığı config sürümü.
+        """
+        self.fetch = fetch
+        self.config_probe = config_probe
+        self.config_version: Optional[str] = config_version
+        self.check_interval: float = max(0.1, float(check_interval))
+        self.heartbeat_interval: float = max(1.0, float(heartbeat_interval))
+        self.max_duration: float = max(self.check_interval, float(max_duration))
+        self.seek_tolerance_ms: int = max(0, int(seek_tolerance_ms))
+
+        self._started: float = 0.0
+        self._last_sent_at: float = 0.0
+        self._previous: Optional[Dict[str, Any]] = None
+        self._previous_at: float = 0.0
+
+    def events(self) -> Iterator[str]:
+        """SSE metin parçalarını üretir (Flask `Response` gövdesi olarak kullanılır)."""
+        self._begin()
+        yield f"retry: {_RETRY_MS}\n\n"
+
+        while True:
+            now = time.monotonic()
+            if self._expired(now):
+                yield format_sse("reconnect", {"reason": "max_duration"})
+                return
+
+            if self.config_probe is not None:
+                try:
+                    info = self.config_probe()
+                except Exception as exc:
+                    chunk, done = self._probe_failed(exc)
+                else:
+                    chunk, done = self._config_step(info, now)
+                if chunk:
+                    yield chunk
+                if done:
+                    return
+
+            chunk = self._playback_step(self.fetch(), now)
+            if chunk:
+                yield chunk
+            time.sleep(self.check_interval)
+
+    async def async_events(
+        self,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        config_probe: Optional[Callable[[], Awaitable[Optional[Dict[str, Any]]]]] = None,
+    ) -> AsyncIterator[str]:
+        """`events()` ile aynı olayları asyncio üzerinde üretir (ASGI yolu).
+
+        Bekleme thread tutmaz; `fetch` / `config_probe` burada coroutine
+        fonksiyonlarıdır (engelleyen işleri kendileri executor'a gönderir).
+        """
+        self._begin()
+        yield f"retry: {_RETRY_MS}\n\n"
+
+        while True:
+            now = time.monotonic()
+            if self._expired(now):
+                yield format_sse("reconnect", {"reason": "max_duration"})
+                return
+
+            if config_probe is not None:
+                try:
+                    info = await config_probe()
+                except Exception as exc:
+                    chunk, done = self._probe_failed(exc)
+                else:
+                    chunk, done = self._config_step(info, now)
+                if chunk:
+                    yield chunk
+                if done:
+                    return
+
+            chunk = self._playback_step(await fetch(), now)
+            if chunk:
+                yield chunk
+            await asyncio.sleep(self.check_interval)
+
+    def change_reason(
+        self,
+        previous: Optional[Dict[str, Any]],
+        current: Dict[str, Any],
+        elapsed_ms: float,
+    ) -> Optional[str]:
+        """İki durum arasında widget'a gönderilmesi gereken bir değişiklik varsa nedenini döndürür."""
+        if previous is None:
+            return "initial"
+
+        if current.get("error") != previous.get("error"):
+            return "error" if current.get("error") else "recovered"
+
+        current_item = current.get("item") or {}
+        previous_item = previous.get("item") or {}
+        if current_item.get("id") != previous_item.get("id"):
+            return "track"
+
+        if bool(current.get("is_playing")) != bool(previous.get("is_playing")):
+            return "state"
+
+        expected = int(previous.get("progress_ms") or 0)
+        if previous.get("is_playing"):
+            expected += int(elapsed_ms)
+        if abs(int(current.get("progress_ms") or 0) - expected) > self.seek_tolerance_ms:
+            return "seek"
+
+        return None
+
+    # -------------------------------------------------------------------------
+    # Dahili yardımcılar (Internal helpers)
+    # -------------------------------------------------------------------------
+
+    def _begin(self) -> None:
+        """Akış durumunu sıfırlar."""
+        self._started = time.monotonic()
+        self._last_sent_at = self._started
+        self._previous = None
+        self._previous_at = self._started
+
+    def _expired(self, now: float) -> bool:
+        """En uzun akış süresinin dolup dolmadığını döndürür."""
+        return now - self._started >= self.max_duration
+
+    def _config_step(self, info: Optional[Dict[str, Any]], now: float) -> Tuple[Optional[str], bool]:
+        """Config kontrolünün sonucunu SSE parçasına çevirir.
+
+        Returns:
+            (gönderilecek parça veya None, akış bitmeli mi).
+        """
+        kind, data = self._config_event(info)
+        if kind == "revoked":
+            return format_sse("revoked", data), True
+        if kind == "config":
+            self._last_sent_at = now
+            return format_sse("config", data), False
+        return None, False
+
+    def _probe_failed(self, exc: Exception) -> Tuple[Optional[str], bool]:
+        """Config okunamadığında (ör. DB hatası) kontrolü atlar; widget silinmiş sayılmaz."""
+        logger.warning("WidgetPlaybackStream: widget config okunamadı, kontrol atlandı: %s", exc)
+        return None, False
+
+    def _playback_step(self, current: Dict[str, Any], now: float) -> Optional[str]:
+        """Güncel çalma durumunu önceki durumla karşılaştırır; gönderilecek parçayı döndürür."""
+        reason = self.change_reason(self._previous, current, (now - self._previous_at) * 1000.0)
+        chunk: Optional[str] = None
+        if reason is not None:
+            chunk = format_sse("playback", dict(current, reason=reason))
+            self._last_sent_at = now
+        elif now - self._last_sent_at >= self.heartbeat_interval:
+            chunk = _HEARTBEAT
+            self._last_sent_at = now
+        self._previous, self._previous_at = current, now
+        return chunk
+
+    def _config_event(self, info: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Config değişikliğini veya widget'ın silinmesini kontrol eder.
+
+        Args:
+            info: `config_probe` sonucu; widget bulunamadıysa (kesin sonuç) None.
+
+        Returns:
+            ("config", yeni config), ("revoked", neden) veya (None, {}).
+        """
+        if info is None:
+            return "revoked", {"reason": "widget_not_found"}
+
+        version = info.get("config_version")
+        if version == self.config_version:
+            return None, {}
+        if self.config_version is None:
+            # İstemci sürüm bildirmediyse ilk değer temel alınır
+            self.config_version = version
+            return None, {}
+        self.config_version = version
+        return "config", info
+
+
+# =============================================================================
+# Widget SSE Akış Servis Modülü Sonu
+# =============================================================================
@@ -5,11 +5,12 @@ Uygulama içi widget'lar için güvenli token'lar oluşturma, doğrulama ve bu
 token'lardan bilgi çıkarma işlemlerini yöneten servis sınıfını içerir.
 """
 
+import copy
 import secrets
 import string
 import json
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterable, Optional, Tuple
 from app.database.repositories.spotify_account_repository import SpotifyUserRepository
 from app.database.repositories.widget_repository import SpotifyWidgetRepository
 
@@ -53,7 +54,7 @@ class WidgetTokenService:
         db = SpotifyWidgetRepository()
         widget = db.get_widget_by_username_and_type(username, widget_type)
         if widget:
-            return widget.get('widget_token')
+            return widget.widget_token
         return None
 
     def get_widget_token(self, username: str) -> Optional[str]:
@@ -268,52 +269,78 @@ class WidgetTokenService:
         if not is_valid or not payload:
             return None
 
-        widget_config_str = payload.get("config_data")
-        if not widget_config_str:
-            return {}  # Boş yapılandırma
-
-        try:
-            return json.loads(widget_config_str)
-        except json.JSONDecodeError:
+        widget_config = payload.get("config")
+        if widget_config is None:
             return None
+        return copy.deepcopy(widget_config)
 
-    def validate_widget_token(self, token: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    def validate_widget_token(self, token: str, strict: bool = False) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
-        Verilen token'ı veritabanında doğrular. Varsa, token ile ilişkili tüm
-        veriyi döndürür.
+        Verilen token'ı doğrular. Varsa, token ile ilişkili kullanıcı adını,
+        widget tipini, parse edilmiş config'i ve config sürümünü döndürür.
+
+        Not: Doğrulama `SpotifyWidgetRepository` önbelleği üzerinden yapılır;
+        kararlı durumda widget poll'ları DB'ye gitmez. Dönen `config` paylaşılan
+        nesnedir, değiştirilmemelidir.
+
+        `strict=True` ise DB hatası `(False, None)` yerine yükseltilir; böylece
+        geçersiz token ile o an okunamayan token ayırt edilebilir.
         """
         if not token:
             logger.warning("Boş token ile doğrulama denemesi yapıldı.")
             return False, None
 
         try:
-            db = SpotifyWidgetRepository()
-            token_data = db.get_data_by_widget_token(token)
+            entry = SpotifyWidgetRepository().get_widget_entry_by_token(token, strict=strict)
 
-            if not token_data:
+            if entry is None:
                 logger.warning("Token bulunamadı veya platform='spotify' değil: token='%s'", token)
                 return False, None
 
-            # Gelen satırın tüm sütunlarını tek tek logla
-            logger.debug("validate_widget_token(): veritabanından gelen satır (token='%s'):", token)
-            for key, value in token_data.items():
-                logger.debug("    %s = %r", key, value)
-
-            if not token_data.get("beatify_username"):
+            if not entry.username:
                 logger.error("Token geçerli ancak kullanıcı adı eksik: token='%s'", token)
                 return False, None
 
-            logger.info(
-                "Token başarıyla doğrulandı: token='%s', kullanıcı='%s'",
-                token,
-                token_data["beatify_username"],
-            )
-            return True, token_data
+            logger.debug("Token doğrulandı: token='%s', kullanıcı='%s'", token, entry.username)
+            return True, {
+                "widget_token": entry.widget_token,
+                "beatify_username": entry.username,
+                "widget_type": entry.widget_type,
+                "config": entry.config,
+                "config_version": entry.config_version,
+            }
 
         except Exception as e:
             logger.error("Token doğrulanırken beklenmeyen hata (token='%s'): %s", token, e, exc_info=True)
+            if strict:
+                raise
             return False, None
 
+    def validate_widget_tokens(self, tokens: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Birden fazla token'ı tek seferde doğrular. Yalnızca geçerli token'lar,
+        `validate_widget_token()` ile aynı payload şemasıyla döndürülür.
+
+        Not: Önbellekte olmayan token'lar tek bir DB sorgusuyla okunur.
+        """
+        try:
+            entries = SpotifyWidgetRepository().get_widget_entries_by_tokens(tokens)
+        except Exception as e:
+            logger.error("Token'lar toplu doğrulanırken beklenmeyen hata: %s", e, exc_info=True)
+            return {}
+
+        return {
+            token: {
+                "widget_token": entry.widget_token,
+                "beatify_username": entry.username,
+                "widget_type": entry.widget_type,
+                "config": entry.config,
+                "config_version": entry.config_version,
+            }
+            for token, entry in entries.items()
+            if entry.username
+        }
+
 
 __all__ = ["WidgetTokenService"]
 
@@ -4,7 +4,29 @@ class SpotifyStateService {
         const token = widgetElement.dataset.token;
         const endpointTemplate = widgetElement.dataset.endpointTemplate;
         this.endpoint = endpointTemplate.replace('{TOKEN}', token);
-        console.log('[SpotifyStateService] Initialized with token:', token, 'endpoint:', this.endpoint);
+        // SSE akışı (demo/önizleme modunda template boş gelir -> polling)
+        const streamTemplate = widgetElement.dataset.streamTemplate;
+        this.streamEndpoint = streamTemplate ? streamTemplate.replace('{TOKEN}', token) : null;
+        // Canlı config güncellemesi: sürüm değişince yeni tema sayfa yenilenmeden uygulanır
+        const configTemplate = widgetElement.dataset.configTemplate;
+        this.configEndpoint = configTemplate ? configTemplate.replace('{TOKEN}', token) : null;
+        this.configVersion = widgetElement.dataset.configVersion || null;
+        this.configRequest = null;
+        console.log('[SpotifyStateService] Initialized with token:', token, 'endpoint:', this.endpoint, 'stream:', this.streamEndpoint);
+
+        this.eventSource = null;
+        this.streamFailures = 0;
+        this.maxStreamFailures = 3;
+        // Sunucu `next_poll_ms` ipucu göndermezse kullanılan varsayılan aralık
+        this.pollIntervalMs = 2000;
+        this.minPollIntervalMs = 1000;
+        this.maxPollIntervalMs = 60000;
+        this.pollTimer = null;
+        this.polling = false;
+        // Son widget-data yanıtının ETag'i (değişiklik yoksa sunucu 304 döner)
+        this.etag = null;
+        // Sunucu saati - yerel saat tahmini (ms); yanıtlardaki `server_time` ile güncellenir
+        this.clockOffsetMs = null;
 
         this.currentTrackId = null;
         this.isPlaying = false;
@@ -14,16 +36,104 @@ class SpotifyStateService {
     }
 
     init() {
+        if (this.streamEndpoint && window.EventSource) {
+            console.log('[SpotifyStateService] init() called. Starting SSE stream...');
+            this.startStream();
+            return;
+        }
         console.log('[SpotifyStateService] init() called. Starting polling loop...');
+        this.startPolling();
+    }
+
+    startPolling() {
+        if (this.polling) return;
+        this.polling = true;
         this.fetchData();
-        setInterval(() => this.fetchData(), 2000);
+    }
+
+    _scheduleNextPoll(hintMs) {
+        if (!this.polling) return;
+        if (this.pollTimer) clearTimeout(this.pollTimer);
+        let delay = Number(hintMs);
+        if (!Number.isFinite(delay) || delay <= 0) delay = this.pollIntervalMs;
+        delay = Math.min(this.maxPollIntervalMs, Math.max(this.minPollIntervalMs, delay));
+        this.pollTimer = setTimeout(() => {
+            this.pollTimer = null;
+            this.fetchData();
+        }, delay);
+    }
+
+    startStream() {
+        const streamUrl = this.configVersion
+            ? `${this.streamEndpoint}?config_version=${encodeURIComponent(this.configVersion)}`
+            : this.streamEndpoint;
+        const source = new EventSource(streamUrl);
+        this.eventSource = source;
+
+        source.addEventListener('playback', (event) => {
+            this.streamFailures = 0;
+            try {
+                const data = JSON.parse(event.data);
+                console.log('[SpotifyStateService] stream playback olayı:', data && data.reason);
+                this._processData(data);
+            } catch (error) {
+                console.error('[SpotifyStateService] stream verisi çözümlenemedi:', error);
+            }
+        });
+
+        source.addEventListener('config', (event) => {
+            try {
+                this._applyConfig(JSON.parse(event.data));
+            } catch (error) {
+                console.error('[SpotifyStateService] config olayı çözümlenemedi:', error);
+            }
+        });
+
+        // Sunucu widget'ı bulamadı: akışı kapat, polling'e geç (widget gerçekten
+        // silindiyse widget-data 401 döner ve hata orada gösterilir)
+        source.addEventListener('revoked', () => {
+            console.warn('[SpotifyStateService] Widget bulunamadı, akış kapatılıp polling moduna geçiliyor.');
+            source.close();
+            this.eventSource = null;
+            this.startPolling();
+        });
+
+        // Sunucu en uzun akış süresine ulaştı; EventSource kendiliğinden yeniden bağlanır.
+        source.addEventListener('reconnect', () => {
+            console.log('[SpotifyStateService] stream yenileniyor (max süre).');
+        });
+
+        source.onerror = () => {
+            this.streamFailures += 1;
+            if (source.readyState === EventSource.CLOSED || this.streamFailures >= this.maxStreamFailures) {
+                console.warn('[SpotifyStateService] SSE akışı kullanılamıyor, polling moduna geçiliyor.');
+                source.close();
+                this.eventSource = null;
+                this.startPolling();
+            }
+        };
     }
 
     async fetchData() {
+        // Sunucunun önerdiği bir sonraki sorgu zamanı (ör. parça bitimi, duraklatma)
+        let nextPollMs = null;
         try {
             console.log('[SpotifyStateService] fetchData() ->', this.endpoint);
-            const response = await fetch(this.endpoint);
+            const headers = this.etag ? { 'If-None-Match': this.etag } : {};
+            const requestedAt = Date.now();
+            const response = await fetch(this.endpoint, { cache: 'no-store', headers });
+            const receivedAt = Date.now();
             console.log('[SpotifyStateService] fetchData() response status:', response.status);
+            const headerHint = response.headers ? response.headers.get('X-Next-Poll-Ms') : null;
+            if (headerHint !== null) nextPollMs = Number(headerHint);
+            if (response.status === 304) {
+                // Görünen durum değişmedi; ilerleme yerel olarak ilerlemeye devam eder
+                return;
+            }
+            if (response.status === 503) {
+                // Sunucu yoğun (yük atma); mevcut durum korunur, ipucundaki süre sonra tekrar denenir
+                return;
+            }
             if (!response.ok) {
                 if (this.isPlaying || this.isInitialLoad) {
                     this._dispatchEvent('widget:error', { message: `API Hatası: ${response.status}` });
@@ -31,19 +141,51 @@ class SpotifyStateService {
                 this.isPlaying = false;
                 return;
             }
+            this.etag = response.headers ? response.headers.get('ETag') : null;
             const data = await response.json();
+            this._updateClockOffset(data, requestedAt, receivedAt);
+            if (data && data.next_poll_ms) nextPollMs = data.next_poll_ms;
+            if (data && data.config_version && data.config_version !== this.configVersion) {
+                this.refreshConfig();
+            }
             console.log('[SpotifyStateService] fetchData() JSON alındı:', {
                 is_playing: data && data.is_playing,
                 track_id: data && data.item && data.item.id
             });
-            this._processData(data);
+            this._processData(this._alignProgress(data));
         } catch (error) {
             console.error('[SpotifyStateService] fetchData() sırasında hata:', error);
             this._dispatchEvent('widget:error', { message: 'Widget verisi alınamıyor.' });
             this.isPlaying = false;
+        } finally {
+            this._scheduleNextPoll(nextPollMs);
         }
     }
 
+    async refreshConfig() {
+        if (!this.configEndpoint || this.configRequest) return;
+        this.configRequest = (async () => {
+            try {
+                const response = await fetch(this.configEndpoint, { cache: 'no-store' });
+                if (response.ok) {
+                    this._applyConfig(await response.json());
+                }
+            } catch (error) {
+                console.error('[SpotifyStateService] config alınamadı:', error);
+            } finally {
+                this.configRequest = null;
+            }
+        })();
+        return this.configRequest;
+    }
+
+    _applyConfig(info) {
+        if (!info || !info.config || info.config_version === this.configVersion) return;
+        console.log('[SpotifyStateService] Yeni widget config alındı:', info.config_version);
+        this.configVersion = info.config_version;
+        this._dispatchEvent('widget:config', { config: info.config, widgetType: info.widget_type });
+    }
+
     finalizeTransition(newActiveSet) {
         this.activeSet = newActiveSet;
         if (this.currentData && this.currentData.item) {
@@ -109,6 +251,30 @@ class SpotifyStateService {
         }
     }
 
+    // NTP benzeri tahmin: sunucu `server_time`'ı isteğin ortasında üretmiş sayılır.
+    // Tek ölçüm gecikme dalgalanmasından etkilenmesin diye değer yumuşatılır.
+    _updateClockOffset(data, requestedAt, receivedAt) {
+        const serverTime = data ? Number(data.server_time) : NaN;
+        if (!Number.isFinite(serverTime)) return;
+        const sample = serverTime - (requestedAt + receivedAt) / 2;
+        this.clockOffsetMs = this.clockOffsetMs === null
+            ? sample
+            : this.clockOffsetMs + (sample - this.clockOffsetMs) * 0.2;
+    }
+
+    // `progress_ms` yanıtın üretildiği andaki (`server_time`) ilerlemedir; yanıt
+    // gelene kadar geçen süre (ağ gecikmesi, saat farkı düzeltilmiş) eklenir.
+    _alignProgress(data) {
+        if (!data || !data.is_playing || !data.item || this.clockOffsetMs === null) return data;
+        const serverTime = Number(data.server_time);
+        if (!Number.isFinite(serverTime)) return data;
+        const elapsedMs = Date.now() + this.clockOffsetMs - serverTime;
+        if (elapsedMs <= 0) return data;
+        const progressMs = Number(data.progress_ms || 0) + Math.round(elapsedMs);
+        const durationMs = Number(data.item.duration_ms || 0);
+        return { ...data, progress_ms: durationMs > 0 ? Math.min(progressMs, durationMs) : progressMs };
+    }
+
     _dispatchEvent(eventName, detail = {}) {
         const event = new CustomEvent(eventName, { detail });
         this.widgetElement.dispatchEvent(event);
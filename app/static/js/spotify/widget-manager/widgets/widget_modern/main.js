@@ -18,6 +18,20 @@ document.addEventListener('DOMContentLoaded', async () => {
             contentUpdater
         });
 
+        // Canlı config güncellemesi: aynı temada yerinde uygula, tema değiştiyse
+        // (farklı şablon) sayfayı yeniden yükle.
+        widgetElement.addEventListener('widget:config', (event) => {
+            const config = event.detail && event.detail.config;
+            if (!config) return;
+            const newTheme = config.theme && typeof config.theme === 'object' ? config.theme.name : null;
+            const currentTheme = themeService.getThemeName();
+            if (newTheme && currentTheme && newTheme !== currentTheme) {
+                window.location.reload();
+                return;
+            }
+            themeService.apply(config);
+        });
+
         stateService.init();
 
         // Parent pencereden (Widget Manager) gelen mesajları dinle
@@ -55,6 +55,18 @@ class ThemeService {
         }
     }
 
+    // Widget Manager'da kaydedilen yeni config'i sayfa yenilenmeden uygular;
+    // animasyonlar bir sonraki intro/transition'da yeni ayarları kullanır.
+    apply(config) {
+        window.themeConfig = config;
+        this.themeData = this._normalizeThemeConfig(config);
+    }
+
+    getThemeName() {
+        const theme = this.themeData && this.themeData.theme;
+        return theme && typeof theme === 'object' ? theme.name : null;
+    }
+
     getComponentSetData(componentName, set) {
         if (!this.themeData) return null;
         const component = this.themeData.components[componentName];
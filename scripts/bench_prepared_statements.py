@@ -0,0 +1,117 @@
+"""
+Prepared Statement Karşılaştırma Aracı (metin protokolü vs prepared)
+
+Amaç:
+- Sık çalışan sorguların (widget token okuması, auth token doğrulama,
+  Spotify hesap verisi) metin protokolüyle ve sunucu tarafı prepared
+  statement ile çalıştırılmasının gecikmesini karşılaştırmak.
+- Her mod aynı bağlantı üzerinde aynı parametrelerle `--iterations` kez
+  çalıştırılır; sorgu başına p50 / p95 / ortalama (ms) yazdırılır.
+
+Notlar:
+- Canlı bir MySQL gerekir (proje kökündeki .env dosyasındaki DB ayarları).
+- Parametreler tablolardaki gerçek birer satırdan okunur; tablo boşsa yer
+  tutucu değerler kullanılır (sorgu yine çalışır, satır dönmez).
+- Uygulamadaki kod yolu ölçülür: `DatabaseConnection.fetch_prepared()`,
+  `PREPARED_STATEMENTS_CONFIG["enabled"]` değiştirilerek iki modda çağrılır.
+
+Çalıştırma:
+  python scripts/bench_prepared_statements.py --iterations 2000
+  python scripts/bench_prepared_statements.py --iterations 500 --query validate_auth_token
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Proje kökünü import yoluna ekle (script doğrudan çalıştırıldığında)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.config.config import PREPARED_STATEMENTS_CONFIG  # noqa: E402
+from app.database.db_connection import DatabaseConnection  # noqa: E402
+from app.database.repositories.auth_token_repository import SQL_VALIDATE_AUTH_TOKEN  # noqa: E402
+from app.database.repositories.spotify_account_repository import SQL_SPOTIFY_USER_DATA  # noqa: E402
+from app.database.repositories.widget_repository import SQL_WIDGET_ENTRY_BY_TOKEN  # noqa: E402
+
+
+def _samples(db: DatabaseConnection) -> Dict[str, Any]:
+    """Sorgu parametreleri için tablolardan gerçek birer değer okur."""
+    samples: Dict[str, Any] = {"widget_token": "__bench__", "auth_token": "__bench__", "username": "__bench__"}
+    db.cursor.execute("SELECT widget_token FROM widgets LIMIT 1")
+    row = db.cursor.fetchone()
+    if row:
+        samples["widget_token"] = row["widget_token"]
+    db.cursor.execute("SELECT token FROM auth_tokens LIMIT 1")
+    row = db.cursor.fetchone()
+    if row:
+        samples["auth_token"] = row["token"]
+    db.cursor.execute("SELECT u.username FROM spotify_accounts sa JOIN users u ON u.id = sa.user_id LIMIT 1")
+    row = db.cursor.fetchone()
+    if row:
+        samples["username"] = row["username"]
+    return samples
+
+
+def _queries(samples: Dict[str, Any]) -> Dict[str, Tuple[str, Sequence[Any], bool]]:
+    """ad -> (sorgu, parametreler, dictionary)"""
+    return {
+        "get_widget_entry_by_token": (SQL_WIDGET_ENTRY_BY_TOKEN, (samples["widget_token"],), False),
+        "validate_auth_token": (SQL_VALIDATE_AUTH_TOKEN, (samples["auth_token"],), False),
+        "get_spotify_user_data": (SQL_SPOTIFY_USER_DATA, (samples["username"],), True),
+    }
+
+
+def _run(db: DatabaseConnection, sql: str, params: Sequence[Any], dictionary: bool, iterations: int) -> Dict[str, Any]:
+    # Isınma: prepared modda PREPARE burada yapılır, ölçüme girmez
+    db.fetch_prepared(sql, params, dictionary)
+
+    latencies: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        db.fetch_prepared(sql, params, dictionary)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    return {
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 4),
+        "avg_ms": round(statistics.fmean(latencies), 4),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Sık sorgular: metin protokolü vs prepared statement gecikmesi")
+    parser.add_argument("--iterations", type=int, default=1000, help="Mod ve sorgu başına çalıştırma sayısı")
+    parser.add_argument("--query", default=None, help="Yalnızca bu sorguyu ölç (varsayılan: hepsi)")
+    args = parser.parse_args()
+
+    db = DatabaseConnection(use_pool=False)
+    db.ensure_connection()
+    enabled = PREPARED_STATEMENTS_CONFIG["enabled"]
+    try:
+        queries = _queries(_samples(db))
+        if args.query:
+            queries = {args.query: queries[args.query]}
+
+        results: Dict[str, Any] = {}
+        for name, (sql, params, dictionary) in queries.items():
+            results[name] = {}
+            for mode, prepared in (("text", False), ("prepared", True)):
+                PREPARED_STATEMENTS_CONFIG["enabled"] = prepared
+                results[name][mode] = _run(db, sql, params, dictionary, max(1, args.iterations))
+    finally:
+        PREPARED_STATEMENTS_CONFIG["enabled"] = enabled
+        db.close()
+
+    print(json.dumps({"iterations": args.iterations, **results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
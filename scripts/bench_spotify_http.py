@@ -0,0 +1,77 @@
+"""
+Spotify HTTP İstemci Karşılaştırma Aracı (pooled vs unpooled)
+
+Amaç:
+- `SpotifyHttpClient`'ın keep-alive bağlantı havuzlu (pooled) ve her istekte
+  yeni bağlantı açan (unpooled) modlarının gecikmesini karşılaştırmak.
+- Her mod için aynı sayıda isteği aynı eşzamanlılıkla gönderir ve gecikme
+  histogramı özetini (p50 / p95 / p99 / ortalama) yazdırır.
+
+Notlar:
+- Token gerekmez; varsayılan hedef `https://api.spotify.com/v1/me` 401 döner,
+  ölçülen şey bağlantı + istek süresidir.
+- Spotify'ı gereksiz yere yormamak için istek sayısını düşük tutun.
+- `app` paketi import edildiği için proje kökündeki .env dosyası gereklidir.
+
+Çalıştırma:
+  python scripts/bench_spotify_http.py --requests 50 --concurrency 4
+  python scripts/bench_spotify_http.py --url http://127.0.0.1:5000/ --requests 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+# Proje kökünü import yoluna ekle (script doğrudan çalıştırıldığında)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import requests  # noqa: E402
+
+from app.services.spotify.http_client import SpotifyHttpClient  # noqa: E402
+
+
+def _run(client: SpotifyHttpClient, url: str, total: int, concurrency: int) -> Dict[str, Any]:
+    def one(_: int) -> None:
+        try:
+            client.get(url, allow_redirects=False).close()
+        except requests.exceptions.RequestException:
+            pass
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(one, range(total)))
+    wall_s = time.perf_counter() - started
+
+    summary = client.stats()["latency"][client.mode]
+    summary.pop("buckets", None)
+    summary["errors"] = client.errors
+    summary["wall_s"] = round(wall_s, 3)
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Spotify HTTP istemcisi pooled/unpooled gecikme karşılaştırması")
+    parser.add_argument("--url", default="https://api.spotify.com/v1/me", help="Hedef URL")
+    parser.add_argument("--requests", type=int, default=50, help="Mod başına istek sayısı")
+    parser.add_argument("--concurrency", type=int, default=4, help="Eşzamanlı istek sayısı")
+    parser.add_argument("--timeout", type=float, default=10.0, help="İstek timeout'u (saniye)")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {}
+    for pooled in (False, True):
+        client = SpotifyHttpClient(pooled=pooled, pool_maxsize=max(args.concurrency, 1), timeout=args.timeout)
+        results[client.mode] = _run(client, args.url, args.requests, args.concurrency)
+        client.close()
+
+    print(json.dumps({"url": args.url, "requests": args.requests, "concurrency": args.concurrency, **results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+"""
+Widget Listesi Satır Karşılaştırma Aracı (SELECT * dict vs projeksiyon + __slots__)
+
+Amaç:
+- Widget listesi sorgusunun eski hali (`SELECT w.*` + satır başına dict) ile
+  yeni hali (yalnızca gereken kolonlar + tuple cursor + `WidgetSummary`)
+  arasındaki bellek ve süre farkını ölçmek.
+- Sentetik modda MySQL gerekmez: sürücünün döndüreceği satırlar bellekte
+  üretilir, satır nesnelerinin oluşturulması ve JSON yanıtının hazırlanması
+  ölçülür (tracemalloc tepe belleği + süre).
+- `--username` verilirse aynı karşılaştırma canlı veritabanında, o
+  kullanıcının widget'ları üzerinde yapılır.
+
+Notlar:
+- Sentetik satırlardaki `config_data` boyutu `--config-kb` ile ayarlanır;
+  gerçek widget config'leri birkaç KB'lık JSON'dur.
+- Canlı mod için proje kökündeki .env dosyası (DB ayarları) gereklidir.
+
+Çalıştırma:
+  python scripts/bench_widget_rows.py --rows 200 --repeat 50
+  python scripts/bench_widget_rows.py --username demo --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+# Proje kökünü import yoluna ekle (script doğrudan çalıştırıldığında)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.database.widget_rows import WidgetSummary  # noqa: E402
+
+# `widgets` tablosunun tüm kolonları + join'den gelen kullanıcı adı (eski `SELECT w.*` satırı)
+FULL_COLUMNS: Tuple[str, ...] = (
+    "id", "user_id", "widget_token", "widget_name", "widget_type", "config_data",
+    "spotify_user_id", "platform", "created_at", "updated_at", "beatify_username",
+)
+
+
+def _synthetic_rows(count: int, config_kb: int) -> Tuple[List[Dict[str, Any]], List[Tuple[Any, ...]]]:
+    """Sürücünün dict ve tuple cursor'da döndüreceği satırları üretir."""
+    config = json.dumps({"theme": "modern", "elements": {"pad": "x" * max(config_kb * 1024 - 40, 0)}})
+    now = dt.datetime(2026, 1, 1, 12, 0, 0)
+    full: List[Dict[str, Any]] = []
+    projected: List[Tuple[Any, ...]] = []
+    for i in range(count):
+        values = {
+            "id": i + 1,
+            "user_id": 1,
+            "widget_token": f"tok{i:09d}",
+            "widget_name": f"Widget {i}",
+            "widget_type": "modern",
+            "config_data": config,
+            "spotify_user_id": "spotify-user",
+            "platform": "spotify",
+            "created_at": now,
+            "updated_at": now,
+            "beatify_username": "bench",
+        }
+        full.append({name: values[name] for name in FULL_COLUMNS})
+        projected.append(tuple(values[name] for name in WidgetSummary.__slots__))
+    return full, projected
+
+
+def _measure(build: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """`build()`'i `repeat` kez çalıştırır; ortalama süre ve tek çalıştırmanın tepe belleği."""
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        build()
+    elapsed = time.perf_counter() - started
+    return {"avg_ms": round(elapsed / repeat * 1000, 3), "peak_kb": round(peak / 1024, 1)}
+
+
+def _synthetic(rows: int, config_kb: int, repeat: int) -> Dict[str, Any]:
+    full_rows, tuple_rows = _synthetic_rows(rows, config_kb)
+
+    def old() -> str:
+        # Sürücü her satır için yeni bir dict üretir; yanıt tüm kolonları taşır
+        widgets = [dict(row) for row in full_rows]
+        return json.dumps(widgets, default=str)
+
+    def new() -> str:
+        widgets = [WidgetSummary.from_row(row) for row in tuple_rows]
+        return json.dumps([w.to_dict() for w in widgets], default=str)
+
+    return {"select_star_dict": _measure(old, repeat), "projected_slots": _measure(new, repeat)}
+
+
+def _live(username: str, repeat: int) -> Dict[str, Any]:
+    from app.database.db_connection import DatabaseConnection
+    from app.database.repositories.widget_repository import SpotifyWidgetRepository
+
+    db = DatabaseConnection()
+    db.ensure_connection()
+    repo = SpotifyWidgetRepository(db)
+    old_sql = """
+        SELECT w.*, u.username AS beatify_username
+        FROM widgets w JOIN users u ON u.id = w.user_id
+        WHERE u.username = %s AND w.platform = 'spotify'
+        ORDER BY w.created_at DESC
+    """
+
+    def old() -> str:
+        db.ensure_connection()
+        db.cursor.execute(old_sql, (username,))
+        return json.dumps(db.cursor.fetchall() or [], default=str)
+
+    def new() -> str:
+        widgets = repo.get_widgets_by_username(username) or []
+        return json.dumps([w.to_dict() for w in widgets], default=str)
+
+    try:
+        result = {"rows": len(repo.get_widgets_by_username(username) or [])}
+        result.update(select_star_dict=_measure(old, repeat), projected_slots=_measure(new, repeat))
+        return result
+    finally:
+        db.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Widget listesi: SELECT * dict satırlar vs projeksiyon + __slots__")
+    parser.add_argument("--rows", type=int, default=200, help="Sentetik satır sayısı")
+    parser.add_argument("--config-kb", type=int, default=4, help="Sentetik config_data boyutu (KB)")
+    parser.add_argument("--repeat", type=int, default=50, help="Ölçüm tekrarı")
+    parser.add_argument("--username", default=None, help="Verilirse canlı DB'de bu kullanıcının widget'ları ölçülür")
+    args = parser.parse_args()
+
+    if args.username:
+        results = {"mode": "live", "username": args.username, **_live(args.username, args.repeat)}
+    else:
+        results = {
+            "mode": "synthetic",
+            "rows": args.rows,
+            "config_kb": args.config_kb,
+            **_synthetic(args.rows, args.config_kb, args.repeat),
+        }
+    print(json.dumps({"repeat": args.repeat, **results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())